@@ -0,0 +1,96 @@
+import csv
+from collections import defaultdict
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from battles.models import ArchivedBattle, BattleTurn, PlayerBattle
+
+TURN_FIELDS = ["turn_number", "player_id", "action", "damage", "is_critical", "is_super_effective", "message"]
+BATTLE_FIELDS = ["battle_id", "status", "opponent_id", "opponent_username", "result", "created_at", "completed_at"]
+
+
+class _Echo:
+    """File-like object whose `write` returns the value, so csv.writer can feed a generator."""
+
+    def write(self, value):
+        return value
+
+
+class BattleHistoryExporter:
+    """
+    Stream a player's complete battle history, including turns, in constant memory.
+
+    Battles are read from the per-player index with a server-side cursor. Turns are
+    loaded once per chunk: from `battle_turns` for live battles and from the compressed
+    snapshot for archived ones. Only one chunk of battles and turns is held at a time.
+    """
+
+    FORMAT_NDJSON = "ndjson"
+    FORMAT_CSV = "csv"
+    FORMATS = {
+        FORMAT_NDJSON: "application/x-ndjson",
+        FORMAT_CSV: "text/csv",
+    }
+
+    def __init__(self, player, chunk_size: int = 1000):
+        self.player = player
+        self.chunk_size = chunk_size
+
+    def battles(self):
+        """Yield one dict per battle, oldest first, with its turns under `turns`."""
+        rows = (
+            PlayerBattle.objects.filter(player=self.player)
+            .select_related("opponent")
+            .order_by("battle_id")
+            .iterator(chunk_size=self.chunk_size)
+        )
+        while chunk := list(islice(rows, self.chunk_size)):
+            turns = self._load_turns([row.battle_id for row in chunk])
+            for row in chunk:
+                yield {
+                    "battle_id": row.battle_id,
+                    "status": row.status,
+                    "opponent_id": row.opponent_id,
+                    "opponent_username": row.opponent.username,
+                    "result": row.result,
+                    "created_at": row.created_at,
+                    "completed_at": row.completed_at,
+                    "turns": turns.get(row.battle_id, []),
+                }
+
+    def ndjson(self):
+        encoder = DjangoJSONEncoder(separators=(",", ":"))
+        for battle in self.battles():
+            yield encoder.encode(battle) + "\n"
+
+    def csv(self):
+        """Yield one CSV row per turn; battles without turns get a single row with empty turn columns."""
+        writer = csv.writer(_Echo())
+        yield writer.writerow(BATTLE_FIELDS + TURN_FIELDS)
+        for battle in self.battles():
+            battle_columns = [battle[field] for field in BATTLE_FIELDS]
+            for turn in battle["turns"] or [{}]:
+                yield writer.writerow(battle_columns + [turn.get(field) for field in TURN_FIELDS])
+
+    def stream(self, export_format: str):
+        if export_format == self.FORMAT_CSV:
+            return self.csv()
+        return self.ndjson()
+
+    def _load_turns(self, battle_ids) -> dict:
+        turns = defaultdict(list)
+        for turn in (
+            BattleTurn.objects.filter(battle_id__in=battle_ids)
+            .order_by("battle_id", "turn_number", "id")
+            .values("battle_id", *TURN_FIELDS)
+        ):
+            turns[turn.pop("battle_id")].append(turn)
+
+        missing = [battle_id for battle_id in battle_ids if battle_id not in turns]
+        if missing:
+            for archived in ArchivedBattle.objects.filter(id__in=missing).only("id", "payload"):
+                turns[archived.id] = [
+                    {field: turn[field] for field in TURN_FIELDS} for turn in archived.state.get("turns", [])
+                ]
+        return turns
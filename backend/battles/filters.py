@@ -0,0 +1,15 @@
+import django_filters
+
+from battles.models import Battle, PlayerBattle
+
+
+class BattleFilter(django_filters.FilterSet):
+    """Battle list filters, applied to the user's PlayerBattle index rows."""
+
+    status = django_filters.ChoiceFilter(choices=Battle.STATUS_CHOICES)
+    created_after = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+    created_before = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
+
+    class Meta:
+        model = PlayerBattle
+        fields = ["status", "created_after", "created_before"]
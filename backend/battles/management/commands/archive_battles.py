@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from battles.models import ArchivedBattle
+
+
+class Command(BaseCommand):
+    """
+    Move completed battles and their turns out of the hot `battles`/`battle_turns` tables.
+
+    Battles completed or cancelled more than `--days` days ago are stored in the
+    `battles_archive` table as compressed snapshots. Work is split into batches of
+    `--batch-size` battles, each in its own transaction.
+
+    Usage:
+        python manage.py archive_battles
+        python manage.py archive_battles --days 7 --batch-size 1000
+    """
+
+    help = "Archive battles completed more than N days ago"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.BATTLE_ARCHIVE_AFTER_DAYS,
+            help=f"Archive battles completed more than this many days ago (default: {settings.BATTLE_ARCHIVE_AFTER_DAYS})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of battles moved per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        completed_before = timezone.now() - timedelta(days=options["days"])
+        self.stdout.write(f"Archiving battles completed before {completed_before.isoformat()}...")
+
+        total = 0
+        while archived := ArchivedBattle.objects.archive_batch(completed_before, options["batch_size"]):
+            total += archived
+            self.stdout.write(f"Archived {archived} battles ({total} so far)")
+
+        self.stdout.write(self.style.SUCCESS(f"Battle archiving completed: {total} battles archived"))
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from battles.models import Battle
+
+
+class Command(BaseCommand):
+    """
+    Cancel active battles that have been idle for longer than a timeout.
+
+    A battle is idle when its state (turns, items) has not changed for `--idle-minutes`.
+    Idle battles are cancelled with chunked bulk UPDATEs of at most `--batch-size` rows.
+
+    Usage:
+        python manage.py cancel_stale_battles
+        python manage.py cancel_stale_battles --idle-minutes 15
+    """
+
+    help = "Cancel active battles idle for longer than a timeout"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--idle-minutes",
+            type=int,
+            default=settings.BATTLE_IDLE_TIMEOUT_MINUTES,
+            help=f"Cancel battles idle for more than this many minutes (default: {settings.BATTLE_IDLE_TIMEOUT_MINUTES})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of battles cancelled per UPDATE (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        idle_before = timezone.now() - timedelta(minutes=options["idle_minutes"])
+
+        total = 0
+        while cancelled := Battle.objects.cancel_idle_batch(idle_before, options["batch_size"]):
+            total += cancelled
+
+        self.stdout.write(self.style.SUCCESS(f"Stale battle sweep completed: {total} battles cancelled"))
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from battles.exporters import BattleHistoryExporter
+from players.models import Player
+
+
+class Command(BaseCommand):
+    """
+    Export a player's complete battle history, including turns, as NDJSON or CSV.
+
+    Battles are streamed with a server-side cursor in chunks of `--chunk-size`, so memory
+    use does not grow with the size of the history. Output goes to stdout unless
+    `--output` is given.
+
+    Usage:
+        python manage.py export_battle_history ash
+        python manage.py export_battle_history ash --format csv --output ash.csv
+    """
+
+    help = "Stream a player's battle history as NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Username of the player to export")
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=list(BattleHistoryExporter.FORMATS),
+            default=BattleHistoryExporter.FORMAT_NDJSON,
+            help="Output format (default: ndjson)",
+        )
+        parser.add_argument("--output", help="Write to this file instead of stdout")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of battles fetched per database round trip (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            player = Player.objects.get(username=options["username"])
+        except Player.DoesNotExist as e:
+            raise CommandError(f"Player '{options['username']}' does not exist") from e
+
+        exporter = BattleHistoryExporter(player, chunk_size=options["chunk_size"])
+        chunks = exporter.stream(options["export_format"])
+
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", newline="", encoding="utf-8") as output:
+            output.writelines(chunks)
+        self.stdout.write(self.style.SUCCESS(f"Battle history of {player.username} exported to {options['output']}"))
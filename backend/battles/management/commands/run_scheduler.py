@@ -0,0 +1,59 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Run the periodic maintenance commands listed in `settings.SCHEDULED_COMMANDS`.
+
+    Each entry is a dict with the command `name`, its `interval` in seconds and optional
+    `options` passed to `call_command`. A failing job is logged and retried on its next run.
+
+    Usage:
+        python manage.py run_scheduler
+        python manage.py run_scheduler --once
+    """
+
+    help = "Run periodic maintenance commands"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run every scheduled command once and exit",
+        )
+
+    def handle(self, *args, **options):
+        jobs = settings.SCHEDULED_COMMANDS
+        if options["once"]:
+            for job in jobs:
+                self._run(job)
+            return
+
+        self.stdout.write(f"Scheduler started with {len(jobs)} jobs")
+        next_runs = {job["name"]: time.monotonic() for job in jobs}
+        while True:
+            for job in jobs:
+                if time.monotonic() >= next_runs[job["name"]]:
+                    self._run(job)
+                    next_runs[job["name"]] = time.monotonic() + job["interval"]
+            time.sleep(max(0.0, min(next_runs.values()) - time.monotonic()))
+
+    def _run(self, job):
+        close_old_connections()
+        started = time.monotonic()
+        try:
+            call_command(job["name"], **job.get("options", {}))
+        except Exception:
+            logger.exception("Scheduled command %s failed", job["name"])
+            return
+        finally:
+            close_old_connections()
+        logger.info("Scheduled command %s finished in %.2fs", job["name"], time.monotonic() - started)
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 
 class BattleManager(models.Manager):
@@ -10,5 +11,156 @@ class BattleManager(models.Manager):
             status=Battle.STATUS_ACTIVE,
         )
 
+    def has_active_battle(self, player) -> bool:
+        """
+        Check for an active battle with one EXISTS probe per side.
+
+        Each probe is answered from a partial index over active battles, which an OR
+        across both player columns would not allow.
+        """
+        from battles.models import Battle
+
+        return (
+            self.filter(player1=player, status=Battle.STATUS_ACTIVE).exists()
+            or self.filter(player2=player, status=Battle.STATUS_ACTIVE).exists()
+        )
+
     def for_player(self, player):
         return self.filter(models.Q(player1=player) | models.Q(player2=player))
+
+    def cancel_idle_batch(self, idle_before, batch_size: int = 1000) -> int:
+        """
+        Cancel one chunk of active battles whose state has not changed since `idle_before`.
+
+        The chunk is cancelled by a single set-based UPDATE. The idle condition is repeated
+        in the UPDATE so a battle that receives a turn concurrently is left untouched. The
+        matching per-player index rows are updated in the same transaction.
+
+        Returns:
+            Number of battles cancelled (0 when no idle battles are left)
+        """
+        from battles.models import Battle, PlayerBattle
+
+        idle = self.filter(status=Battle.STATUS_ACTIVE, updated_at__lt=idle_before)
+        with transaction.atomic():
+            battle_ids = list(idle.order_by("updated_at").values_list("id", flat=True)[:batch_size])
+            if not battle_ids:
+                return 0
+
+            now = timezone.now()
+            cancelled = idle.filter(id__in=battle_ids).update(
+                status=Battle.STATUS_CANCELLED, completed_at=now, updated_at=now
+            )
+            PlayerBattle.objects.filter(
+                battle_id__in=self.filter(id__in=battle_ids, status=Battle.STATUS_CANCELLED).values("id")
+            ).update(status=Battle.STATUS_CANCELLED, completed_at=now)
+
+        return cancelled
+
+
+class PlayerBattleManager(models.Manager):
+    def index_battle(self, battle):
+        """Create the two per-participant index rows for a new battle."""
+        return self.bulk_create(
+            [
+                self.model(
+                    player_id=player_id,
+                    battle_id=battle.id,
+                    opponent_id=opponent_id,
+                    status=battle.status,
+                    result=self._result_for(battle, player_id),
+                    created_at=battle.created_at,
+                    completed_at=battle.completed_at,
+                )
+                for player_id, opponent_id in (
+                    (battle.player1_id, battle.player2_id),
+                    (battle.player2_id, battle.player1_id),
+                )
+            ]
+        )
+
+    def sync_battle(self, battle):
+        """Copy the status and outcome of a finished battle onto its index rows."""
+        result = ""
+        if battle.winner_id is not None:
+            result = models.Case(
+                models.When(player_id=battle.winner_id, then=models.Value(self.model.RESULT_WIN)),
+                default=models.Value(self.model.RESULT_LOSS),
+            )
+        self.filter(battle_id=battle.id).update(status=battle.status, result=result, completed_at=battle.completed_at)
+
+    def _result_for(self, battle, player_id):
+        if battle.winner_id is None:
+            return ""
+        if battle.winner_id == player_id:
+            return self.model.RESULT_WIN
+        return self.model.RESULT_LOSS
+
+
+class ArchivedBattleManager(models.Manager):
+    def for_player(self, player):
+        return self.filter(models.Q(player1=player) | models.Q(player2=player))
+
+    def archive_batch(self, completed_before, batch_size: int = 500) -> int:
+        """
+        Move one batch of battles finished before `completed_before` into the archive.
+
+        Each batch runs in its own transaction so the number of locked and deleted rows
+        is bounded by `batch_size`. Rows locked by another transaction are skipped and
+        picked up by a later batch.
+
+        Args:
+            completed_before: Only battles completed or cancelled before this datetime are archived
+            batch_size: Maximum number of battles moved in this transaction
+
+        Returns:
+            Number of battles archived (0 when nothing is left to archive)
+        """
+        from battles.models import Battle, BattleTurn
+        from battles.serializers import BattleStateSerializer
+
+        with transaction.atomic():
+            battle_ids = list(
+                Battle.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status__in=[Battle.STATUS_COMPLETED, Battle.STATUS_CANCELLED],
+                    completed_at__lt=completed_before,
+                )
+                .order_by("completed_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not battle_ids:
+                return 0
+
+            battles = (
+                Battle.objects.filter(id__in=battle_ids)
+                .select_related(
+                    "player1",
+                    "player2",
+                    "winner",
+                    "current_turn_player",
+                )
+                .prefetch_related("turns")
+            )
+
+            archived = []
+            for battle in battles:
+                state = BattleStateSerializer(battle, context={"player": battle.player1}).data
+                archived.append(
+                    self.model(
+                        id=battle.id,
+                        player1_id=battle.player1_id,
+                        player2_id=battle.player2_id,
+                        winner_id=battle.winner_id,
+                        status=battle.status,
+                        created_at=battle.created_at,
+                        completed_at=battle.completed_at,
+                        payload=self.model.compress_state(state),
+                    )
+                )
+
+            self.bulk_create(archived)
+            BattleTurn.objects.filter(battle_id__in=battle_ids).delete()
+            Battle.objects.filter(id__in=battle_ids).delete()
+
+        return len(archived)
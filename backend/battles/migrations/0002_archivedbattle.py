@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("battles", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedBattle",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        editable=False,
+                        help_text="UUIDv7 of the original battle (time-sortable)",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("active", "Active"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        help_text="Final battle status",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(help_text="When the battle was created")),
+                (
+                    "completed_at",
+                    models.DateTimeField(blank=True, help_text="When the battle was completed", null=True),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, help_text="When the battle was moved to the archive"),
+                ),
+                (
+                    "payload",
+                    models.BinaryField(
+                        help_text="zlib-compressed JSON snapshot of the battle state including its turns"
+                    ),
+                ),
+                (
+                    "player1",
+                    models.ForeignKey(
+                        help_text="First player in the battle",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_battles_as_player1",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "player2",
+                    models.ForeignKey(
+                        help_text="Second player in the battle",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_battles_as_player2",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "winner",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Winner of the battle (null if there was none)",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="archived_won_battles",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Battle",
+                "verbose_name_plural": "Archived Battles",
+                "db_table": "battles_archive",
+                "ordering": ["-id"],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    Battle = apps.get_model("battles", "Battle")
+    Battle.objects.update(updated_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("battles", "0002_archivedbattle"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="battle",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now, help_text="When the battle state last changed"
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="battle",
+            index=models.Index(
+                condition=models.Q(("status", "active")), fields=["updated_at"], name="battle_active_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="battle",
+            index=models.Index(
+                condition=models.Q(("status", "active")), fields=["player1"], name="battle_player1_active_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="battle",
+            index=models.Index(
+                condition=models.Q(("status", "active")), fields=["player2"], name="battle_player2_active_idx"
+            ),
+        ),
+    ]
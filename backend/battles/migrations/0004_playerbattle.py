@@ -0,0 +1,120 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from uuid_extensions import uuid7
+
+
+def backfill_player_battles(apps, schema_editor):
+    PlayerBattle = apps.get_model("battles", "PlayerBattle")
+
+    def result_for(battle, player_id):
+        if battle.winner_id is None:
+            return ""
+        return "win" if battle.winner_id == player_id else "loss"
+
+    for model_name in ("Battle", "ArchivedBattle"):
+        model = apps.get_model("battles", model_name)
+        rows = []
+        for battle in model.objects.order_by().iterator(chunk_size=2000):
+            for player_id, opponent_id in (
+                (battle.player1_id, battle.player2_id),
+                (battle.player2_id, battle.player1_id),
+            ):
+                rows.append(
+                    PlayerBattle(
+                        player_id=player_id,
+                        battle_id=battle.id,
+                        opponent_id=opponent_id,
+                        status=battle.status,
+                        result=result_for(battle, player_id),
+                        created_at=battle.created_at,
+                        completed_at=battle.completed_at,
+                    )
+                )
+            if len(rows) >= 2000:
+                PlayerBattle.objects.bulk_create(rows)
+                rows = []
+        PlayerBattle.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("battles", "0003_battle_updated_at_active_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerBattle",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid7,
+                        editable=False,
+                        help_text="UUIDv7 primary key (time-sortable)",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("battle_id", models.UUIDField(help_text="The indexed battle (live or archived)")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("active", "Active"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        help_text="Battle status",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "result",
+                    models.CharField(
+                        blank=True,
+                        choices=[("win", "Win"), ("loss", "Loss")],
+                        default="",
+                        help_text="Outcome for this player (empty until the battle has a winner)",
+                        max_length=10,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(help_text="When the battle was created")),
+                (
+                    "completed_at",
+                    models.DateTimeField(blank=True, help_text="When the battle was completed", null=True),
+                ),
+                (
+                    "opponent",
+                    models.ForeignKey(
+                        help_text="The other participant of the battle",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        help_text="The participant this row belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="battle_index",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Player Battle",
+                "verbose_name_plural": "Player Battles",
+                "db_table": "player_battles",
+                "ordering": ["-battle_id"],
+                "indexes": [models.Index(fields=["battle_id"], name="player_battle_battle_idx")],
+                "constraints": [models.UniqueConstraint(fields=("player", "battle_id"), name="unique_player_battle")],
+            },
+        ),
+        migrations.RunPython(backfill_player_battles, migrations.RunPython.noop),
+    ]
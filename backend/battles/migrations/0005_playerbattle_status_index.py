@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("battles", "0004_playerbattle"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="playerbattle",
+            index=models.Index(fields=["player", "status", "battle_id"], name="player_battle_status_idx"),
+        ),
+    ]
@@ -1,8 +1,12 @@
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 from uuid_extensions import uuid7
 
-from battles.managers import BattleManager
+from battles.managers import ArchivedBattleManager, BattleManager, PlayerBattleManager
 
 
 class Battle(models.Model):
@@ -74,6 +78,7 @@ class Battle(models.Model):
     player2_attack_boost = models.PositiveIntegerField(default=0, help_text="Player 2's remaining attack boost turns")
     player2_defense_boost = models.PositiveIntegerField(default=0, help_text="Player 2's remaining defense boost turns")
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the battle was created")
+    updated_at = models.DateTimeField(auto_now=True, help_text="When the battle state last changed")
     completed_at = models.DateTimeField(null=True, blank=True, help_text="When the battle was completed")
 
     objects = BattleManager()
@@ -87,6 +92,10 @@ class Battle(models.Model):
             models.Index(fields=["player1", "status"], name="battle_player1_status_idx"),
             models.Index(fields=["player2", "status"], name="battle_player2_status_idx"),
             models.Index(fields=["status", "-created_at"], name="battle_status_created_idx"),
+            # Partial indexes over active battles only, used by the idle sweeper and the active-battle check
+            models.Index(fields=["updated_at"], condition=models.Q(status="active"), name="battle_active_updated_idx"),
+            models.Index(fields=["player1"], condition=models.Q(status="active"), name="battle_player1_active_idx"),
+            models.Index(fields=["player2"], condition=models.Q(status="active"), name="battle_player2_active_idx"),
         ]
 
     def __str__(self) -> str:
@@ -105,6 +114,11 @@ class Battle(models.Model):
             return self.player1_pokemon
         return self.player2_pokemon
 
+    def get_player_pokemon_id(self, player):
+        if player == self.player1:
+            return self.player1_pokemon_id
+        return self.player2_pokemon_id
+
     def get_current_hp(self, player):
         if player == self.player1:
             return self.player1_current_hp
@@ -120,7 +134,7 @@ class Battle(models.Model):
         self.status = self.STATUS_COMPLETED
         self.winner = winner
         self.completed_at = timezone.now()
-        self.save(update_fields=["status", "winner", "completed_at"])
+        self.save(update_fields=["status", "winner", "completed_at", "updated_at"])
 
 
 class BattleTurn(models.Model):
@@ -165,3 +179,121 @@ class BattleTurn(models.Model):
 
     def __str__(self) -> str:
         return f"Turn {self.turn_number} - {self.player.username} - {self.action}"
+
+
+class PlayerBattle(models.Model):
+    RESULT_WIN = "win"
+    RESULT_LOSS = "loss"
+
+    RESULT_CHOICES = [
+        (RESULT_WIN, "Win"),
+        (RESULT_LOSS, "Loss"),
+    ]
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid7, editable=False, help_text="UUIDv7 primary key (time-sortable)"
+    )
+    player = models.ForeignKey(
+        "players.Player",
+        on_delete=models.CASCADE,
+        related_name="battle_index",
+        help_text="The participant this row belongs to",
+    )
+    battle_id = models.UUIDField(help_text="The indexed battle (live or archived)")
+    opponent = models.ForeignKey(
+        "players.Player",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="The other participant of the battle",
+    )
+    status = models.CharField(max_length=20, choices=Battle.STATUS_CHOICES, help_text="Battle status")
+    result = models.CharField(
+        max_length=10,
+        choices=RESULT_CHOICES,
+        blank=True,
+        default="",
+        help_text="Outcome for this player (empty until the battle has a winner)",
+    )
+    created_at = models.DateTimeField(help_text="When the battle was created")
+    completed_at = models.DateTimeField(null=True, blank=True, help_text="When the battle was completed")
+
+    objects = PlayerBattleManager()
+
+    class Meta:
+        db_table = "player_battles"
+        verbose_name = "Player Battle"
+        verbose_name_plural = "Player Battles"
+        ordering = ["-battle_id"]
+        constraints = [
+            # Also serves as the (player, battle_id) index that history pages are range scans over
+            models.UniqueConstraint(fields=["player", "battle_id"], name="unique_player_battle"),
+        ]
+        indexes = [
+            models.Index(fields=["battle_id"], name="player_battle_battle_idx"),
+            # Battle list pages filtered by status
+            models.Index(fields=["player", "status", "battle_id"], name="player_battle_status_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.player_id} - battle {self.battle_id}"
+
+    @property
+    def winner_id(self):
+        if self.result == self.RESULT_WIN:
+            return self.player_id
+        if self.result == self.RESULT_LOSS:
+            return self.opponent_id
+        return None
+
+
+class ArchivedBattle(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False, help_text="UUIDv7 of the original battle (time-sortable)")
+    player1 = models.ForeignKey(
+        "players.Player",
+        on_delete=models.CASCADE,
+        related_name="archived_battles_as_player1",
+        help_text="First player in the battle",
+    )
+    player2 = models.ForeignKey(
+        "players.Player",
+        on_delete=models.CASCADE,
+        related_name="archived_battles_as_player2",
+        help_text="Second player in the battle",
+    )
+    winner = models.ForeignKey(
+        "players.Player",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="archived_won_battles",
+        help_text="Winner of the battle (null if there was none)",
+    )
+    status = models.CharField(max_length=20, choices=Battle.STATUS_CHOICES, help_text="Final battle status")
+    created_at = models.DateTimeField(help_text="When the battle was created")
+    completed_at = models.DateTimeField(null=True, blank=True, help_text="When the battle was completed")
+    archived_at = models.DateTimeField(auto_now_add=True, help_text="When the battle was moved to the archive")
+    payload = models.BinaryField(help_text="zlib-compressed JSON snapshot of the battle state including its turns")
+
+    objects = ArchivedBattleManager()
+
+    class Meta:
+        db_table = "battles_archive"
+        verbose_name = "Archived Battle"
+        verbose_name_plural = "Archived Battles"
+        ordering = ["-id"]
+
+    def __str__(self) -> str:
+        return f"Archived battle {self.id}"
+
+    def get_opponent(self, player):
+        if player == self.player1:
+            return self.player2
+        return self.player1
+
+    @staticmethod
+    def compress_state(state: dict) -> bytes:
+        return zlib.compress(json.dumps(state, cls=DjangoJSONEncoder, separators=(",", ":")).encode())
+
+    @property
+    def state(self) -> dict:
+        return json.loads(zlib.decompress(bytes(self.payload)))
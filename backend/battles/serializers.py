@@ -1,34 +1,27 @@
 from rest_framework import serializers
 
-from battles.models import Battle, BattleTurn
+from battles.models import Battle, BattleTurn, PlayerBattle
 from players.models import Player
+from pokemon.cache import get_player_pokemon
 from pokemon.models import PlayerPokemon
 from utils.exceptions.exceptions import FormError, ToastError
 from utils.game.battle_manager import BattleManager
 from utils.game.items import ItemType
 
 
-class BattlePokemonSerializer(serializers.ModelSerializer):
-    id = serializers.UUIDField(source="pokemon.id")
-    name = serializers.CharField(source="pokemon.name")
-    primary_type = serializers.CharField(source="pokemon.primary_type.name")
-    secondary_type = serializers.CharField(source="pokemon.secondary_type.name", allow_null=True)
-    current_hp = serializers.SerializerMethodField()
-    max_hp = serializers.IntegerField(source="pokemon.base_hp")
-    sprite_url = serializers.URLField(source="pokemon.sprite_url")
+class BattlePokemonSerializer(serializers.Serializer):
+    """A battling Pokemon, serialized from its cached `PokemonRecord`."""
 
-    class Meta:
-        model = PlayerPokemon
-        fields = ["id", "name", "primary_type", "secondary_type", "current_hp", "max_hp", "sprite_url"]
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+    primary_type = serializers.CharField(source="primary_type.name")
+    secondary_type = serializers.CharField(source="secondary_type.name", allow_null=True)
+    current_hp = serializers.SerializerMethodField()
+    max_hp = serializers.IntegerField(source="base_hp")
+    sprite_url = serializers.URLField()
 
     def get_current_hp(self, obj):
-        battle = self.context.get("battle")
-        if not battle:
-            return obj.pokemon.base_hp
-
-        if battle.player1_pokemon == obj:
-            return battle.player1_current_hp
-        return battle.player2_current_hp
+        return self.context.get("current_hp", obj.base_hp)
 
 
 class BattlePlayerSerializer(serializers.ModelSerializer):
@@ -46,15 +39,17 @@ class BattlePlayerSerializer(serializers.ModelSerializer):
             return None
 
         if battle.player1 == obj:
-            pokemon = battle.player1_pokemon
+            player_pokemon_id, current_hp = battle.player1_pokemon_id, battle.player1_current_hp
         else:
-            pokemon = battle.player2_pokemon
+            player_pokemon_id, current_hp = battle.player2_pokemon_id, battle.player2_current_hp
 
-        return BattlePokemonSerializer(pokemon, context=self.context).data
+        return BattlePokemonSerializer(
+            get_player_pokemon(player_pokemon_id), context={**self.context, "current_hp": current_hp}
+        ).data
 
 
 class BattleTurnSerializer(serializers.ModelSerializer):
-    player_id = serializers.UUIDField(source="player.id")
+    player_id = serializers.UUIDField()
     action = serializers.CharField()
     damage = serializers.IntegerField()
     is_critical = serializers.BooleanField()
@@ -101,7 +96,8 @@ class BattleStateSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def to_representation(self, instance):
-        user = self.context["request"].user
+        # Callers without a request (e.g. the archiver) pass the viewing player explicitly
+        user = self.context["player"] if "player" in self.context else self.context["request"].user
         manager = BattleManager(instance, user)
         battle = manager.get_battle_with_player_data()
 
@@ -110,6 +106,35 @@ class BattleStateSerializer(serializers.ModelSerializer):
         return super().to_representation(battle)
 
 
+class BattleParticipantSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Player
+        fields = ["id", "username"]
+        read_only_fields = fields
+
+
+class BattleSummarySerializer(serializers.ModelSerializer):
+    player1 = BattleParticipantSerializer(read_only=True)
+    player2 = BattleParticipantSerializer(read_only=True)
+    current_turn = serializers.UUIDField(source="current_turn_player_id")
+    winner_id = serializers.UUIDField(allow_null=True)
+
+    class Meta:
+        model = Battle
+        fields = [
+            "id",
+            "status",
+            "player1",
+            "player2",
+            "current_turn",
+            "turn_number",
+            "winner_id",
+            "created_at",
+            "completed_at",
+        ]
+        read_only_fields = fields
+
+
 class BattleCreateSerializer(serializers.Serializer):
     opponent_id = serializers.UUIDField(required=False, allow_null=True)
     pokemon_id = serializers.UUIDField(required=False, allow_null=True)
@@ -128,7 +153,7 @@ class BattleCreateSerializer(serializers.Serializer):
     def validate(self, attrs):
         user = self.context["request"].user
 
-        if Battle.objects.active_for_player(user).exists():
+        if Battle.objects.has_active_battle(user):
             raise ToastError(message="You already have an active battle.")
 
         if not user.active_pokemon:
@@ -196,20 +221,11 @@ class ItemUseSerializer(serializers.Serializer):
 
 
 class BattleHistorySerializer(serializers.ModelSerializer):
-    opponent = serializers.SerializerMethodField()
-    winner_id = serializers.UUIDField(source="winner.id", allow_null=True)
-    created_at = serializers.DateTimeField()
-    completed_at = serializers.DateTimeField(allow_null=True)
+    id = serializers.UUIDField(source="battle_id")
+    opponent = BattleParticipantSerializer(read_only=True)
+    winner_id = serializers.UUIDField(allow_null=True)
 
     class Meta:
-        model = Battle
+        model = PlayerBattle
         fields = ["id", "status", "opponent", "winner_id", "created_at", "completed_at"]
         read_only_fields = fields
-
-    def get_opponent(self, obj):
-        user = self.context["request"].user
-        opponent = obj.get_opponent(user)
-        return {
-            "id": opponent.id,
-            "username": opponent.username,
-        }
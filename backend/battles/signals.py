@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from battles.models import Battle, PlayerBattle
+
+
+@receiver(post_save, sender=Battle)
+def update_player_battle_index(sender, instance, created, **kwargs):
+    if created:
+        PlayerBattle.objects.index_battle(instance)
+    elif instance.status != Battle.STATUS_ACTIVE:
+        # Turn and item saves of an active battle don't change any indexed column
+        PlayerBattle.objects.sync_battle(instance)
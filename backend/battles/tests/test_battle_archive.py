@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from battles.models import ArchivedBattle, Battle, BattleTurn
+
+
+@pytest.mark.django_db
+class TestArchiveBattlesCommand:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, api_client, create_player, create_pokemon, create_pokemon_type, create_player_pokemon, create_battle
+    ):
+        self.client = api_client
+        self.player = create_player(username="player1", password="TestPass123!")
+        self.opponent = create_player(username="opponent", password="TestPass123!")
+        fire_type = create_pokemon_type(name="fire")
+        water_type = create_pokemon_type(name="water")
+        self.charmander = create_pokemon(name="Charmander", pokedex_number=6001, primary_type=fire_type, base_speed=65)
+        self.squirtle = create_pokemon(name="Squirtle", pokedex_number=6002, primary_type=water_type, base_speed=43)
+        self.player_pokemon = create_player_pokemon(player=self.player, pokemon=self.charmander)
+        self.opponent_pokemon = create_player_pokemon(player=self.opponent, pokemon=self.squirtle)
+        self.old_battle = self._create_battle(
+            create_battle, status=Battle.STATUS_COMPLETED, completed_at=timezone.now() - timedelta(days=60)
+        )
+        BattleTurn.objects.create(
+            battle=self.old_battle,
+            player=self.player,
+            turn_number=1,
+            action=BattleTurn.ACTION_ATTACK,
+            damage=12,
+            message="player1 attacks! Dealt 12 damage.",
+        )
+        self.recent_battle = self._create_battle(
+            create_battle, status=Battle.STATUS_COMPLETED, completed_at=timezone.now() - timedelta(days=1)
+        )
+        self.active_battle = self._create_battle(create_battle)
+
+    def _create_battle(self, create_battle, **kwargs):
+        return create_battle(
+            player1=self.player,
+            player2=self.opponent,
+            player1_pokemon=self.player_pokemon,
+            player2_pokemon=self.opponent_pokemon,
+            winner=self.player if kwargs.get("status") == Battle.STATUS_COMPLETED else None,
+            **kwargs,
+        )
+
+    def test_archive_battles_moves_only_old_completed_battles(self):
+        call_command("archive_battles", days=30)
+
+        assert not Battle.objects.filter(id=self.old_battle.id).exists()
+        assert not BattleTurn.objects.filter(battle_id=self.old_battle.id).exists()
+        assert set(Battle.objects.values_list("id", flat=True)) == {self.recent_battle.id, self.active_battle.id}
+        archived = ArchivedBattle.objects.get(id=self.old_battle.id)
+        assert archived.winner == self.player
+        assert archived.state["turns"][0]["damage"] == 12
+
+    def test_archive_battles_processes_in_batches(self, create_battle):
+        for _ in range(3):
+            self._create_battle(
+                create_battle, status=Battle.STATUS_COMPLETED, completed_at=timezone.now() - timedelta(days=45)
+            )
+
+        cutoff = timezone.now() - timedelta(days=30)
+
+        assert ArchivedBattle.objects.archive_batch(cutoff, batch_size=2) == 2
+        assert ArchivedBattle.objects.archive_batch(cutoff, batch_size=2) == 2
+        assert ArchivedBattle.objects.archive_batch(cutoff, batch_size=2) == 0
+
+    def test_battle_history_includes_archived_battles(self):
+        call_command("archive_battles", days=30)
+        self.client.force_authenticate(user=self.player)
+
+        response = self.client.get(reverse("battles:battle-history-list"))
+        json_response = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [battle["id"] for battle in json_response["results"]] == [
+            str(self.active_battle.id),
+            str(self.recent_battle.id),
+            str(self.old_battle.id),
+        ]
+        assert json_response["results"][2]["opponent"]["username"] == "opponent"
+
+    def test_retrieve_archived_battle_returns_200(self):
+        call_command("archive_battles", days=30)
+        self.client.force_authenticate(user=self.opponent)
+
+        response = self.client.get(reverse("battles:battle-detail", kwargs={"pk": self.old_battle.id}))
+        json_response = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json_response["id"] == str(self.old_battle.id)
+        assert json_response["status"] == Battle.STATUS_COMPLETED
+        assert json_response["winner_id"] == str(self.player.id)
+        assert len(json_response["turns"]) == 1
+
+    def test_retrieve_archived_battle_when_not_participant_returns_404(self, create_player):
+        call_command("archive_battles", days=30)
+        other_player = create_player(username="other", password="TestPass123!")
+        self.client.force_authenticate(user=other_player)
+
+        response = self.client.get(reverse("battles:battle-detail", kwargs={"pk": self.old_battle.id}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
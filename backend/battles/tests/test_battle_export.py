@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from battles.models import Battle, BattleTurn
+
+
+@pytest.mark.django_db
+class TestBattleHistoryExport:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, api_client, create_player, create_pokemon, create_pokemon_type, create_player_pokemon, create_battle
+    ):
+        self.client = api_client
+        self.url = reverse("battles:battle-history-export")
+        self.player = create_player(username="player1", password="TestPass123!")
+        self.opponent = create_player(username="opponent", password="TestPass123!")
+        fire_type = create_pokemon_type(name="fire")
+        water_type = create_pokemon_type(name="water")
+        self.charmander = create_pokemon(name="Charmander", pokedex_number=9001, primary_type=fire_type, base_speed=65)
+        self.squirtle = create_pokemon(name="Squirtle", pokedex_number=9002, primary_type=water_type, base_speed=43)
+        self.player_pokemon = create_player_pokemon(player=self.player, pokemon=self.charmander)
+        self.opponent_pokemon = create_player_pokemon(player=self.opponent, pokemon=self.squirtle)
+        self.archived_battle = self._create_battle(
+            create_battle,
+            status=Battle.STATUS_COMPLETED,
+            winner=self.player,
+            completed_at=timezone.now() - timedelta(days=60),
+        )
+        self._create_turn(self.archived_battle, turn_number=1, damage=12)
+        call_command("archive_battles", days=30)
+        self.live_battle = self._create_battle(create_battle)
+        self._create_turn(self.live_battle, turn_number=1, damage=7)
+        self._create_turn(self.live_battle, turn_number=2, damage=9)
+
+    def _create_battle(self, create_battle, **kwargs):
+        return create_battle(
+            player1=self.player,
+            player2=self.opponent,
+            player1_pokemon=self.player_pokemon,
+            player2_pokemon=self.opponent_pokemon,
+            **kwargs,
+        )
+
+    def _create_turn(self, battle, turn_number, damage):
+        BattleTurn.objects.create(
+            battle=battle,
+            player=self.player,
+            turn_number=turn_number,
+            action=BattleTurn.ACTION_ATTACK,
+            damage=damage,
+            message=f"player1 attacks! Dealt {damage} damage.",
+        )
+
+    def test_export_ndjson_streams_live_and_archived_battles_with_turns(self):
+        self.client.force_authenticate(user=self.player)
+
+        response = self.client.get(self.url)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        battles = [json.loads(line) for line in lines]
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [battle["battle_id"] for battle in battles] == [str(self.archived_battle.id), str(self.live_battle.id)]
+        assert battles[0]["result"] == "win"
+        assert [turn["damage"] for turn in battles[0]["turns"]] == [12]
+        assert [turn["damage"] for turn in battles[1]["turns"]] == [7, 9]
+        assert battles[1]["opponent_username"] == "opponent"
+
+    def test_export_csv_writes_one_row_per_turn(self):
+        self.client.force_authenticate(user=self.player)
+
+        response = self.client.get(self.url, {"export_format": "csv"})
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert [(row["battle_id"], row["turn_number"]) for row in rows] == [
+            (str(self.archived_battle.id), "1"),
+            (str(self.live_battle.id), "1"),
+            (str(self.live_battle.id), "2"),
+        ]
+
+    def test_export_with_unknown_format_returns_400(self):
+        self.client.force_authenticate(user=self.player)
+
+        response = self.client.get(self.url, {"export_format": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["field_name"] == "export_format"
+
+    def test_export_when_unauthenticated_returns_401(self):
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_export_battle_history_command_chunks_output(self):
+        stdout = io.StringIO()
+
+        call_command("export_battle_history", "player1", chunk_size=1, stdout=stdout)
+        battles = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        assert [battle["battle_id"] for battle in battles] == [str(self.archived_battle.id), str(self.live_battle.id)]
+        assert len(battles[1]["turns"]) == 2
@@ -2,7 +2,7 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 
-from battles.models import Battle
+from battles.models import Battle, PlayerBattle
 
 
 @pytest.mark.django_db
@@ -166,6 +166,48 @@ class TestBattleHistoryGET:
         assert len(json_response["results"]) == 1
         assert json_response["results"][0]["id"] == str(completed_battle.id)
 
+    def test_get_battle_history_reports_opponent_and_winner(self, create_battle):
+        battle = create_battle(
+            player1=self.player,
+            player2=self.opponent,
+            player1_pokemon=self.player_pokemon,
+            player2_pokemon=self.opponent_pokemon,
+        )
+        battle.complete(self.opponent)
+
+        self.client.force_authenticate(user=self.player)
+
+        response = self.client.get(self.url)
+        battle_data = response.json()["results"][0]
+
+        assert battle_data["status"] == Battle.STATUS_COMPLETED
+        assert battle_data["opponent"] == {"id": str(self.opponent.id), "username": "opponent"}
+        assert battle_data["winner_id"] == str(self.opponent.id)
+        assert PlayerBattle.objects.get(player=self.player, battle_id=battle.id).result == PlayerBattle.RESULT_LOSS
+        assert PlayerBattle.objects.get(player=self.opponent, battle_id=battle.id).result == PlayerBattle.RESULT_WIN
+
+    def test_get_battle_history_uses_keyset_pagination_without_count(self, create_battle, django_assert_num_queries):
+        battles = [
+            create_battle(
+                player1=self.player,
+                player2=self.opponent,
+                player1_pokemon=self.player_pokemon,
+                player2_pokemon=self.opponent_pokemon,
+                status=Battle.STATUS_COMPLETED,
+            )
+            for _ in range(3)
+        ]
+
+        self.client.force_authenticate(user=self.player)
+
+        with django_assert_num_queries(1):
+            first_page = self.client.get(self.url, {"page_size": 2}).json()
+        second_page = self.client.get(first_page["next"]).json()
+
+        assert "count" not in first_page
+        assert [item["id"] for item in first_page["results"]] == [str(battles[2].id), str(battles[1].id)]
+        assert [item["id"] for item in second_page["results"]] == [str(battles[0].id)]
+
 
 @pytest.mark.django_db
 class TestBattleDetailGET:
@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from battles.models import Battle, BattleTurn, PlayerBattle
+
+
+@pytest.mark.django_db
+class TestBattleListGET:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, api_client, create_player, create_pokemon, create_pokemon_type, create_player_pokemon, create_battle
+    ):
+        self.client = api_client
+        self.url = reverse("battles:battle-list")
+        self.player = create_player(username="player1", password="TestPass123!")
+        self.opponent = create_player(username="opponent", password="TestPass123!")
+        fire_type = create_pokemon_type(name="fire")
+        water_type = create_pokemon_type(name="water")
+        self.charmander = create_pokemon(name="Charmander", pokedex_number=8001, primary_type=fire_type, base_speed=65)
+        self.squirtle = create_pokemon(name="Squirtle", pokedex_number=8002, primary_type=water_type, base_speed=43)
+        self.player_pokemon = create_player_pokemon(player=self.player, pokemon=self.charmander)
+        self.opponent_pokemon = create_player_pokemon(player=self.opponent, pokemon=self.squirtle)
+        self.create_battle = create_battle
+
+    def _create_battle(self, **kwargs):
+        return self.create_battle(
+            player1=self.player,
+            player2=self.opponent,
+            player1_pokemon=self.player_pokemon,
+            player2_pokemon=self.opponent_pokemon,
+            **kwargs,
+        )
+
+    def test_list_battles_returns_summaries(self):
+        battle = self._create_battle()
+        BattleTurn.objects.create(
+            battle=battle, player=self.player, turn_number=1, action=BattleTurn.ACTION_DEFEND, message="defend"
+        )
+        self.client.force_authenticate(user=self.player)
+
+        response = self.client.get(self.url)
+        json_response = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(json_response.keys()) == {"next", "previous", "results"}
+        assert set(json_response["results"][0].keys()) == {
+            "id",
+            "status",
+            "player1",
+            "player2",
+            "current_turn",
+            "turn_number",
+            "winner_id",
+            "created_at",
+            "completed_at",
+        }
+        assert json_response["results"][0]["player2"] == {"id": str(self.opponent.id), "username": "opponent"}
+
+    def test_list_battles_query_count_does_not_depend_on_history_size(self, django_assert_num_queries):
+        for _ in range(5):
+            self._create_battle(status=Battle.STATUS_COMPLETED)
+        self.client.force_authenticate(user=self.player)
+
+        # One page of index rows, then the summaries of its battles
+        with django_assert_num_queries(2):
+            response = self.client.get(self.url, {"page_size": 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == 3
+
+    def test_list_battles_pages_over_the_player_battle_index(self, django_assert_num_queries):
+        archived = self._create_battle(status=Battle.STATUS_COMPLETED)
+        battles = [self._create_battle(status=Battle.STATUS_COMPLETED) for _ in range(2)]
+        # Archiving deletes the battle but keeps its index rows
+        Battle.objects.filter(id=archived.id).delete()
+        self.client.force_authenticate(user=self.opponent)
+
+        with django_assert_num_queries(2) as captured:
+            response = self.client.get(self.url, {"page_size": 2})
+
+        index_query = captured.captured_queries[0]["sql"]
+        assert 'FROM "player_battles"' in index_query
+        assert 'ORDER BY "player_battles"."battle_id" DESC' in index_query
+        assert [item["id"] for item in response.json()["results"]] == [str(battles[1].id), str(battles[0].id)]
+        assert response.json()["next"] is None
+
+    def test_list_battles_uses_keyset_pagination_newest_first(self):
+        battles = [self._create_battle(status=Battle.STATUS_COMPLETED) for _ in range(3)]
+        self.client.force_authenticate(user=self.player)
+
+        first_page = self.client.get(self.url, {"page_size": 2}).json()
+        second_page = self.client.get(first_page["next"]).json()
+
+        assert [item["id"] for item in first_page["results"]] == [str(battles[2].id), str(battles[1].id)]
+        assert [item["id"] for item in second_page["results"]] == [str(battles[0].id)]
+        assert second_page["next"] is None
+
+    def test_list_battles_filters_by_status_and_date(self):
+        active_battle = self._create_battle()
+        old_battle = self._create_battle(status=Battle.STATUS_COMPLETED)
+        # Index rows copy the battle's creation time when the battle is created
+        created_at = timezone.now() - timedelta(days=10)
+        Battle.objects.filter(id=old_battle.id).update(created_at=created_at)
+        PlayerBattle.objects.filter(battle_id=old_battle.id).update(created_at=created_at)
+        self.client.force_authenticate(user=self.player)
+
+        by_status = self.client.get(self.url, {"status": Battle.STATUS_ACTIVE}).json()
+        by_date = self.client.get(self.url, {"created_before": (timezone.now() - timedelta(days=1)).isoformat()}).json()
+
+        assert [item["id"] for item in by_status["results"]] == [str(active_battle.id)]
+        assert [item["id"] for item in by_date["results"]] == [str(old_battle.id)]
+
+    def test_list_battles_filters_on_the_index_rows(self, django_assert_num_queries):
+        active_battle = self._create_battle()
+        self._create_battle(status=Battle.STATUS_COMPLETED)
+        self.client.force_authenticate(user=self.player)
+
+        with django_assert_num_queries(2) as captured:
+            response = self.client.get(self.url, {"status": Battle.STATUS_ACTIVE})
+
+        assert '"player_battles"."status" = ' in captured.captured_queries[0]["sql"]
+        assert [item["id"] for item in response.json()["results"]] == [str(active_battle.id)]
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from battles.models import Battle
+
+
+@pytest.mark.django_db
+class TestCancelStaleBattlesCommand:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, api_client, create_player, create_pokemon, create_pokemon_type, create_player_pokemon, create_battle
+    ):
+        self.client = api_client
+        self.player = create_player(username="player1", password="TestPass123!")
+        self.opponent = create_player(username="opponent", password="TestPass123!")
+        fire_type = create_pokemon_type(name="fire")
+        water_type = create_pokemon_type(name="water")
+        self.charmander = create_pokemon(name="Charmander", pokedex_number=7001, primary_type=fire_type, base_speed=65)
+        self.squirtle = create_pokemon(name="Squirtle", pokedex_number=7002, primary_type=water_type, base_speed=43)
+        self.player_pokemon = create_player_pokemon(player=self.player, pokemon=self.charmander)
+        self.opponent_pokemon = create_player_pokemon(player=self.opponent, pokemon=self.squirtle)
+        self.player.active_pokemon = self.player_pokemon
+        self.player.save()
+        self.opponent.active_pokemon = self.opponent_pokemon
+        self.opponent.save()
+        self.create_battle = create_battle
+
+    def _create_battle(self, idle_minutes=0, **kwargs):
+        battle = self.create_battle(
+            player1=self.player,
+            player2=self.opponent,
+            player1_pokemon=self.player_pokemon,
+            player2_pokemon=self.opponent_pokemon,
+            **kwargs,
+        )
+        Battle.objects.filter(id=battle.id).update(updated_at=timezone.now() - timedelta(minutes=idle_minutes))
+        return battle
+
+    def test_cancel_stale_battles_cancels_only_idle_active_battles(self):
+        stale_battle = self._create_battle(idle_minutes=120)
+        fresh_battle = self._create_battle(idle_minutes=5)
+        completed_battle = self._create_battle(idle_minutes=120, status=Battle.STATUS_COMPLETED)
+
+        call_command("cancel_stale_battles", idle_minutes=60)
+
+        stale_battle.refresh_from_db()
+        assert stale_battle.status == Battle.STATUS_CANCELLED
+        assert stale_battle.completed_at is not None
+        assert Battle.objects.get(id=fresh_battle.id).status == Battle.STATUS_ACTIVE
+        assert Battle.objects.get(id=completed_battle.id).status == Battle.STATUS_COMPLETED
+
+    def test_cancel_idle_batch_is_bounded_by_batch_size(self):
+        for _ in range(3):
+            self._create_battle(idle_minutes=120)
+
+        idle_before = timezone.now() - timedelta(minutes=60)
+
+        assert Battle.objects.cancel_idle_batch(idle_before, batch_size=2) == 2
+        assert Battle.objects.cancel_idle_batch(idle_before, batch_size=2) == 1
+        assert Battle.objects.cancel_idle_batch(idle_before, batch_size=2) == 0
+
+    def test_player_can_start_new_battle_after_stale_battle_is_cancelled(self):
+        self._create_battle(idle_minutes=120)
+        self.client.force_authenticate(user=self.player)
+        url = reverse("battles:battle-list")
+
+        assert self.client.post(url, data={"opponent_id": str(self.opponent.id)}).status_code == (
+            status.HTTP_400_BAD_REQUEST
+        )
+
+        call_command("cancel_stale_battles", idle_minutes=60)
+
+        response = self.client.post(url, data={"opponent_id": str(self.opponent.id)})
+        assert response.status_code == status.HTTP_201_CREATED
@@ -1,32 +1,78 @@
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
+from django.http import Http404, StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.mixins import CreateModelMixin, ListModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from battles.models import Battle
+from battles.exporters import BattleHistoryExporter
+from battles.filters import BattleFilter
+from battles.models import ArchivedBattle, Battle, PlayerBattle
 from battles.serializers import (
     BattleCreateSerializer,
     BattleHistorySerializer,
     BattleStateSerializer,
+    BattleSummarySerializer,
     ItemUseSerializer,
     TurnSubmitSerializer,
 )
+from utils.exceptions.exceptions import FormError
+
+
+class BattleHistoryCursorPagination(CursorPagination):
+    page_size = 20
+    ordering = "-battle_id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
 
 
 class BattleHistoryViewSet(ListModelMixin, GenericViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = BattleHistorySerializer
+    pagination_class = BattleHistoryCursorPagination
 
     def get_queryset(self):
-        return Battle.objects.for_player(self.request.user).order_by("-id")
+        # One range scan over the (player, battle_id) index; archived battles keep their index rows
+        return PlayerBattle.objects.filter(player=self.request.user).select_related("opponent")
+
+    @action(detail=False, methods=["get"])
+    def export(self, request, *args, **kwargs):
+        # `format` is reserved by DRF for renderer negotiation
+        export_format = request.query_params.get("export_format", BattleHistoryExporter.FORMAT_NDJSON)
+        if export_format not in BattleHistoryExporter.FORMATS:
+            raise FormError(
+                field_name="export_format",
+                message=f"Unsupported export format. Choose one of: {', '.join(BattleHistoryExporter.FORMATS)}.",
+            )
+
+        exporter = BattleHistoryExporter(request.user)
+        response = StreamingHttpResponse(
+            exporter.stream(export_format), content_type=BattleHistoryExporter.FORMATS[export_format]
+        )
+        response["Content-Disposition"] = f'attachment; filename="battle-history.{export_format}"'
+        return response
 
 
 class BattleViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericViewSet):
     permission_classes = [IsAuthenticated]
+    # The list pages over the user's PlayerBattle index rows, like the battle history
+    pagination_class = BattleHistoryCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = BattleFilter
 
     def get_queryset(self):
         user = self.request.user
+        if self.action == "list":
+            # The user's index rows of live battles; archived battles keep their index rows
+            return (
+                PlayerBattle.objects.filter(player=user)
+                .filter(Exists(Battle.objects.filter(id=OuterRef("battle_id"))))
+                .only("battle_id")
+            )
         return (
             Battle.objects.filter(Q(player1=user) | Q(player2=user))
             .select_related(
@@ -34,12 +80,32 @@ class BattleViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, Update
                 "player2",
                 "winner",
                 "current_turn_player",
-                "player1_pokemon__pokemon__primary_type",
-                "player2_pokemon__pokemon__primary_type",
             )
             .prefetch_related("turns")
         )
 
+    def filter_queryset(self, queryset):
+        # BattleFilter applies to the list's index rows only
+        if self.action != "list":
+            return queryset
+        return super().filter_queryset(queryset)
+
+    def get_summary_queryset(self):
+        # Summary rows only: turns and Pokemon are never loaded
+        return Battle.objects.select_related("player1", "player2").only(
+            "id",
+            "status",
+            "player1__id",
+            "player1__username",
+            "player2__id",
+            "player2__username",
+            "current_turn_player_id",
+            "turn_number",
+            "winner_id",
+            "created_at",
+            "completed_at",
+        )
+
     def get_serializer_class(self):
         if self.action == "create":
             return BattleCreateSerializer
@@ -49,6 +115,8 @@ class BattleViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, Update
             return TurnSubmitSerializer
         elif self.action == "use_item":
             return ItemUseSerializer
+        elif self.action == "list":
+            return BattleSummarySerializer
         return BattleStateSerializer
 
     def get_serializer_context(self):
@@ -57,6 +125,26 @@ class BattleViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, Update
             context["battle"] = self.get_object()
         return context
 
+    def list(self, request, *args, **kwargs):
+        # Filters apply to the index rows' own status and created_at, so a page is one range of the
+        # (player, battle_id) or (player, status, battle_id) index at any history size. OR-ing both player
+        # columns of `battles` would sort the whole history on every page. The page's summaries are then
+        # loaded by id.
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        summaries = self.get_summary_queryset().in_bulk([row.battle_id for row in page])
+        serializer = self.get_serializer(
+            [summaries[row.battle_id] for row in page if row.battle_id in summaries], many=True
+        )
+        return self.get_paginated_response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            # Old battles are moved out of the hot table by the `archive_battles` command
+            archived = get_object_or_404(ArchivedBattle.objects.for_player(request.user), pk=kwargs["pk"])
+            return Response(archived.state)
+
     @action(detail=True, methods=["post"])
     def turn(self, request, pk=None, *args, **kwargs):
         return super().update(request, *args, **kwargs)
@@ -91,8 +91,13 @@ REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        # Redis, with an in-process LRU in front of the CACHE_PREFIX_* namespaces
+        "BACKEND": "utils.cache.tiered.TieredRedisCache",
         "LOCATION": REDIS_URL,
+        "LOCAL_CACHE": {
+            "MAX_BYTES": int(os.environ.get("LOCAL_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+            "TIMEOUT": int(os.environ.get("LOCAL_CACHE_TIMEOUT", 60)),
+        },
     }
 }
 
@@ -155,6 +160,72 @@ SPECTACULAR_SETTINGS = {
     "COMPONENT_NO_READ_ONLY_REQUIRED": False,
 }
 
+# Battle maintenance
+BATTLE_ARCHIVE_AFTER_DAYS = int(os.environ.get("BATTLE_ARCHIVE_AFTER_DAYS", 30))
+BATTLE_IDLE_TIMEOUT_MINUTES = int(os.environ.get("BATTLE_IDLE_TIMEOUT_MINUTES", 60))
+
+# Scoreboard positions served from the page cache, and the freshness window of `GET /api/scoreboard/me/`
+SCOREBOARD_CACHED_POSITIONS = int(os.environ.get("SCOREBOARD_CACHED_POSITIONS", 100))
+SCOREBOARD_RANK_MAX_AGE = int(os.environ.get("SCOREBOARD_RANK_MAX_AGE", 10))
+SCOREBOARD_RANK_STALE_WHILE_REVALIDATE = int(os.environ.get("SCOREBOARD_RANK_STALE_WHILE_REVALIDATE", 60))
+
+# Battles a player needs before appearing on the win rate leaderboard (overridable with `?min_games=`). Values from
+# players.models.WIN_RATE_INDEXED_MIN_GAMES up are served by a partial index
+SCOREBOARD_WIN_RATE_MIN_GAMES = int(os.environ.get("SCOREBOARD_WIN_RATE_MIN_GAMES", 10))
+
+# Windowed leaderboard rollups kept by `compact_period_stats` (season rollups are never compacted)
+LEADERBOARD_DAILY_RETENTION_DAYS = int(os.environ.get("LEADERBOARD_DAILY_RETENTION_DAYS", 14))
+LEADERBOARD_WEEKLY_RETENTION_WEEKS = int(os.environ.get("LEADERBOARD_WEEKLY_RETENTION_WEEKS", 12))
+
+# PokeAPI client: the pooled connections each process keeps to PokeAPI
+POKEAPI_BASE_URL = os.environ.get("POKEAPI_BASE_URL", "https://pokeapi.co/api/v2")
+POKEAPI_MAX_CONNECTIONS = int(os.environ.get("POKEAPI_MAX_CONNECTIONS", 50))
+POKEAPI_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("POKEAPI_MAX_KEEPALIVE_CONNECTIONS", 10))
+POKEAPI_KEEPALIVE_EXPIRY = float(os.environ.get("POKEAPI_KEEPALIVE_EXPIRY", 30))
+POKEAPI_MAX_CONCURRENCY = int(os.environ.get("POKEAPI_MAX_CONCURRENCY", 50))  # Fetches in flight per batch
+POKEAPI_HTTP2 = os.environ.get("POKEAPI_HTTP2", "false").lower() in ("true", "1", "yes")  # Requires `h2`
+
+# PokeAPI timeouts: request paths make one attempt within POKEAPI_TIMEOUT seconds; seed jobs retry transient failures
+# with jittered exponential backoff, each attempt within POKEAPI_JOB_TIMEOUT and the whole call within
+# POKEAPI_JOB_DEADLINE seconds
+POKEAPI_TIMEOUT = float(os.environ.get("POKEAPI_TIMEOUT", 3))
+POKEAPI_JOB_TIMEOUT = float(os.environ.get("POKEAPI_JOB_TIMEOUT", 10))
+POKEAPI_JOB_RETRIES = int(os.environ.get("POKEAPI_JOB_RETRIES", 4))
+POKEAPI_JOB_DEADLINE = float(os.environ.get("POKEAPI_JOB_DEADLINE", 60))
+POKEAPI_RETRY_BACKOFF = float(os.environ.get("POKEAPI_RETRY_BACKOFF", 0.5))
+POKEAPI_RETRY_BACKOFF_MAX = float(os.environ.get("POKEAPI_RETRY_BACKOFF_MAX", 8))
+
+# Circuit breaker shared by every worker: opens after POKEAPI_CIRCUIT_FAILURE_THRESHOLD failures within
+# POKEAPI_CIRCUIT_FAILURE_WINDOW seconds and lets one probe through after POKEAPI_CIRCUIT_RESET_TIMEOUT seconds
+POKEAPI_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("POKEAPI_CIRCUIT_FAILURE_THRESHOLD", 5))
+POKEAPI_CIRCUIT_FAILURE_WINDOW = int(os.environ.get("POKEAPI_CIRCUIT_FAILURE_WINDOW", 30))
+POKEAPI_CIRCUIT_RESET_TIMEOUT = int(os.environ.get("POKEAPI_CIRCUIT_RESET_TIMEOUT", 30))
+
+# Persistent PokeAPI response cache shared by every process (disabled when empty), and how long a response is used
+# before it is revalidated
+POKEAPI_CACHE_PATH = os.environ.get("POKEAPI_CACHE_PATH", "")
+POKEAPI_CACHE_TTL = int(os.environ.get("POKEAPI_CACHE_TTL", 7 * 24 * 60 * 60))
+
+# Memory-mapped catalog snapshot written by `build_catalog_snapshot` (disabled when empty), and how often workers
+# check whether it was replaced
+CATALOG_SNAPSHOT_PATH = os.environ.get("CATALOG_SNAPSHOT_PATH", "")
+CATALOG_SNAPSHOT_CHECK_INTERVAL = int(os.environ.get("CATALOG_SNAPSHOT_CHECK_INTERVAL", 5))
+
+# Metrics: seconds between flushes of each worker's counters to Redis, and the bearer token scrapers send to
+# `GET /api/metrics/` (staff only when empty)
+METRICS_FLUSH_INTERVAL = int(os.environ.get("METRICS_FLUSH_INTERVAL", 10))
+METRICS_TOKEN = read_secret("metrics_token", "")
+
+# Periodic jobs run by `python manage.py run_scheduler`
+SCHEDULED_COMMANDS = [
+    {"name": "refresh_scoreboard", "interval": 60},
+    {"name": "build_catalog_snapshot", "interval": 60, "options": {"if_stale": True}},
+    {"name": "cancel_stale_battles", "interval": 5 * 60},
+    {"name": "archive_battles", "interval": 60 * 60},
+    {"name": "rebuild_leaderboard", "interval": 60 * 60},
+    {"name": "compact_period_stats", "interval": 24 * 60 * 60},
+]
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
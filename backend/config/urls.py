@@ -3,12 +3,15 @@ from django.http import JsonResponse
 from django.urls import include, path, re_path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from utils.metrics import metrics_view
+
 base_urlpatterns = [
     path("players/", include("players.urls", namespace="players")),
     path("pokemon/", include("pokemon.urls", namespace="pokemon")),
     path("battles/", include("battles.urls", namespace="battles")),
     path("scoreboard/", include("scoreboard.urls", namespace="scoreboard")),
     path("health/", lambda request: JsonResponse({"status": "ok"}), name="health"),
+    path("metrics/", metrics_view, name="metrics"),
 ]
 
 if settings.DEBUG:
@@ -1,3 +1,4 @@
+from functools import partial
 from unittest.mock import Mock, patch
 
 import pytest
@@ -6,6 +7,7 @@ from rest_framework.test import APIClient
 
 from players.models import Player
 from pokemon.models import PlayerPokemon, Pokemon, PokemonType, TypeEffectiveness
+from utils.third_party_services.PokemonAPI.base import BasePokemonClient
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -121,6 +123,8 @@ def mock_pokeapi_client():
     """Fixture that mocks PokeAPIClient and returns the mock instance."""
     with patch("pokemon.views.PokeAPIClient") as mock_client_class:
         mock_client = Mock()
+        # Batch fetches go through the real thread pool, over the mocked `get_pokemon`
+        mock_client.get_pokemon_many.side_effect = partial(BasePokemonClient.get_pokemon_many, mock_client)
         mock_client_class.return_value = mock_client
         yield mock_client
 
@@ -26,7 +26,16 @@ done
 echo "Database is ready!"
 
 python manage.py migrate --noinput
-python manage.py seed_all
+# SEED_FROM_DATASET=true seeds from the bundled dataset instead of PokeAPI
+if [ "${SEED_FROM_DATASET:-false}" = "true" ]; then
+    python manage.py seed_all --dataset
+else
+    python manage.py seed_all
+fi
+python manage.py build_catalog_snapshot
+python manage.py warm_cache
+python manage.py refresh_scoreboard
+python manage.py rebuild_leaderboard
 
 # Build MkDocs site (drf_to_mkdoc is a plugin that runs during build)
 if [ -f "mkdocs.yml" ]; then
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:26
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("players", "0004_player_active_pokemon"),
+        ("pokemon", "0005_alter_playerpokemon_managers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="win_rate",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(losses=0, then=models.Value(0.0), wins=0),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            django.db.models.functions.comparison.Cast("wins", models.FloatField()),
+                            "*",
+                            models.Value(100),
+                        ),
+                        "/",
+                        django.db.models.expressions.CombinedExpression(models.F("wins"), "+", models.F("losses")),
+                    ),
+                    output_field=models.FloatField(),
+                ),
+                help_text="Percentage of battles won (0 without battles)",
+                output_field=models.FloatField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(fields=["-win_rate", "-wins", "id"], name="player_win_rate_idx"),
+        ),
+    ]
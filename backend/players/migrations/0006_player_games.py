@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:47
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("players", "0005_player_win_rate"),
+        ("pokemon", "0005_alter_playerpokemon_managers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="games",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(models.F("wins"), "+", models.F("losses")),
+                help_text="Total number of battles played",
+                output_field=models.PositiveIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(("games__gte", 10), ("is_active", True)),
+                fields=["-win_rate", "-wins", "id"],
+                name="player_win_rate_ranked_idx",
+            ),
+        ),
+    ]
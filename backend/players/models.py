@@ -3,6 +3,11 @@ from django.db import models
 from uuid_extensions import uuid7
 
 from players.managers import PlayerManager
+from utils.fields import win_rate_field
+
+# Battles a player needs to be in the partial win rate index. Keep it at the default of
+# SCOREBOARD_WIN_RATE_MIN_GAMES: `?min_games=` values below it fall back to the full index.
+WIN_RATE_INDEXED_MIN_GAMES = 10
 
 
 class Player(AbstractBaseUser, PermissionsMixin):
@@ -12,6 +17,13 @@ class Player(AbstractBaseUser, PermissionsMixin):
     username = models.CharField(max_length=150, unique=True, help_text="Required. 150 characters or fewer.")
     wins = models.PositiveIntegerField(default=0, help_text="Total number of battles won")
     losses = models.PositiveIntegerField(default=0, help_text="Total number of battles lost")
+    win_rate = win_rate_field(help_text="Percentage of battles won (0 without battles)")
+    games = models.GeneratedField(
+        expression=models.F("wins") + models.F("losses"),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+        help_text="Total number of battles played",
+    )
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the player account was created")
     is_active = models.BooleanField(default=True, help_text="Whether this player account is active")
     is_staff = models.BooleanField(default=False, help_text="Whether the player can access the admin site")
@@ -37,6 +49,14 @@ class Player(AbstractBaseUser, PermissionsMixin):
         indexes = [
             # Composite index for scoreboard queries (Player.objects.order_by('-wins', 'losses'))
             models.Index(fields=["-wins", "losses"], name="player_scoreboard_idx"),
+            # Best win rate leaderboard (Player.objects.order_by('-win_rate', '-wins', 'id'))
+            models.Index(fields=["-win_rate", "-wins", "id"], name="player_win_rate_idx"),
+            # The same order over the players the win rate leaderboard lists by default
+            models.Index(
+                fields=["-win_rate", "-wins", "id"],
+                condition=models.Q(is_active=True, games__gte=WIN_RATE_INDEXED_MIN_GAMES),
+                name="player_win_rate_ranked_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -19,10 +19,7 @@ class PlayerSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "wins", "losses", "created_at"]
 
     def get_win_rate(self, obj: Player) -> float:
-        total_games = obj.wins + obj.losses
-        if total_games == 0:
-            return 0.0
-        return round((obj.wins / total_games) * 100, 2)
+        return round(obj.win_rate, 2)
 
 
 class PlayerUpdateSerializer(serializers.ModelSerializer):
@@ -0,0 +1,80 @@
+from collections.abc import Mapping
+
+from django.core.cache import cache
+
+from pokemon.models import PlayerPokemon, Pokemon, TypeEffectiveness
+from pokemon.records import PokemonRecord
+from pokemon.snapshot import get_snapshot
+from utils.cache.constants import CACHE_PREFIX_POKEMON, CACHE_PREFIX_TYPE_EFFECTIVENESS, CACHE_TTL
+from utils.cache.manager import get_cache_generation
+
+
+def get_pokemon(pokemon_id) -> PokemonRecord:
+    """
+    Return the record of a Pokemon, from the catalog snapshot or read through the cache.
+
+    Records live under the Pokemon prefix generation, so the signals that invalidate the
+    cached Pokemon responses (Pokemon and type saves) invalidate them too. The snapshot is
+    only used while it was built at the current generation.
+
+    Raises:
+        Pokemon.DoesNotExist: If there is no such Pokemon
+    """
+    generation = get_cache_generation(CACHE_PREFIX_POKEMON)
+    snapshot = get_snapshot()
+    if snapshot is not None and snapshot.pokemon_generation == generation:
+        record = snapshot.get_pokemon(pokemon_id)
+        if record is not None:
+            return record
+
+    key = f"{CACHE_PREFIX_POKEMON}:{generation}:record:{pokemon_id}"
+    record = cache.get(key)
+    if record is None:
+        record = PokemonRecord.from_model(
+            Pokemon.objects.select_related("primary_type", "secondary_type").get(id=pokemon_id)
+        )
+        cache.set(key, record, CACHE_TTL)
+    return record
+
+
+def get_player_pokemon(player_pokemon_id) -> PokemonRecord:
+    """
+    Return the record of the Pokemon behind a `PlayerPokemon`, read through the cache.
+
+    A `PlayerPokemon` never changes Pokemon, so its Pokemon id is cached without a
+    generation; soft-deleted rows resolve too, as battles keep referencing them.
+
+    Raises:
+        PlayerPokemon.DoesNotExist: If there is no such `PlayerPokemon`
+    """
+    key = f"{CACHE_PREFIX_POKEMON}:owned:{player_pokemon_id}"
+    pokemon_id = cache.get(key)
+    if pokemon_id is None:
+        pokemon_id = PlayerPokemon.with_trash.values_list("pokemon_id", flat=True).get(id=player_pokemon_id)
+        cache.set(key, pokemon_id, CACHE_TTL)
+    return get_pokemon(pokemon_id)
+
+
+def get_type_chart() -> Mapping[tuple[str, str], float]:
+    """
+    Return every type matchup as `{(attacker type name, defender type name): multiplier}`.
+
+    Served from the catalog snapshot while it is current, read through the cache
+    otherwise. Matchups missing from the chart are `TypeEffectiveness.NORMAL`.
+    """
+    generation = get_cache_generation(CACHE_PREFIX_TYPE_EFFECTIVENESS)
+    snapshot = get_snapshot()
+    if snapshot is not None and snapshot.type_effectiveness_generation == generation:
+        return snapshot.type_chart
+
+    key = f"{CACHE_PREFIX_TYPE_EFFECTIVENESS}:{generation}:chart"
+    chart = cache.get(key)
+    if chart is None:
+        chart = {
+            (attacker, defender): multiplier
+            for attacker, defender, multiplier in TypeEffectiveness.objects.values_list(
+                "attacker_type__name", "defender_type__name", "multiplier"
+            )
+        }
+        cache.set(key, chart, CACHE_TTL)
+    return chart
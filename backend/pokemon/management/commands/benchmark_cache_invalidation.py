@@ -0,0 +1,110 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.cache.manager import generation_key, get_cache_generation, get_redis_client, invalidate_cache_prefix
+
+BENCHMARK_PREFIX = "benchmark_prefix"
+
+
+class Command(BaseCommand):
+    """
+    Compare SCAN+DELETE prefix invalidation with generation-counter invalidation.
+
+    Fills Redis with `--keys` keys, of which `--pages` look like cached pages of one prefix,
+    then times the former `SCAN` over the whole keyspace (both glob patterns) against the
+    single `INCR` that `invalidate_cache_prefix` now issues. Every key the benchmark writes
+    is removed afterwards. Requires the Redis cache backend; run it against a disposable
+    Redis instance.
+
+    Usage:
+        python manage.py benchmark_cache_invalidation
+        python manage.py benchmark_cache_invalidation --keys 1000000 --pages 2000
+    """
+
+    help = "Benchmark SCAN-based versus generation-based cache invalidation"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keys",
+            type=int,
+            default=1_000_000,
+            help="Total number of keys in Redis during the benchmark (default: 1000000)",
+        )
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=1000,
+            help="Number of those keys cached under the invalidated prefix (default: 1000)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of keys written or deleted per pipeline (default: 10000)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=100,
+            help="Number of generation bumps averaged (default: 100)",
+        )
+
+    def handle(self, *args, **options):
+        client = get_redis_client()
+        if client is None:
+            raise CommandError("The benchmark requires the Redis cache backend")
+
+        pages = [
+            f"benchmark:views.decorators.cache.cache_page.x:{BENCHMARK_PREFIX}:{i}" for i in range(options["pages"])
+        ]
+        fillers = [f"benchmark:filler:{i}" for i in range(max(options["keys"] - len(pages), 0))]
+        batch_size = options["batch_size"]
+
+        try:
+            self.stdout.write(f"Writing {len(pages) + len(fillers)} keys...")
+            self._write(client, pages + fillers, batch_size)
+
+            scan_seconds = self._time(lambda: self._scan_delete(client))
+            self.stdout.write(f"SCAN+DELETE: {scan_seconds * 1000:.1f} ms")
+
+            get_cache_generation(BENCHMARK_PREFIX)
+            incr_seconds = self._time(
+                lambda: [invalidate_cache_prefix(BENCHMARK_PREFIX) for _ in range(options["repeat"])]
+            )
+            self.stdout.write(f"INCR: {incr_seconds * 1000 / options['repeat']:.3f} ms per invalidation")
+        finally:
+            for start in range(0, len(fillers), batch_size):
+                client.unlink(*fillers[start : start + batch_size])
+            cache.delete(generation_key(BENCHMARK_PREFIX))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Generation bump is {scan_seconds / incr_seconds * options['repeat']:.0f}x faster")
+        )
+
+    def _write(self, client, keys, batch_size):
+        for start in range(0, len(keys), batch_size):
+            with client.pipeline(transaction=False) as pipe:
+                for key in keys[start : start + batch_size]:
+                    pipe.set(key, b"x")
+                pipe.execute()
+
+    def _scan_delete(self, client):
+        """The SCAN+DELETE invalidation `invalidate_cache_prefix` used to run."""
+        for pattern in (
+            f"*:views.decorators.cache.cache_page.*:{BENCHMARK_PREFIX}:*",
+            f"views.decorators.cache.cache_page.*:{BENCHMARK_PREFIX}:*",
+        ):
+            cursor = 0
+            while True:
+                cursor, keys = client.scan(cursor, match=pattern, count=100)
+                if keys:
+                    client.delete(*keys)
+                if cursor == 0:
+                    break
+
+    def _time(self, func) -> float:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
@@ -0,0 +1,75 @@
+import logging
+import time
+
+import httpx
+from django.core.management.base import BaseCommand
+
+from utils.third_party_services.PokemonAPI.pokeapi.client import PokeAPIClient, close_http_client
+from utils.third_party_services.PokemonAPI.pokeapi.local_server import LocalPokeAPIServer
+
+
+class PerRequestClient(PokeAPIClient):
+    """The former behaviour: a new `httpx.Client`, and so a new connection, per request."""
+
+    def get_pokemon(self, pokemon_id: int):
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.get(f"{self.base_url}/pokemon/{pokemon_id}")
+            response.raise_for_status()
+            return self._parse_pokemon_response(response.json())
+
+
+class Command(BaseCommand):
+    """
+    Compare a new HTTP client per PokeAPI request with the shared, pooled client.
+
+    Runs `--requests` Pokemon lookups against a local stand-in for PokeAPI that sleeps
+    `--connect-latency` on every new connection, standing in for the DNS lookup, TCP and
+    TLS handshakes a fresh client pays on each request to the real API. Reports the
+    throughput and the number of connections the server accepted for both clients.
+    Nothing leaves the machine.
+
+    Usage:
+        python manage.py benchmark_pokeapi_client
+        python manage.py benchmark_pokeapi_client --requests 500 --connect-latency 0.05
+    """
+
+    help = "Benchmark per-request versus pooled HTTP clients for PokeAPI"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Number of Pokemon lookups per client (default: 200)",
+        )
+        parser.add_argument(
+            "--connect-latency",
+            type=float,
+            default=0.02,
+            help="Seconds the server sleeps on every new connection (default: 0.02)",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Seconds the server sleeps on every request (default: 0)",
+        )
+
+    def handle(self, *args, **options):
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # One INFO line per request otherwise
+        for label, client_class in (("Per-request client", PerRequestClient), ("Pooled client", PokeAPIClient)):
+            with LocalPokeAPIServer(latency=options["latency"], connect_latency=options["connect_latency"]) as server:
+                close_http_client()
+                client = client_class(base_url=server.base_url)
+                started = time.perf_counter()
+                for i in range(options["requests"]):
+                    client.get_pokemon(i % 151 + 1)
+                seconds = time.perf_counter() - started
+                close_http_client()
+
+            self.stdout.write(
+                f"{label}: {options['requests'] / seconds:.0f} requests/s, "
+                f"{seconds * 1000 / options['requests']:.2f} ms per request, "
+                f"{server.connections} connections for {server.requests} requests"
+            )
+        self.stdout.write(self.style.SUCCESS("Benchmark complete"))
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pokemon.snapshot import CatalogSnapshot, write_snapshot
+from utils.cache.constants import CACHE_PREFIX_POKEMON, CACHE_PREFIX_TYPE_EFFECTIVENESS
+from utils.cache.manager import get_cache_generation
+
+
+class Command(BaseCommand):
+    """
+    Compile the Pokemon catalog into the memory-mapped snapshot shared by the workers.
+
+    Writes the Pokemon, type and type effectiveness tables to a versioned binary file and
+    atomically renames it over the previous snapshot; workers map the new file within
+    CATALOG_SNAPSHOT_CHECK_INTERVAL seconds. A snapshot is tagged with the cache
+    generations it was built at, so workers ignore it once the catalog changed, and
+    `--if-stale` only rebuilds it then.
+
+    Usage:
+        python manage.py build_catalog_snapshot
+        python manage.py build_catalog_snapshot --if-stale
+        python manage.py build_catalog_snapshot --path /tmp/catalog.snapshot
+    """
+
+    help = "Build the memory-mapped Pokemon catalog snapshot"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.CATALOG_SNAPSHOT_PATH,
+            help="Snapshot file to write (default: CATALOG_SNAPSHOT_PATH)",
+        )
+        parser.add_argument(
+            "--if-stale",
+            action="store_true",
+            help="Only rebuild when the catalog changed since the current snapshot was built",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path:
+            raise CommandError("No snapshot path; set CATALOG_SNAPSHOT_PATH or pass --path")
+
+        if options["if_stale"] and self._is_current(path):
+            self.stdout.write("Catalog snapshot is up to date")
+            return
+
+        info = write_snapshot(path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Catalog snapshot written to {info.path}: {info.pokemon} Pokemon, {info.types} types, "
+                f"{info.matchups} matchups ({info.size / 1024:.1f} KiB)"
+            )
+        )
+
+    def _is_current(self, path) -> bool:
+        try:
+            snapshot = CatalogSnapshot(path)
+        except (OSError, ValueError):
+            return False
+        return (snapshot.pokemon_generation, snapshot.type_effectiveness_generation) == (
+            get_cache_generation(CACHE_PREFIX_POKEMON),
+            get_cache_generation(CACHE_PREFIX_TYPE_EFFECTIVENESS),
+        )
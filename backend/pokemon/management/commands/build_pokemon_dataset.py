@@ -0,0 +1,50 @@
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.third_party_services.PokemonAPI.dataset.builder import build_dataset, write_dataset
+from utils.third_party_services.PokemonAPI.dataset.client import DEFAULT_DATASET_PATH
+from utils.third_party_services.PokemonAPI.pokeapi.client import PokeAPIClient
+
+
+class Command(BaseCommand):
+    """
+    Download the types, type relations and Pokemon stats from PokeAPI into a dataset file.
+
+    The file is what `seed_dataset` (and `seed_all --dataset`) loads. By default it replaces
+    the bundled dataset; commit the result to ship it. Pokemon are fetched concurrently and,
+    with POKEAPI_CACHE_PATH set, through the persistent response cache.
+
+    Usage:
+        python manage.py build_pokemon_dataset
+        python manage.py build_pokemon_dataset --count 151 --output /data/pokeapi.json
+    """
+
+    help = "Build a Pokemon dataset file from PokeAPI"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1025,
+            help="Number of Pokemon to include, by Pokedex number (default: 1025, the national dex)",
+        )
+        parser.add_argument(
+            "--output",
+            default=str(DEFAULT_DATASET_PATH),
+            help="File to write (default: the bundled dataset)",
+        )
+
+    def handle(self, *args, **options):
+        client = PokeAPIClient.for_jobs()
+        self.stdout.write(f"Fetching {options['count']} Pokemon and every type from {client.base_url}...")
+        try:
+            dataset = build_dataset(client, options["count"], source=client.base_url)
+        except httpx.HTTPError as e:
+            raise CommandError(f"Could not fetch the dataset: {e}") from e
+
+        write_dataset(options["output"], dataset)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {len(dataset['types'])} types and {len(dataset['pokemon'])} Pokemon to {options['output']}"
+            )
+        )
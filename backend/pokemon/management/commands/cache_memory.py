@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.cache.manager import cache_memory_usage, get_redis_client
+
+
+class Command(BaseCommand):
+    """
+    Report the Redis memory used by each cache prefix.
+
+    Counts the keys of every `CACHE_PREFIX_*` namespace (all generations, locks and
+    counters included) and sums their `MEMORY USAGE`, next to Redis' own used and maximum
+    memory. The keyspace is scanned, so run it from a shell, not from request paths.
+
+    Usage:
+        python manage.py cache_memory
+        python manage.py cache_memory --batch-size 1000
+    """
+
+    help = "Report Redis memory usage per cache prefix"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of keys scanned and measured per round trip (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            usage = cache_memory_usage(batch_size=options["batch_size"])
+        except RuntimeError as e:
+            raise CommandError(str(e)) from e
+
+        for prefix, stats in usage.items():
+            self.stdout.write(f"{prefix:<20} {stats['keys']:>8} keys {stats['bytes'] / 1024:>12.1f} KiB")
+
+        memory = get_redis_client().info("memory")
+        max_memory = memory.get("maxmemory") or 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Redis: {memory['used_memory_human']} used of "
+                f"{f'{max_memory / 1024 / 1024:.0f}M' if max_memory else 'unlimited'} "
+                f"(policy: {memory.get('maxmemory_policy', 'unknown')})"
+            )
+        )
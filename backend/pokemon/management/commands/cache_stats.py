@@ -0,0 +1,53 @@
+import math
+
+from django.core.management.base import BaseCommand
+
+from utils.cache.manager import cache_stats
+from utils.metrics import metrics
+
+
+class Command(BaseCommand):
+    """
+    Report hit ratios and latencies of the cached responses, per cache prefix.
+
+    Reads the metrics every worker recorded since the last reset: hits (fresh and stale),
+    misses, fills and invalidations, with median and 95th percentile durations. A low hit
+    ratio with few invalidations suggests a longer CACHE_TTL pays off; when invalidations
+    outnumber fills, entries rarely live out their TTL and a longer one gains nothing.
+
+    Usage:
+        python manage.py cache_stats
+        python manage.py cache_stats --reset
+    """
+
+    help = "Report cache hit ratios and latencies per prefix"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Clear every recorded metric after the report",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'prefix':<20} {'hits':>8} {'stale':>8} {'misses':>8} {'ratio':>7} {'fills':>8} {'invalid.':>8}"
+            f" {'hit p95':>9} {'miss p95':>9} {'fill p95':>9} {'inv. p95':>9}"
+        )
+        for prefix, stats in cache_stats().items():
+            self.stdout.write(
+                f"{prefix:<20} {stats['hits']:>8.0f} {stats['stale_hits']:>8.0f} {stats['misses']:>8.0f}"
+                f" {self._percent(stats['hit_ratio']):>7} {stats['fills']:>8.0f} {stats['invalidations']:>8.0f}"
+                f" {self._ms(stats['hit_p95']):>9} {self._ms(stats['miss_p95']):>9}"
+                f" {self._ms(stats['fill_p95']):>9} {self._ms(stats['invalidation_p95']):>9}"
+            )
+
+        if options["reset"]:
+            metrics.reset()
+            self.stdout.write(self.style.SUCCESS("Metrics reset"))
+
+    def _percent(self, ratio: float) -> str:
+        return "-" if math.isnan(ratio) else f"{ratio:.1%}"
+
+    def _ms(self, seconds: float) -> str:
+        return "-" if math.isnan(seconds) else f"{seconds * 1000:.1f}ms"
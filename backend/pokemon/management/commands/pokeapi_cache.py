@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.third_party_services.PokemonAPI.pokeapi.response_cache import get_response_cache
+
+
+class Command(BaseCommand):
+    """
+    Report the contents of the persistent PokeAPI response cache, or clear it.
+
+    Shows the number of cached URLs, how many are still fresh (served without a request),
+    the distinct bodies behind them and their compressed size. Clearing makes the next
+    seed or search download everything again.
+
+    Usage:
+        python manage.py pokeapi_cache
+        python manage.py pokeapi_cache --clear
+    """
+
+    help = "Report or clear the persistent PokeAPI response cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove every cached response",
+        )
+
+    def handle(self, *args, **options):
+        response_cache = get_response_cache()
+        if response_cache is None:
+            raise CommandError("POKEAPI_CACHE_PATH is not set")
+
+        if options["clear"]:
+            response_cache.clear()
+            self.stdout.write(self.style.SUCCESS(f"Cleared {response_cache.path}"))
+            return
+
+        stats = response_cache.stats()
+        self.stdout.write(
+            f"{response_cache.path}: {stats['responses']} responses ({stats['fresh']} fresh), "
+            f"{stats['bodies']} bodies, {stats['size'] / 1024:.1f} KiB"
+        )
@@ -1,6 +1,9 @@
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
+from utils.cache.manager import batch_cache_invalidation
+from utils.third_party_services.PokemonAPI.dataset.client import DEFAULT_DATASET_PATH
+
 
 class Command(BaseCommand):
     """
@@ -11,12 +14,18 @@ class Command(BaseCommand):
     2. seed_type_effectiveness - Seeds TypeEffectiveness model with type matchups
     3. seed_pokemon - Seeds Pokemon model with Pokemon data (default: 20 Pokemon)
 
+    With --dataset it runs seed_dataset instead, loading all three from a dataset file with
+    bulk inserts and no network access.
+
     Usage:
         python manage.py seed_all
         python manage.py seed_all --pokemon-count 50
+        python manage.py seed_all --dataset
+        python manage.py seed_all --dataset /data/pokeapi.json
 
     Options:
         --pokemon-count: Number of Pokemon to seed (default: 20)
+        --dataset: Seed from a dataset file instead of PokeAPI (default file: the bundled dataset)
     """
 
     help = "Run all seeder commands in the correct order"
@@ -28,7 +37,15 @@ class Command(BaseCommand):
             default=20,
             help="Number of Pokemon to seed (default: 20)",
         )
+        parser.add_argument(
+            "--dataset",
+            nargs="?",
+            const=str(DEFAULT_DATASET_PATH),
+            default=None,
+            help="Seed from a dataset file instead of PokeAPI (default file: the bundled dataset)",
+        )
 
+    @batch_cache_invalidation()
     def handle(self, *args, **options):
         pokemon_count = options["pokemon_count"]
         self.stdout.write(self.style.SUCCESS("=" * 60))
@@ -36,20 +53,25 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("=" * 60))
 
         try:
-            # Step 1: Seed Pokemon Types
-            self.stdout.write(self.style.WARNING("\n[Step 1/3] Seeding Pokemon Types..."))
-            call_command("seed_pokemon_types")
-            self.stdout.write(self.style.SUCCESS("✓ Pokemon Types seeded successfully\n"))
-
-            # Step 2: Seed Type Effectiveness
-            self.stdout.write(self.style.WARNING("[Step 2/3] Seeding Type Effectiveness..."))
-            call_command("seed_type_effectiveness")
-            self.stdout.write(self.style.SUCCESS("✓ Type Effectiveness seeded successfully\n"))
-
-            # Step 3: Seed Pokemon
-            self.stdout.write(self.style.WARNING(f"[Step 3/3] Seeding Pokemon (count: {pokemon_count})..."))
-            call_command("seed_pokemon", count=pokemon_count)
-            self.stdout.write(self.style.SUCCESS("✓ Pokemon seeded successfully\n"))
+            if options["dataset"]:
+                self.stdout.write(self.style.WARNING(f"\n[Step 1/1] Seeding from dataset {options['dataset']}..."))
+                call_command("seed_dataset", path=options["dataset"], count=pokemon_count)
+                self.stdout.write(self.style.SUCCESS("✓ Dataset seeded successfully\n"))
+            else:
+                # Step 1: Seed Pokemon Types
+                self.stdout.write(self.style.WARNING("\n[Step 1/3] Seeding Pokemon Types..."))
+                call_command("seed_pokemon_types")
+                self.stdout.write(self.style.SUCCESS("✓ Pokemon Types seeded successfully\n"))
+
+                # Step 2: Seed Type Effectiveness
+                self.stdout.write(self.style.WARNING("[Step 2/3] Seeding Type Effectiveness..."))
+                call_command("seed_type_effectiveness")
+                self.stdout.write(self.style.SUCCESS("✓ Type Effectiveness seeded successfully\n"))
+
+                # Step 3: Seed Pokemon
+                self.stdout.write(self.style.WARNING(f"[Step 3/3] Seeding Pokemon (count: {pokemon_count})..."))
+                call_command("seed_pokemon", count=pokemon_count)
+                self.stdout.write(self.style.SUCCESS("✓ Pokemon seeded successfully\n"))
 
             self.stdout.write(self.style.SUCCESS("=" * 60))
             self.stdout.write(self.style.SUCCESS("All seeders completed successfully!"))
@@ -0,0 +1,113 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from pokemon.models import Pokemon, PokemonType, TypeEffectiveness
+from utils.cache.constants import CACHE_PREFIX_POKEMON, CACHE_PREFIX_POKEMON_TYPE, CACHE_PREFIX_TYPE_EFFECTIVENESS
+from utils.cache.manager import batch_cache_invalidation, invalidate_cache_prefix
+from utils.third_party_services.PokemonAPI.dataset.client import DEFAULT_DATASET_PATH, LocalDatasetClient
+
+
+class Command(BaseCommand):
+    """
+    Seed types, type effectiveness and Pokemon from a dataset file, without PokeAPI.
+
+    Reads the bundled dataset (or `--path`, see `build_pokemon_dataset`) through
+    `LocalDatasetClient` and inserts whatever the database is missing with one bulk insert
+    per table, in a single transaction. Existing rows are left as they are, so it can run
+    on every start. `--count` limits the Pokemon to the first N Pokedex numbers.
+
+    Usage:
+        python manage.py seed_dataset
+        python manage.py seed_dataset --count 20
+        python manage.py seed_dataset --path /data/pokeapi.json
+    """
+
+    help = "Seed the Pokemon catalog from a dataset file"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=str(DEFAULT_DATASET_PATH),
+            help="Dataset file to load (default: the bundled dataset)",
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=None,
+            help="Number of Pokemon to seed (default: every Pokemon in the dataset)",
+        )
+
+    @batch_cache_invalidation()
+    def handle(self, *args, **options):
+        try:
+            client = LocalDatasetClient(options["path"])
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not load dataset: {e}") from e
+
+        pokedex_numbers = sorted(client.pokemon)[: options["count"]]
+        if options["count"] is not None and len(pokedex_numbers) < options["count"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"The dataset only has {len(pokedex_numbers)} Pokemon (requested: {options['count']})"
+                )
+            )
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            types_created = self._seed_types(client)
+            matchups_created = self._seed_type_effectiveness(client)
+            existing_numbers = set(
+                Pokemon.objects.filter(pokedex_number__in=pokedex_numbers).values_list("pokedex_number", flat=True)
+            )
+            pokemon_created = Pokemon.objects.bulk_create_from_pokemon_api(
+                [number for number in pokedex_numbers if number not in existing_numbers], client
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Dataset seeder completed in {(time.perf_counter() - started) * 1000:.0f} ms: "
+                f"{types_created} types, {matchups_created} type matchups and {len(pokemon_created)} Pokemon created "
+                f"(dataset built {client.built_at})"
+            )
+        )
+
+    def _seed_types(self, client: LocalDatasetClient) -> int:
+        existing = set(PokemonType.objects.values_list("name", flat=True))
+        created = PokemonType.objects.bulk_create(
+            [PokemonType(name=type_name) for type_name in client.get_all_types() if type_name not in existing]
+        )
+        if created:
+            # Bulk inserts send no post_save, so invalidate as the signal handler would
+            invalidate_cache_prefix(CACHE_PREFIX_POKEMON_TYPE)
+            invalidate_cache_prefix(CACHE_PREFIX_POKEMON)
+            invalidate_cache_prefix(CACHE_PREFIX_TYPE_EFFECTIVENESS)
+        return len(created)
+
+    def _seed_type_effectiveness(self, client: LocalDatasetClient) -> int:
+        types = {pokemon_type.name: pokemon_type for pokemon_type in PokemonType.objects.all()}
+        existing = set(TypeEffectiveness.objects.values_list("attacker_type_id", "defender_type_id"))
+        multipliers = {
+            "double_damage_to": TypeEffectiveness.SUPER_EFFECTIVE,
+            "half_damage_to": TypeEffectiveness.NOT_VERY_EFFECTIVE,
+            "no_damage_to": TypeEffectiveness.NO_EFFECT,
+        }
+
+        matchups = []
+        for attacker_name in client.get_all_types():
+            attacker = types[attacker_name]
+            relations = client.get_type_effectiveness(attacker_name) or {}
+            for relation, multiplier in multipliers.items():
+                for defender_name in relations.get(relation, []):
+                    defender = types.get(defender_name)
+                    if defender is None or (attacker.id, defender.id) in existing:
+                        continue
+                    matchups.append(
+                        TypeEffectiveness(attacker_type=attacker, defender_type=defender, multiplier=multiplier)
+                    )
+
+        created = TypeEffectiveness.objects.bulk_create(matchups)
+        if created:
+            invalidate_cache_prefix(CACHE_PREFIX_TYPE_EFFECTIVENESS)
+        return len(created)
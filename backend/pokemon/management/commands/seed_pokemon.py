@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 
 from pokemon.models import Pokemon, PokemonType
+from utils.cache.manager import batch_cache_invalidation
 from utils.third_party_services.PokemonAPI.pokeapi.client import PokeAPIClient
 
 
@@ -15,10 +16,11 @@ class Command(BaseCommand):
             help="Number of Pokemon to seed (default: 20)",
         )
 
+    @batch_cache_invalidation()
     def handle(self, *args, **options):
         count = options["count"]
         self.stdout.write(f"Starting Pokemon seeder (fetching {count} Pokemon)...")
-        client = PokeAPIClient()
+        client = PokeAPIClient.for_jobs()
 
         try:
             current_count = Pokemon.objects.count()
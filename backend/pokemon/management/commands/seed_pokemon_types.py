@@ -1,15 +1,17 @@
 from django.core.management.base import BaseCommand
 
 from pokemon.models import PokemonType
+from utils.cache.manager import batch_cache_invalidation
 from utils.third_party_services.PokemonAPI.pokeapi.client import PokeAPIClient
 
 
 class Command(BaseCommand):
     help = "Seed PokemonType model with data from PokeAPI"
 
+    @batch_cache_invalidation()
     def handle(self, *args, **options):
         self.stdout.write("Starting PokemonType seeder...")
-        client = PokeAPIClient()
+        client = PokeAPIClient.for_jobs()
 
         try:
             type_names = client.get_all_types()
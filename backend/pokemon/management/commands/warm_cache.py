@@ -0,0 +1,123 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.urls import resolve, reverse
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from players.models import Player
+from pokemon.models import Pokemon, PokemonType
+from utils.cache.constants import CACHE_PREFIXES
+from utils.cache.manager import invalidate_cache_prefix
+
+
+class Command(BaseCommand):
+    """
+    Prewarm the cached reference responses of the Pokemon API.
+
+    Requests every cacheable reference endpoint in-process, across the query-parameter
+    combinations clients use: the type list, the type chart (whole and per attacking type),
+    every page of the Pokemon list (unfiltered and per type), the starters and every Pokemon
+    detail. Requests run in parallel and bypass throttling; each one is reported with its
+    status and duration. Responses already cached are left as they are unless `--invalidate`
+    is given.
+
+    Cached pages embed absolute links, so responses are warmed for every `--host` (default:
+    the non-wildcard ALLOWED_HOSTS). They are keyed by negotiated media type, so one JSON
+    response per URL serves every client Accept header that resolves to JSON.
+
+    Usage:
+        python manage.py warm_cache
+        python manage.py warm_cache --workers 16 --host api.example.com
+        python manage.py warm_cache --invalidate
+    """
+
+    help = "Prewarm cached Pokemon reference responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Number of responses rebuilt in parallel (default: 8)",
+        )
+        parser.add_argument(
+            "--host",
+            action="append",
+            dest="hosts",
+            help="Host the responses are warmed for; repeatable (default: ALLOWED_HOSTS)",
+        )
+        parser.add_argument(
+            "--invalidate",
+            action="store_true",
+            help="Invalidate the cached responses first, so every response is rebuilt",
+        )
+
+    def handle(self, *args, **options):
+        hosts = options["hosts"] or [host for host in settings.ALLOWED_HOSTS if "*" not in host and host != ""]
+        if not hosts:
+            raise CommandError("No host to warm for; pass --host")
+
+        if options["invalidate"]:
+            for prefix in CACHE_PREFIXES:
+                invalidate_cache_prefix(prefix)
+
+        requests = [(path, host) for path in self.get_paths() for host in hosts]
+        self.stdout.write(f"Warming {len(requests)} responses with {options['workers']} workers...")
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            results = list(executor.map(lambda request: self.warm(*request), requests))
+        elapsed = time.perf_counter() - started
+
+        failed = 0
+        for (path, host), (status_code, seconds) in zip(requests, results, strict=True):
+            style = self.style.SUCCESS if status_code == 200 else self.style.ERROR
+            failed += status_code != 200
+            self.stdout.write(style(f"{status_code} {seconds * 1000:8.1f} ms  {host}{path}"))
+
+        summary = f"Warmed {len(requests) - failed}/{len(requests)} responses in {elapsed:.2f}s"
+        self.stdout.write(self.style.SUCCESS(summary) if not failed else self.style.WARNING(summary))
+
+    def get_paths(self) -> list[str]:
+        type_names = list(PokemonType.objects.order_by("name").values_list("name", flat=True))
+        pokemon_ids = list(Pokemon.objects.order_by("pokedex_number").values_list("id", flat=True))
+        pokemon_list = reverse("pokemon:pokemon-list")
+        type_chart = reverse("pokemon:type-effectiveness-list")
+        page_count = math.ceil(len(pokemon_ids) / settings.REST_FRAMEWORK["PAGE_SIZE"])
+
+        return [
+            reverse("pokemon:type-list"),
+            type_chart,
+            *[f"{type_chart}?attacker={name}" for name in type_names],
+            pokemon_list,
+            *[f"{pokemon_list}?page={page}" for page in range(2, page_count + 1)],
+            *[f"{pokemon_list}?type={name}" for name in type_names],
+            reverse("pokemon:pokemon-starters"),
+            *[reverse("pokemon:pokemon-detail", args=[pokemon_id]) for pokemon_id in pokemon_ids],
+        ]
+
+    def warm(self, path: str, host: str) -> tuple[int, float]:
+        """Run one request through its view and return the status code and duration."""
+        started = time.perf_counter()
+        try:
+            request = APIRequestFactory().get(path, HTTP_HOST=host)
+            # Reference responses are shared by every player; any authenticated user will do
+            force_authenticate(request, user=Player(username="cache-warmer"))
+            match = resolve(request.path_info)
+            view_class, initkwargs = match.func.cls, {**match.func.initkwargs, "throttle_classes": []}
+            if actions := getattr(match.func, "actions", None):
+                view = view_class.as_view(actions, **initkwargs)
+            else:
+                view = view_class.as_view(**initkwargs)
+            response = view(request, *match.args, **match.kwargs)
+            response.render()
+            return response.status_code, time.perf_counter() - started
+        except Exception as e:
+            self.stderr.write(f"Failed to warm {host}{path}: {e}")
+            return 500, time.perf_counter() - started
+        finally:
+            connections.close_all()
@@ -3,8 +3,8 @@ from typing import TYPE_CHECKING
 
 from django.db import models
 
-from utils.cache.constants import CACHE_PREFIX_POKEMON
-from utils.cache.manager import invalidate_cache_prefix
+from utils.cache.constants import CACHE_PREFIX_POKEMON, CACHE_PREFIX_POKEMON_TYPE
+from utils.cache.manager import batch_cache_invalidation, invalidate_cache_prefix
 
 if TYPE_CHECKING:
     from utils.third_party_services.PokemonAPI.base import BasePokemonClient
@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 class PokemonManager(models.Manager):
+    @batch_cache_invalidation()
     def bulk_create_from_pokemon_api(
         self, pokedex_numbers: list[int], client: "BasePokemonClient"
     ) -> list[models.Model]:
@@ -31,12 +32,8 @@ class PokemonManager(models.Manager):
         if not pokedex_numbers:
             return []
 
-        # Step 1: Get all pokemons that we should create
-        pokemon_data_list = []
-        for pokedex_number in pokedex_numbers:
-            pokemon_data = client.get_pokemon(pokedex_number)
-            if pokemon_data:
-                pokemon_data_list.append(pokemon_data)
+        # Step 1: Get all pokemons that we should create, fetched concurrently
+        pokemon_data_list = [pokemon_data for pokemon_data in client.get_pokemon_many(pokedex_numbers) if pokemon_data]
 
         if not pokemon_data_list:
             return []
@@ -57,6 +54,7 @@ class PokemonManager(models.Manager):
             for type_name in missing_type_names:
                 types_to_create.append(PokemonType(name=type_name))
             PokemonType.objects.bulk_create(types_to_create)
+            invalidate_cache_prefix(CACHE_PREFIX_POKEMON_TYPE)
 
         # Step 5: Get all types (existing + newly created) and create a mapping
         all_types = {type_obj.name: type_obj for type_obj in PokemonType.objects.filter(name__in=all_type_names)}
@@ -99,7 +97,7 @@ class PokemonManager(models.Manager):
                 )
             )
 
-        # Step 7: At last invalidate the pokemon cache
+        # Step 7: At last invalidate the pokemon cache (once, after the surrounding transaction commits)
         created_pokemon = []
         if pokemon_to_create:
             created_pokemon = self.bulk_create(pokemon_to_create)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from pokemon.models import Pokemon
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonTypeRecord:
+    id: UUID
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonRecord:
+    """Immutable copy of a `Pokemon` row and its types, as the battle engine reads it."""
+
+    id: UUID
+    pokedex_number: int
+    name: str
+    sprite_url: str
+    base_hp: int
+    base_attack: int
+    base_defense: int
+    base_speed: int
+    primary_type: PokemonTypeRecord
+    secondary_type: PokemonTypeRecord | None
+
+    @classmethod
+    def from_model(cls, pokemon: Pokemon) -> PokemonRecord:
+        secondary_type = pokemon.secondary_type
+        return cls(
+            id=pokemon.id,
+            pokedex_number=pokemon.pokedex_number,
+            name=pokemon.name,
+            sprite_url=pokemon.sprite_url,
+            base_hp=pokemon.base_hp,
+            base_attack=pokemon.base_attack,
+            base_defense=pokemon.base_defense,
+            base_speed=pokemon.base_speed,
+            primary_type=PokemonTypeRecord(pokemon.primary_type.id, pokemon.primary_type.name),
+            secondary_type=PokemonTypeRecord(secondary_type.id, secondary_type.name) if secondary_type else None,
+        )
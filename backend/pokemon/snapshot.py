@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from django.conf import settings
+
+from pokemon.models import Pokemon, PokemonType, TypeEffectiveness
+from pokemon.records import PokemonRecord, PokemonTypeRecord
+from utils.cache.constants import CACHE_PREFIX_POKEMON, CACHE_PREFIX_TYPE_EFFECTIVENESS
+from utils.cache.manager import get_cache_generation
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PKCS"
+FORMAT_VERSION = 1
+NO_TYPE = 0xFFFF
+
+# magic, format version, reserved, built at (ns), Pokemon and type effectiveness cache generations,
+# type count, Pokemon count, then the offsets of the type, Pokemon, chart and string sections and the string size
+HEADER = struct.Struct("<4sHHqqqIIIIIII")
+# id, name offset, name length
+TYPE = struct.Struct("<16sIH")
+# id, pokedex number, hp, attack, defense, speed, primary and secondary type index, name and sprite URL offset/length
+POKEMON = struct.Struct("<16sIHHHHHHIHIH")
+# One multiplier per (attacker, defender) type index pair, NaN where there is no matchup
+MULTIPLIER = struct.Struct("<f")
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotInfo:
+    path: Path
+    size: int
+    types: int
+    pokemon: int
+    matchups: int
+
+
+class TypeChartView(Mapping):
+    """
+    Read-only `{(attacker type name, defender type name): multiplier}` mapping over a snapshot.
+
+    Multipliers are unpacked from the mapped file on access, nothing is copied up front.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot):
+        self._snapshot = snapshot
+
+    def __getitem__(self, matchup: tuple[str, str]) -> float:
+        type_indexes = self._snapshot.type_indexes
+        try:
+            attacker, defender = type_indexes[matchup[0]], type_indexes[matchup[1]]
+        except (KeyError, TypeError, IndexError):
+            raise KeyError(matchup) from None
+        multiplier = self._snapshot.multiplier(attacker, defender)
+        if math.isnan(multiplier):
+            raise KeyError(matchup)
+        return multiplier
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        names = [record.name for record in self._snapshot.types]
+        for attacker, attacker_name in enumerate(names):
+            for defender, defender_name in enumerate(names):
+                if not math.isnan(self._snapshot.multiplier(attacker, defender)):
+                    yield attacker_name, defender_name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class CatalogSnapshot:
+    """
+    Read-only, memory-mapped view of a catalog snapshot file.
+
+    The file holds fixed-size Pokemon rows sorted by id, the types, the full type chart
+    and a UTF-8 string section (see `write_snapshot`). Every worker process maps the same
+    file, so the kernel shares its pages between them; rows are unpacked on lookup.
+
+    Raises:
+        ValueError: If the file is not a snapshot of the supported format
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as snapshot_file:
+            self._buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < HEADER.size:
+            raise ValueError(f"{self.path} is not a catalog snapshot")
+        (
+            magic,
+            format_version,
+            _,
+            self.built_at,
+            self.pokemon_generation,
+            self.type_effectiveness_generation,
+            self.type_count,
+            self.pokemon_count,
+            self._types_offset,
+            self._pokemon_offset,
+            self._chart_offset,
+            self._strings_offset,
+            strings_size,
+        ) = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} catalog snapshot")
+        if len(self._buffer) != self._strings_offset + strings_size:
+            raise ValueError(f"{self.path} is truncated")
+
+        # A handful of types: decoded once and shared by every record
+        self.types = []
+        for index in range(self.type_count):
+            type_id, name_offset, name_length = TYPE.unpack_from(self._buffer, self._types_offset + index * TYPE.size)
+            self.types.append(PokemonTypeRecord(UUID(bytes=type_id), self._string(name_offset, name_length)))
+        self.type_indexes = {record.name: index for index, record in enumerate(self.types)}
+        self.type_chart = TypeChartView(self)
+
+    def get_pokemon(self, pokemon_id) -> PokemonRecord | None:
+        """Return the `PokemonRecord` of a Pokemon, or None when the snapshot does not have it."""
+        target = (pokemon_id if isinstance(pokemon_id, UUID) else UUID(str(pokemon_id))).bytes
+        low, high = 0, self.pokemon_count
+        while low < high:
+            middle = (low + high) // 2
+            offset = self._pokemon_offset + middle * POKEMON.size
+            row_id = self._buffer[offset : offset + 16]
+            if row_id < target:
+                low = middle + 1
+            elif row_id > target:
+                high = middle
+            else:
+                (
+                    _,
+                    pokedex_number,
+                    base_hp,
+                    base_attack,
+                    base_defense,
+                    base_speed,
+                    primary_type,
+                    secondary_type,
+                    name_offset,
+                    name_length,
+                    sprite_offset,
+                    sprite_length,
+                ) = POKEMON.unpack_from(self._buffer, offset)
+                return PokemonRecord(
+                    id=UUID(bytes=target),
+                    pokedex_number=pokedex_number,
+                    name=self._string(name_offset, name_length),
+                    sprite_url=self._string(sprite_offset, sprite_length),
+                    base_hp=base_hp,
+                    base_attack=base_attack,
+                    base_defense=base_defense,
+                    base_speed=base_speed,
+                    primary_type=self.types[primary_type],
+                    secondary_type=None if secondary_type == NO_TYPE else self.types[secondary_type],
+                )
+        return None
+
+    def multiplier(self, attacker: int, defender: int) -> float:
+        """Multiplier of a matchup by type index; NaN when the chart has no entry for it."""
+        return MULTIPLIER.unpack_from(
+            self._buffer, self._chart_offset + (attacker * self.type_count + defender) * MULTIPLIER.size
+        )[0]
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buffer[start : start + length].decode()
+
+
+def write_snapshot(path) -> SnapshotInfo:
+    """
+    Compile the Pokemon, type and type effectiveness tables into a snapshot file at `path`.
+
+    The file is written next to `path` and renamed over it, so readers see either the
+    previous snapshot or the complete new one. The cache generations are read before the
+    tables: a change committed while the snapshot is built leaves it marked stale.
+    """
+    path = Path(path)
+    pokemon_generation = get_cache_generation(CACHE_PREFIX_POKEMON)
+    type_effectiveness_generation = get_cache_generation(CACHE_PREFIX_TYPE_EFFECTIVENESS)
+
+    strings = bytearray()
+
+    def add_string(value: str) -> tuple[int, int]:
+        encoded = value.encode()
+        offset = len(strings)
+        strings.extend(encoded)
+        return offset, len(encoded)
+
+    types = list(PokemonType.objects.order_by("name").values_list("id", "name"))
+    if len(types) >= NO_TYPE:
+        raise ValueError(f"A snapshot holds at most {NO_TYPE - 1} types")
+    type_indexes = {type_id: index for index, (type_id, _) in enumerate(types)}
+    type_rows = b"".join(TYPE.pack(type_id.bytes, *add_string(name)) for type_id, name in types)
+
+    pokemon_rows = bytearray()
+    pokemon = Pokemon.objects.values_list(
+        "id",
+        "pokedex_number",
+        "base_hp",
+        "base_attack",
+        "base_defense",
+        "base_speed",
+        "primary_type_id",
+        "secondary_type_id",
+        "name",
+        "sprite_url",
+    )
+    for row in sorted(pokemon, key=lambda row: row[0].bytes):
+        pokemon_id, pokedex_number, hp, attack, defense, speed, primary_type, secondary_type, name, sprite_url = row
+        pokemon_rows += POKEMON.pack(
+            pokemon_id.bytes,
+            pokedex_number,
+            hp,
+            attack,
+            defense,
+            speed,
+            type_indexes[primary_type],
+            NO_TYPE if secondary_type is None else type_indexes[secondary_type],
+            *add_string(name),
+            *add_string(sprite_url),
+        )
+
+    chart = [math.nan] * (len(types) * len(types))
+    matchups = TypeEffectiveness.objects.values_list("attacker_type_id", "defender_type_id", "multiplier")
+    for attacker, defender, multiplier in matchups:
+        chart[type_indexes[attacker] * len(types) + type_indexes[defender]] = multiplier
+    chart_rows = struct.pack(f"<{len(chart)}f", *chart)
+
+    types_offset = HEADER.size
+    pokemon_offset = types_offset + len(type_rows)
+    chart_offset = pokemon_offset + len(pokemon_rows)
+    strings_offset = chart_offset + len(chart_rows)
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        time.time_ns(),
+        pokemon_generation,
+        type_effectiveness_generation,
+        len(types),
+        len(pokemon_rows) // POKEMON.size,
+        types_offset,
+        pokemon_offset,
+        chart_offset,
+        strings_offset,
+        len(strings),
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            for section in (header, type_rows, pokemon_rows, chart_rows, strings):
+                snapshot_file.write(section)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+    return SnapshotInfo(
+        path=path,
+        size=strings_offset + len(strings),
+        types=len(types),
+        pokemon=len(pokemon_rows) // POKEMON.size,
+        matchups=sum(not math.isnan(multiplier) for multiplier in chart),
+    )
+
+
+class _SnapshotState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.file_key = None
+        self.checked_at = -math.inf
+
+
+_state = _SnapshotState()
+
+
+def get_snapshot() -> CatalogSnapshot | None:
+    """
+    Return this process' mapping of the snapshot at CATALOG_SNAPSHOT_PATH, or None.
+
+    The file is stat'ed at most every CATALOG_SNAPSHOT_CHECK_INTERVAL seconds and mapped
+    again when it was replaced. Requests still reading the previous mapping keep it until
+    they drop it. Returns None when no path is configured or the file is missing or invalid.
+    Callers must still check the snapshot's generations against the cache's.
+    """
+    path = settings.CATALOG_SNAPSHOT_PATH
+    if not path:
+        return None
+    if time.monotonic() - _state.checked_at < settings.CATALOG_SNAPSHOT_CHECK_INTERVAL:
+        return _state.snapshot
+
+    with _state.lock:
+        if time.monotonic() - _state.checked_at < settings.CATALOG_SNAPSHOT_CHECK_INTERVAL:
+            return _state.snapshot
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            _state.snapshot, _state.file_key = None, None
+        else:
+            file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if file_key != _state.file_key:
+                try:
+                    _state.snapshot = CatalogSnapshot(path)
+                except (OSError, ValueError):
+                    logger.exception("Failed to map catalog snapshot: %s", path)
+                    _state.snapshot = None
+                _state.file_key = file_key
+        _state.checked_at = time.monotonic()
+        return _state.snapshot
@@ -1,8 +1,27 @@
+import time
+from io import StringIO
+
+import httpx
 import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
 from django.urls import reverse
 from rest_framework import status
 
-from pokemon.models import Pokemon
+from pokemon.models import Pokemon, PokemonType, TypeEffectiveness
+from utils.metrics import metrics
+from utils.third_party_services.PokemonAPI.dataset.builder import build_dataset, write_dataset
+from utils.third_party_services.PokemonAPI.dataset.client import LocalDatasetClient
+from utils.third_party_services.PokemonAPI.pokeapi.circuit_breaker import (
+    CLOSED,
+    OPEN,
+    STATE_VALUES,
+    CircuitOpenError,
+    pokeapi_circuit_breaker,
+)
+from utils.third_party_services.PokemonAPI.pokeapi.client import PokeAPIClient, close_http_client, get_http_client
+from utils.third_party_services.PokemonAPI.pokeapi.local_server import LocalPokeAPIServer
+from utils.third_party_services.PokemonAPI.pokeapi.response_cache import ResponseCache
 
 
 @pytest.mark.django_db
@@ -268,3 +287,337 @@ class TestPokeAPIChoicesGET:
 
         assert response.status_code == status.HTTP_200_OK
         assert json_response == []
+
+
+class TestPokeAPIClientConnectionPool:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        close_http_client()
+        with LocalPokeAPIServer() as server:
+            self.server = server
+            self.client = PokeAPIClient(base_url=server.base_url)
+            yield
+        close_http_client()
+
+    def test_requests_reuse_one_keep_alive_connection(self):
+        for pokedex_number in range(1, 11):
+            self.client.get_pokemon(pokedex_number)
+        self.client.get_all_types()
+
+        assert self.server.requests == 11
+        assert self.server.connections == 1
+
+    def test_clients_share_the_process_connection_pool(self):
+        self.client.get_pokemon(1)
+        PokeAPIClient(base_url=self.server.base_url).get_type("fire")
+
+        assert self.server.connections == 1
+
+    def test_responses_are_parsed(self):
+        pokemon = self.client.get_pokemon(4)
+
+        assert pokemon == {
+            "pokedex_number": 4,
+            "name": "pokemon-4",
+            "sprite_url": "https://example.com/sprites/4.png",
+            "types": ["electric"],
+            "stats": {"hp": 44, "attack": 44, "defense": 44, "speed": 44},
+        }
+        assert self.client.get_pokemon(0) is None
+        assert self.client.get_all_types() == ["normal", "fire", "water", "grass", "electric"]
+        assert self.client.get_type_effectiveness("electric")["double_damage_to"] == ["water"]
+
+    def test_close_http_client_closes_pooled_connections(self):
+        self.client.get_pokemon(1)
+        pooled_client = get_http_client()
+
+        close_http_client()
+        self.client.get_pokemon(2)
+
+        assert pooled_client.is_closed
+        assert get_http_client() is not pooled_client
+        assert self.server.connections == 2
+
+
+class TestPokeAPIClientBatchFetch:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        close_http_client()
+        with LocalPokeAPIServer(latency=0.05) as server:
+            self.server = server
+            self.client = PokeAPIClient(base_url=server.base_url)
+            yield
+        close_http_client()
+
+    def test_get_pokemon_many_returns_results_in_order(self):
+        pokemon = self.client.get_pokemon_many([3, 0, 1])
+
+        assert [data and data["pokedex_number"] for data in pokemon] == [3, None, 1]
+
+    def test_get_pokemon_many_fetches_a_page_concurrently(self):
+        started = time.perf_counter()
+        pokemon = self.client.get_pokemon_many(list(range(1, 51)))
+        seconds = time.perf_counter() - started
+
+        assert [data["pokedex_number"] for data in pokemon] == list(range(1, 51))
+        assert seconds < 50 * self.server.latency / 5
+
+    def test_get_pokemon_many_bounds_concurrency(self):
+        self.client.get_pokemon_many(list(range(1, 21)), max_workers=4)
+
+        assert self.server.requests == 20
+        assert self.server.connections == 4
+
+
+class TestPokeAPIResponseCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, tmp_path):
+        settings.POKEAPI_CACHE_TTL = 3600
+        self.settings = settings
+        self.cache_path = tmp_path / "pokeapi-cache.sqlite3"
+        close_http_client()
+        with LocalPokeAPIServer() as server:
+            self.server = server
+            self.client = PokeAPIClient(base_url=server.base_url, response_cache=ResponseCache(self.cache_path))
+            yield
+        close_http_client()
+
+    def test_fresh_responses_are_served_without_a_request(self):
+        first = self.client.get_pokemon(4)
+        second = self.client.get_pokemon(4)
+
+        assert second == first
+        assert self.server.requests == 1
+
+    def test_cache_is_shared_by_clients_using_the_same_file(self):
+        self.client.get_type_effectiveness("electric")
+        other_client = PokeAPIClient(base_url=self.server.base_url, response_cache=ResponseCache(self.cache_path))
+
+        assert other_client.get_type_effectiveness("electric")["double_damage_to"] == ["water"]
+        assert other_client.get_type("electric") == {"name": "electric"}
+        assert self.server.requests == 1
+
+    def test_expired_responses_are_revalidated(self):
+        self.settings.POKEAPI_CACHE_TTL = 0
+        first = self.client.get_pokemon(4)
+        self.settings.POKEAPI_CACHE_TTL = 3600
+
+        assert self.client.get_pokemon(4) == first
+        assert self.client.get_pokemon(4) == first
+        assert self.server.requests == 2
+        assert self.server.not_modified == 1
+
+    def test_identical_bodies_are_stored_once(self):
+        by_number = self.client.get_pokemon(4)
+        by_name = self.client.get_pokemon_by_name("pokemon-4")
+
+        assert by_name == by_number
+        stats = self.client.response_cache.stats()
+        assert stats["responses"] == 2
+        assert stats["bodies"] == 1
+
+    def test_error_responses_are_not_cached(self):
+        assert self.client.get_pokemon(0) is None
+        assert self.client.get_pokemon(0) is None
+        assert self.server.requests == 2
+        assert self.client.response_cache.stats()["responses"] == 0
+
+    def test_pokeapi_cache_command_reports_and_clears(self):
+        self.settings.POKEAPI_CACHE_PATH = str(self.cache_path)
+        self.client.get_pokemon(1)
+        self.client.get_pokemon(2)
+        stdout = StringIO()
+
+        call_command("pokeapi_cache", stdout=stdout)
+        call_command("pokeapi_cache", "--clear", stdout=stdout)
+
+        assert "2 responses (2 fresh), 2 bodies" in stdout.getvalue()
+        assert self.client.response_cache.stats()["responses"] == 0
+
+
+class TestLocalDatasetClient:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = LocalDatasetClient()
+
+    def test_bundled_dataset_answers_like_pokeapi(self):
+        assert self.client.get_pokemon(25) is None
+        assert self.client.get_pokemon(6) == {
+            "pokedex_number": 6,
+            "name": "charizard",
+            "sprite_url": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6.png",
+            "types": ["fire", "flying"],
+            "stats": {"hp": 78, "attack": 84, "defense": 78, "speed": 100},
+        }
+        assert self.client.get_pokemon_by_name("Charizard") == self.client.get_pokemon_by_name("6")
+        assert len(self.client.get_all_types()) == 18
+        assert self.client.get_type("fairy") == {"name": "fairy"}
+        assert self.client.get_type("shadow") is None
+        assert self.client.get_type_effectiveness("electric") == {
+            "double_damage_to": ["flying", "water"],
+            "half_damage_to": ["grass", "electric", "dragon"],
+            "no_damage_to": ["ground"],
+        }
+
+    def test_built_dataset_round_trips(self, tmp_path):
+        close_http_client()
+        with LocalPokeAPIServer() as server:
+            pokeapi_client = PokeAPIClient(base_url=server.base_url)
+            dataset = build_dataset(pokeapi_client, pokemon_count=12, source=server.base_url)
+            write_dataset(tmp_path / "dataset.json", dataset)
+            dataset_client = LocalDatasetClient(tmp_path / "dataset.json")
+
+            assert dataset_client.get_all_types() == pokeapi_client.get_all_types()
+            for pokedex_number in range(1, 13):
+                assert dataset_client.get_pokemon(pokedex_number) == pokeapi_client.get_pokemon(pokedex_number)
+            assert dataset_client.get_type_effectiveness("water") == pokeapi_client.get_type_effectiveness("water")
+        close_http_client()
+
+    def test_other_files_are_rejected(self, tmp_path):
+        (tmp_path / "dataset.json").write_text('{"format": 0}')
+
+        with pytest.raises(ValueError):
+            LocalDatasetClient(tmp_path / "dataset.json")
+
+
+@pytest.mark.django_db
+class TestSeedDataset:
+    def test_seed_all_loads_the_dataset_with_bulk_inserts(self, django_assert_max_num_queries):
+        with django_assert_max_num_queries(20):
+            call_command("seed_all", "--dataset", "--pokemon-count", "20", stdout=StringIO())
+
+        client = LocalDatasetClient()
+        assert set(client.get_all_types()) <= set(PokemonType.objects.values_list("name", flat=True))
+        assert set(range(1, 21)) <= set(Pokemon.objects.values_list("pokedex_number", flat=True))
+        assert Pokemon.objects.get(pokedex_number=1).secondary_type.name == "poison"
+        chart = {
+            (attacker, defender): multiplier
+            for attacker, defender, multiplier in TypeEffectiveness.objects.values_list(
+                "attacker_type__name", "defender_type__name", "multiplier"
+            )
+        }
+        assert chart[("ghost", "normal")] == TypeEffectiveness.NO_EFFECT
+        assert chart[("dragon", "dragon")] == TypeEffectiveness.SUPER_EFFECTIVE
+        assert chart[("steel", "water")] == TypeEffectiveness.NOT_VERY_EFFECTIVE
+
+    def test_seed_dataset_only_adds_missing_rows(self):
+        call_command("seed_dataset", "--count", "10", stdout=StringIO())
+        counts = (PokemonType.objects.count(), TypeEffectiveness.objects.count(), Pokemon.objects.count())
+        stdout = StringIO()
+
+        call_command("seed_dataset", "--count", "10", stdout=stdout)
+
+        assert (PokemonType.objects.count(), TypeEffectiveness.objects.count(), Pokemon.objects.count()) == counts
+        assert "0 types, 0 type matchups and 0 Pokemon created" in stdout.getvalue()
+
+    def test_seed_dataset_rejects_invalid_files(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("seed_dataset", "--path", str(tmp_path / "missing.json"), stdout=StringIO())
+
+
+class TestPokeAPICircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        settings.POKEAPI_CIRCUIT_FAILURE_THRESHOLD = 3
+        settings.POKEAPI_CIRCUIT_RESET_TIMEOUT = 60
+        settings.POKEAPI_RETRY_BACKOFF = 0.01
+        self.settings = settings
+        cache.clear()
+        metrics.reset()
+        close_http_client()
+        with LocalPokeAPIServer() as server:
+            self.server = server
+            self.client = PokeAPIClient(base_url=server.base_url)
+            yield
+        close_http_client()
+        cache.clear()
+
+    def _fail(self, times):
+        self.server.fail_next = times
+        for _ in range(times):
+            with pytest.raises(httpx.HTTPStatusError):
+                self.client.get_pokemon(1)
+
+    def _state_gauge(self):
+        return metrics.gauges()['circuit_breaker_state{circuit="pokeapi"}']
+
+    def test_failures_open_the_circuit_and_calls_fail_fast(self):
+        self._fail(3)
+
+        with pytest.raises(CircuitOpenError):
+            self.client.get_pokemon(1)
+        assert pokeapi_circuit_breaker.state == OPEN
+        assert self.server.requests == 3
+        assert self._state_gauge() == STATE_VALUES[OPEN]
+        assert metrics.snapshot()['circuit_breaker_rejections{circuit="pokeapi"}'] == 1
+
+    def test_successful_probe_closes_the_circuit(self):
+        self.settings.POKEAPI_CIRCUIT_RESET_TIMEOUT = 0
+        self._fail(3)
+
+        assert self.client.get_pokemon(1)["pokedex_number"] == 1
+        assert pokeapi_circuit_breaker.state == CLOSED
+        assert self._state_gauge() == STATE_VALUES[CLOSED]
+
+    def test_failed_probe_reopens_the_circuit(self):
+        self.settings.POKEAPI_CIRCUIT_RESET_TIMEOUT = 0
+        self._fail(3)
+        self.settings.POKEAPI_CIRCUIT_RESET_TIMEOUT = 60
+
+        self._fail(1)
+
+        assert pokeapi_circuit_breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            self.client.get_pokemon(1)
+
+    def test_request_path_calls_are_bounded_by_the_timeout(self):
+        self.server.latency = 1.0
+        started = time.perf_counter()
+
+        with pytest.raises(httpx.TimeoutException):
+            PokeAPIClient(base_url=self.server.base_url, timeout=0.1).get_pokemon(1)
+
+        assert time.perf_counter() - started < 0.5
+
+    def test_job_client_retries_transient_failures(self):
+        self.server.fail_next = 2
+
+        pokemon = PokeAPIClient.for_jobs(base_url=self.server.base_url).get_pokemon(1)
+
+        assert pokemon["pokedex_number"] == 1
+        assert self.server.requests == 3
+
+    def test_job_client_stops_retrying_at_its_deadline(self):
+        self.settings.POKEAPI_RETRY_BACKOFF = 0.05
+        self.server.fail_next = 1000
+        client = PokeAPIClient.for_jobs(base_url=self.server.base_url, retries=1000, deadline=0.3)
+        started = time.perf_counter()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_pokemon(1)
+
+        assert time.perf_counter() - started < 0.6
+        assert 1 < self.server.requests < 1000
+
+    def test_job_client_is_not_failed_fast(self):
+        self._fail(3)
+
+        pokemon = PokeAPIClient.for_jobs(base_url=self.server.base_url).get_pokemon(1)
+
+        assert pokemon["pokedex_number"] == 1
+
+    @pytest.mark.django_db
+    def test_views_answer_without_upstream_while_the_circuit_is_open(self, api_client, create_player):
+        self.settings.POKEAPI_BASE_URL = self.server.base_url
+        api_client.force_authenticate(user=create_player(username="testuser", password="TestPass123!"))
+        self._fail(3)
+
+        search = api_client.get(reverse("pokemon:pokeapi-search", kwargs={"search": "pikachu"}))
+        listing = api_client.get(reverse("pokemon:pokeapi-list-pokemon"), data={"offset": 5000, "limit": 5})
+
+        assert search.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert search.json() == {"message": "Pokemon search is temporarily unavailable. Please try again later."}
+        assert listing.status_code == status.HTTP_200_OK
+        assert listing.json()["results"] == []
+        assert self.server.requests == 3
@@ -0,0 +1,562 @@
+import dataclasses
+import math
+import time
+import zlib
+from functools import partial
+from io import StringIO
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.http import HttpRequest
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.throttling import UserRateThrottle
+
+from pokemon import snapshot as catalog_snapshot
+from pokemon.cache import get_player_pokemon, get_pokemon, get_type_chart
+from pokemon.models import Pokemon, PokemonType, TypeEffectiveness
+from pokemon.records import PokemonRecord
+from pokemon.snapshot import CatalogSnapshot, write_snapshot
+from utils.cache.constants import CACHE_PREFIX_POKEMON, CACHE_PREFIX_POKEMON_TYPE, CACHE_PREFIX_TYPE_EFFECTIVENESS
+from utils.cache.manager import (
+    batch_cache_invalidation,
+    cache_stats,
+    get_cache_generation,
+    invalidate_cache_prefix,
+    view_cache_key,
+)
+from utils.cache.tiered import InvalidationListener, LocalLRUCache, key_namespace
+from utils.metrics import histogram_quantile, metrics, render_prometheus
+from utils.third_party_services.PokemonAPI.base import BasePokemonClient
+
+
+def _json_request(path, **extra):
+    """A request as the cached views see it once DRF has negotiated JSON."""
+    request = RequestFactory().get(path, **extra)
+    request.accepted_media_type = "application/json"
+    return request
+
+
+@pytest.mark.django_db
+class TestGenerationCacheInvalidation:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, api_client, shared_test_player, global_pokemon_data):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.client = api_client
+        self.client.force_authenticate(user=shared_test_player)
+        self.url = reverse("pokemon:type-list")
+
+    def test_cached_page_is_served_without_queries(self, django_assert_num_queries):
+        self.client.get(self.url)
+
+        with django_assert_num_queries(0):
+            response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_invalidation_bumps_only_the_prefix_generation(self):
+        type_generation = get_cache_generation(CACHE_PREFIX_POKEMON_TYPE)
+        pokemon_generation = get_cache_generation(CACHE_PREFIX_POKEMON)
+
+        invalidate_cache_prefix(CACHE_PREFIX_POKEMON_TYPE)
+
+        assert get_cache_generation(CACHE_PREFIX_POKEMON_TYPE) == type_generation + 1
+        assert get_cache_generation(CACHE_PREFIX_POKEMON) == pokemon_generation
+
+    def test_saving_a_type_serves_fresh_pages(self):
+        self.client.get(self.url)
+
+        PokemonType.objects.create(name="cosmic")
+        response = self.client.get(self.url)
+
+        assert "cosmic" in [entry["name"] for entry in response.json()]
+
+
+@pytest.mark.django_db
+class TestBatchCacheInvalidation:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, django_capture_on_commit_callbacks):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.capture_on_commit_callbacks = django_capture_on_commit_callbacks
+        self.prefixes = [CACHE_PREFIX_POKEMON, CACHE_PREFIX_POKEMON_TYPE, CACHE_PREFIX_TYPE_EFFECTIVENESS]
+        self.generations = self._generations()
+
+    def _generations(self):
+        return [get_cache_generation(prefix) for prefix in self.prefixes]
+
+    def test_each_prefix_is_invalidated_once_after_commit(self):
+        with self.capture_on_commit_callbacks() as callbacks:
+            with batch_cache_invalidation():
+                for name in ("cosmic", "shadow", "crystal"):
+                    PokemonType.objects.create(name=name)
+            assert self._generations() == self.generations
+
+        for callback in callbacks:
+            callback()
+
+        assert len(callbacks) == 1
+        assert self._generations() == [generation + 1 for generation in self.generations]
+
+    def test_nested_blocks_flush_once(self):
+        with self.capture_on_commit_callbacks(execute=True) as callbacks:
+            with batch_cache_invalidation():
+                with batch_cache_invalidation():
+                    invalidate_cache_prefix(CACHE_PREFIX_POKEMON)
+                invalidate_cache_prefix(CACHE_PREFIX_POKEMON)
+
+        assert len(callbacks) == 1
+        assert self._generations()[0] == self.generations[0] + 1
+
+    def test_bulk_create_from_pokemon_api_invalidates_once(self, create_pokemon_type):
+        create_pokemon_type(name="electric")
+        client = Mock()
+        client.get_pokemon.side_effect = lambda number: {
+            "pokedex_number": number,
+            "name": f"pokemon-{number}",
+            "sprite_url": "",
+            "types": ["electric"],
+            "stats": {"hp": 35, "attack": 55, "defense": 40, "speed": 90},
+        }
+        client.get_pokemon_many.side_effect = partial(BasePokemonClient.get_pokemon_many, client)
+        self.generations = self._generations()
+
+        with self.capture_on_commit_callbacks(execute=True) as callbacks:
+            created = Pokemon.objects.bulk_create_from_pokemon_api([9001, 9002, 9003], client)
+
+        assert len(created) == 3
+        assert len(callbacks) == 1
+        assert self._generations()[0] == self.generations[0] + 1
+
+
+class _InlineThread:
+    """Runs the background refresh synchronously."""
+
+    def __init__(self, target, args=(), kwargs=None, **options):
+        self.target, self.args, self.kwargs = target, args, kwargs or {}
+
+    def start(self):
+        self.target(*self.args, **self.kwargs)
+
+
+@pytest.mark.django_db
+class TestCachedViewRegeneration:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, api_client, shared_test_player, global_pokemon_data):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.client = api_client
+        self.client.force_authenticate(user=shared_test_player)
+        self.url = reverse("pokemon:type-list")
+        self.client.get(self.url)
+
+    def _key(self):
+        generation = get_cache_generation(CACHE_PREFIX_POKEMON_TYPE)
+        return view_cache_key(CACHE_PREFIX_POKEMON_TYPE, generation, _json_request(self.url))
+
+    def _names(self, response):
+        return [entry["name"] for entry in response.json()]
+
+    def test_miss_during_regeneration_serves_the_previous_generation(self):
+        PokemonType.objects.create(name="cosmic")
+        cache.add(f"{self._key()}:lock", 1)
+
+        assert "cosmic" not in self._names(self.client.get(self.url))
+
+        cache.delete(f"{self._key()}:lock")
+        assert "cosmic" in self._names(self.client.get(self.url))
+
+    def test_soft_expired_response_is_served_stale_and_refreshed_in_background(self):
+        key = self._key()
+        cache.set(key, (0, *cache.get(key)[1:]))
+        # Written without signals, so only the refresh can pick it up
+        PokemonType.objects.bulk_create([PokemonType(name="cosmic")])
+
+        with (
+            patch("utils.cache.manager.threading.Thread", _InlineThread),
+            patch("utils.cache.manager.connections") as connections,
+            patch("utils.cache.manager.close_old_connections"),
+        ):
+            stale = self.client.get(self.url)
+
+        assert "cosmic" not in self._names(stale)
+        assert "cosmic" in self._names(self.client.get(self.url))
+        assert cache.get(f"{key}:lock") is None
+        connections.close_all.assert_called_once()
+
+    def test_background_refresh_runs_the_view_on_a_copy_of_the_request(self, shared_test_player):
+        key = self._key()
+        cache.set(key, (0, *cache.get(key)[1:]))
+
+        with patch("utils.cache.manager.threading.Thread") as thread:
+            response = self.client.get(self.url)
+
+        _, refresh_request = thread.call_args.kwargs["args"]
+        assert type(refresh_request) is HttpRequest
+        assert refresh_request is not response.wsgi_request
+        assert refresh_request.GET is not response.wsgi_request.GET
+        assert refresh_request.cache_refresh_key == key
+        assert refresh_request.user == shared_test_player
+        assert not hasattr(refresh_request, "_force_auth_user")
+        thread.return_value.start.assert_called_once()
+
+    def test_background_refresh_does_not_spend_the_throttle_quota(self):
+        key = self._key()
+        cache.set(key, (0, *cache.get(key)[1:]))
+
+        with (
+            patch("utils.cache.manager.threading.Thread", _InlineThread),
+            patch("utils.cache.manager.connections"),
+            patch("utils.cache.manager.close_old_connections"),
+            patch.object(UserRateThrottle, "allow_request", return_value=True) as allow_request,
+        ):
+            response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert cache.get(key)[0] > time.time()
+        allow_request.assert_called_once()
+
+
+@pytest.mark.django_db
+class TestPayloadCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, api_client, shared_test_player, global_pokemon_data):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.client = api_client
+        self.client.force_authenticate(user=shared_test_player)
+        self.url = reverse("pokemon:pokemon-list")
+
+    def test_equivalent_requests_share_one_entry(self, django_assert_num_queries):
+        first = self.client.get(f"{self.url}?type=fire&page=1", HTTP_ACCEPT="*/*")
+
+        with django_assert_num_queries(0):
+            second = self.client.get(f"{self.url}?page=1&type=fire", HTTP_ACCEPT="application/json, text/plain, */*")
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert second["Content-Type"] == "application/json"
+
+    def test_body_is_stored_compressed(self):
+        response = self.client.get(self.url)
+
+        generation = get_cache_generation(CACHE_PREFIX_POKEMON)
+        _, status_code, content_type, body = cache.get(
+            view_cache_key(CACHE_PREFIX_POKEMON, generation, _json_request(self.url))
+        )
+        assert (status_code, content_type) == (200, "application/json")
+        assert zlib.decompress(body) == response.content
+        assert len(body) < len(response.content)
+
+    def test_cache_memory_requires_redis(self):
+        with pytest.raises(CommandError):
+            call_command("cache_memory")
+
+
+@pytest.mark.django_db
+class TestCacheMetrics:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, api_client, shared_test_player, global_pokemon_data):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        metrics.reset()
+        self.client = api_client
+        self.client.force_authenticate(user=shared_test_player)
+        self.url = reverse("pokemon:type-list")
+
+    def test_hits_misses_fills_and_invalidations_are_counted_per_prefix(self):
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.client.get(self.url)
+        invalidate_cache_prefix(CACHE_PREFIX_POKEMON_TYPE)
+
+        stats = cache_stats()[CACHE_PREFIX_POKEMON_TYPE]
+
+        assert (stats["hits"], stats["misses"], stats["fills"], stats["invalidations"]) == (2, 1, 1, 1)
+        assert stats["hit_ratio"] == 2 / 3
+        assert stats["fill_p95"] > 0
+        assert cache_stats()[CACHE_PREFIX_POKEMON]["misses"] == 0
+
+    def test_metrics_endpoint_serves_prometheus_text(self, settings):
+        settings.METRICS_TOKEN = "scraper-secret"
+        self.client.get(self.url)
+
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer scraper-secret")
+
+        body = response.content.decode()
+        assert response["Content-Type"].startswith("text/plain")
+        assert "# TYPE cache_lookup_seconds histogram" in body
+        assert 'cache_lookup_seconds_count{prefix="pokemon_type",result="miss"} 1' in body
+        assert 'cache_fill_seconds_bucket{le="+Inf",prefix="pokemon_type"} 1' in body
+
+    def test_prometheus_text_tells_gauges_counters_and_histograms_apart(self):
+        body = render_prometheus(
+            {
+                "jobs_count": 3,
+                'job_seconds_bucket{le="+Inf"}': 3,
+                "job_seconds_sum": 0.5,
+                "job_seconds_count": 3,
+            },
+            {'circuit_breaker_state{circuit="pokeapi"}': 2},
+        )
+
+        assert "# TYPE jobs_count counter\njobs_count 3\n" in body
+        assert "# TYPE job_seconds histogram" in body
+        assert '# TYPE circuit_breaker_state gauge\ncircuit_breaker_state{circuit="pokeapi"} 2\n' in body
+
+    def test_metrics_endpoint_requires_the_configured_token(self, settings):
+        settings.METRICS_TOKEN = "scraper-secret"
+
+        assert self.client.get(reverse("metrics")).status_code == status.HTTP_403_FORBIDDEN
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer scraper-secret")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_metrics_endpoint_without_token_is_staff_only(self, settings, create_player):
+        settings.METRICS_TOKEN = ""
+
+        assert self.client.get(reverse("metrics")).status_code == status.HTTP_403_FORBIDDEN
+        assert (
+            self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer ").status_code == status.HTTP_403_FORBIDDEN
+        )
+        self.client.force_login(create_player(username="operator", password="TestPass123!", is_staff=True))
+        assert self.client.get(reverse("metrics")).status_code == status.HTTP_200_OK
+
+    def test_cache_stats_command(self):
+        self.client.get(self.url)
+        out = StringIO()
+
+        call_command("cache_stats", reset=True, stdout=out)
+
+        row = next(line for line in out.getvalue().splitlines() if line.startswith(CACHE_PREFIX_POKEMON_TYPE))
+        assert row.split()[1:5] == ["0", "0", "1", "0.0%"]
+        assert cache_stats()[CACHE_PREFIX_POKEMON_TYPE]["misses"] == 0
+
+    def test_histogram_quantile(self):
+        buckets = {"0.01": 50, "0.1": 90, "1.0": 100, "+Inf": 100}
+
+        assert histogram_quantile(buckets, 0.5) == 0.01
+        assert histogram_quantile(buckets, 0.95) == pytest.approx(0.55)
+        assert math.isnan(histogram_quantile({}, 0.5))
+
+
+@pytest.mark.django_db
+class TestPokemonRecordCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, create_pokemon_type, create_pokemon, create_type_effectiveness):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.fire = create_pokemon_type(name="plasma")
+        self.grass = create_pokemon_type(name="crystal")
+        self.charmander = create_pokemon(name="Sparkit", pokedex_number=7001, primary_type=self.fire)
+        self.bulbasaur = create_pokemon(name="Shardling", pokedex_number=7002, primary_type=self.grass)
+        create_type_effectiveness(
+            attacker_type=self.fire, defender_type=self.grass, multiplier=TypeEffectiveness.SUPER_EFFECTIVE
+        )
+
+    def test_records_are_immutable_and_served_without_queries(self, django_assert_num_queries):
+        record = get_pokemon(self.charmander.id)
+
+        with django_assert_num_queries(0):
+            assert get_pokemon(self.charmander.id) == record
+
+        assert record.primary_type.name == "plasma"
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.base_hp = 1
+
+    def test_saving_a_pokemon_or_type_invalidates_its_record(self):
+        get_pokemon(self.charmander.id)
+
+        self.charmander.base_hp = 99
+        self.charmander.save()
+        assert get_pokemon(self.charmander.id).base_hp == 99
+
+        self.fire.name = "ion"
+        self.fire.save()
+        assert get_pokemon(self.charmander.id).primary_type.name == "ion"
+
+    def test_type_chart_is_invalidated_by_matchup_saves(self):
+        assert get_type_chart()[("plasma", "crystal")] == TypeEffectiveness.SUPER_EFFECTIVE
+        assert ("crystal", "plasma") not in get_type_chart()
+
+        TypeEffectiveness.objects.create(
+            attacker_type=self.grass, defender_type=self.fire, multiplier=TypeEffectiveness.NOT_VERY_EFFECTIVE
+        )
+
+        assert get_type_chart()[("crystal", "plasma")] == TypeEffectiveness.NOT_VERY_EFFECTIVE
+
+    def test_turns_never_read_the_catalog_once_cached(
+        self, api_client, create_player, create_player_pokemon, create_battle
+    ):
+        player, opponent = create_player(username="player1"), create_player(username="opponent")
+        battle = create_battle(
+            player1=player,
+            player2=opponent,
+            player1_pokemon=create_player_pokemon(player=player, pokemon=self.charmander),
+            player2_pokemon=create_player_pokemon(player=opponent, pokemon=self.bulbasaur),
+            current_turn_player=player,
+        )
+        api_client.force_authenticate(user=player)
+        url = reverse("battles:battle-turn", kwargs={"pk": battle.id})
+        get_player_pokemon(battle.player1_pokemon_id)
+        get_player_pokemon(battle.player2_pokemon_id)
+        get_type_chart()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(url, {"action": "defend"}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        catalog_tables = ('"pokemon"', '"pokemon_types"', '"player_pokemon"', '"type_effectiveness"')
+        assert not [query["sql"] for query in queries if any(table in query["sql"] for table in catalog_tables)]
+
+
+@pytest.mark.django_db
+class TestCatalogSnapshot:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, tmp_path, monkeypatch, global_pokemon_data):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.path = tmp_path / "catalog.snapshot"
+        settings.CATALOG_SNAPSHOT_PATH = str(self.path)
+        settings.CATALOG_SNAPSHOT_CHECK_INTERVAL = 0
+        monkeypatch.setattr(catalog_snapshot, "_state", catalog_snapshot._SnapshotState())
+        self.pokemon = Pokemon.objects.select_related("primary_type", "secondary_type").order_by("pokedex_number")
+
+    def test_snapshot_holds_the_catalog(self):
+        info = write_snapshot(self.path)
+
+        snapshot = CatalogSnapshot(self.path)
+        assert info.pokemon == snapshot.pokemon_count == self.pokemon.count()
+        for pokemon in self.pokemon:
+            assert snapshot.get_pokemon(pokemon.id) == PokemonRecord.from_model(pokemon)
+        assert snapshot.get_pokemon(PokemonType.objects.first().id) is None
+        assert dict(snapshot.type_chart) == {
+            (attacker, defender): multiplier
+            for attacker, defender, multiplier in TypeEffectiveness.objects.values_list(
+                "attacker_type__name", "defender_type__name", "multiplier"
+            )
+        }
+
+    def test_records_come_from_a_current_snapshot_without_queries(self, django_assert_num_queries):
+        pokemon = self.pokemon.first()
+        write_snapshot(self.path)
+
+        with django_assert_num_queries(0):
+            assert get_pokemon(pokemon.id) == PokemonRecord.from_model(pokemon)
+            assert get_type_chart() is catalog_snapshot.get_snapshot().type_chart
+
+    def test_stale_snapshot_is_ignored_until_rebuilt(self):
+        pokemon = self.pokemon.first()
+        write_snapshot(self.path)
+        previous = catalog_snapshot.get_snapshot()
+
+        pokemon.base_hp += 1
+        pokemon.save()
+        assert get_pokemon(pokemon.id).base_hp == pokemon.base_hp
+
+        out = StringIO()
+        call_command("build_catalog_snapshot", if_stale=True, stdout=out)
+        call_command("build_catalog_snapshot", if_stale=True, stdout=out)
+
+        assert "written" in out.getvalue().splitlines()[0]
+        assert out.getvalue().splitlines()[1] == "Catalog snapshot is up to date"
+        assert catalog_snapshot.get_snapshot() is not previous
+        assert catalog_snapshot.get_snapshot().get_pokemon(pokemon.id).base_hp == pokemon.base_hp
+        # Readers still holding the replaced mapping can finish with it
+        assert previous.get_pokemon(pokemon.id).base_hp == pokemon.base_hp - 1
+
+    def test_invalid_file_is_rejected(self):
+        self.path.write_bytes(b"not a snapshot" * 10)
+
+        with pytest.raises(ValueError):
+            CatalogSnapshot(self.path)
+        assert catalog_snapshot.get_snapshot() is None
+
+
+class TestLocalLRUCache:
+    def test_evicts_least_recently_used_entries_to_stay_under_the_cap(self):
+        local = LocalLRUCache(max_bytes=25, timeout=60)
+        local.set("a", "pokemon", b"x" * 9)
+        local.set("b", "pokemon", b"x" * 9)
+        local.get("a")
+
+        local.set("c", "pokemon", b"x" * 9)
+
+        assert local.get("b") is None
+        assert local.get("a") == b"x" * 9
+        assert local.size == 20
+
+    def test_values_larger_than_the_cap_are_not_stored(self):
+        local = LocalLRUCache(max_bytes=10, timeout=60)
+
+        local.set("big", "pokemon", b"x" * 20)
+
+        assert local.get("big") is None
+        assert local.size == 0
+
+    def test_expired_entries_are_dropped(self):
+        local = LocalLRUCache(max_bytes=100, timeout=0)
+
+        local.set("a", "pokemon", b"x")
+
+        assert local.get("a") is None
+        assert len(local) == 0
+
+    def test_invalidation_message_drops_only_its_namespace(self):
+        local = LocalLRUCache(max_bytes=100, timeout=60)
+        local.set("pokemon:generation", "pokemon", b"1")
+        local.set("pokemon_type:generation", "pokemon_type", b"1")
+        listener = InvalidationListener(get_client=None, channel="cache:invalidate", local=local)
+
+        listener.handle({"type": "message", "data": b"pokemon"})
+
+        assert local.get("pokemon:generation") is None
+        assert local.get("pokemon_type:generation") == b"1"
+
+    def test_key_namespace(self):
+        assert key_namespace("pokemon_type:7:view:0cc175b9c0f1b6a831c399e269772661") == "pokemon_type"
+        assert key_namespace("pokemon:generation") == "pokemon"
+        assert key_namespace("scoreboard:page:7:20:") == "scoreboard"
+        assert key_namespace("leaderboard:players") == "leaderboard"
+
+    def test_invalidation_message_for_a_key_drops_only_that_key(self):
+        local = LocalLRUCache(max_bytes=100, timeout=60)
+        local.set(":1:pokemon:7:view:a", "pokemon", b"1")
+        local.set(":1:pokemon:7:view:b", "pokemon", b"1")
+        listener = InvalidationListener(get_client=None, channel="cache:invalidate", local=local)
+
+        listener.handle({"type": "message", "data": b":1:pokemon:7:view:a"})
+
+        assert local.get(":1:pokemon:7:view:a") is None
+        assert local.get(":1:pokemon:7:view:b") == b"1"
+
+
+@pytest.mark.django_db
+class TestWarmCacheCommand:
+    def test_warms_every_reference_response(self, settings, global_pokemon_data):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        out = StringIO()
+
+        call_command("warm_cache", workers=2, hosts=["testserver"], stdout=out)
+
+        lines = out.getvalue().splitlines()
+        type_count = PokemonType.objects.count()
+        pokemon_count = Pokemon.objects.count()
+        # Type list, type chart, per-type chart and list, list pages, starters, details
+        expected = 3 + 2 * type_count + math.ceil(pokemon_count / 20) + pokemon_count
+        assert f"Warmed {expected}/{expected} responses" in lines[-1]
+        assert any(line.startswith("200") and "testserver/api/pokemon/types/" in line for line in lines)
+
+        key = view_cache_key(
+            CACHE_PREFIX_POKEMON_TYPE,
+            get_cache_generation(CACHE_PREFIX_POKEMON_TYPE),
+            _json_request(reverse("pokemon:type-list")),
+        )
+        assert cache.get(key) is not None
@@ -1,8 +1,10 @@
 import logging
 
+import httpx
 from django.db.models import OuterRef, Subquery
 from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.generics import ListAPIView
 from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, ListModelMixin
@@ -28,6 +30,7 @@ from utils.cache.constants import (
     CACHE_PREFIX_TYPE_EFFECTIVENESS,
 )
 from utils.cache.manager import cache_page_with_prefix
+from utils.exceptions.exceptions import ToastError
 from utils.third_party_services.PokemonAPI.pokeapi.client import PokeAPIClient
 
 logger = logging.getLogger(__name__)
@@ -109,13 +112,20 @@ class PokeAPIViewSet(ViewSet):
 
         client = PokeAPIClient()
 
-        # Try to parse as integer (Pokedex number)
         try:
-            pokedex_number = int(query)
-            pokemon_data = client.get_pokemon(pokedex_number)
-        except ValueError:
-            # Search by name
-            pokemon_data = client.get_pokemon_by_name(query)
+            # Try to parse as integer (Pokedex number)
+            try:
+                pokedex_number = int(query)
+                pokemon_data = client.get_pokemon(pokedex_number)
+            except ValueError:
+                # Search by name
+                pokemon_data = client.get_pokemon_by_name(query)
+        except httpx.HTTPError as e:
+            # Slow, failing or circuit-broken upstream: answer now instead of holding the worker
+            raise ToastError(
+                message="Pokemon search is temporarily unavailable. Please try again later.",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            ) from e
 
         if not pokemon_data:
             return Response({"data": None})
@@ -170,7 +180,11 @@ class PokeAPIViewSet(ViewSet):
 
         if missing_ids:
             client = PokeAPIClient()
-            Pokemon.objects.bulk_create_from_pokemon_api(list(missing_ids), client)
+            try:
+                Pokemon.objects.bulk_create_from_pokemon_api(list(missing_ids), client)
+            except httpx.HTTPError:
+                # Serve the Pokemon already stored rather than failing the page on an unhealthy upstream
+                logger.warning("PokeAPI unavailable, listing stored Pokemon only", exc_info=True)
 
         # Get all desired pokemons from DB (the first id list) and serialize it
         all_pokemon = (
@@ -1 +1,5 @@
-# Register your models here.
+from django.contrib import admin
+
+from scoreboard.models import PlayerRank
+
+admin.site.register(PlayerRank)
@@ -0,0 +1,32 @@
+import time
+
+from django.core.cache import cache
+
+from utils.cache.constants import CACHE_PREFIX_SCOREBOARD, CACHE_TTL
+from utils.cache.manager import get_cache_generation, invalidate_cache_prefix
+from utils.metrics import metrics
+
+
+def page_cache_key(cursor: str | None, page_size: int) -> str:
+    return f"{CACHE_PREFIX_SCOREBOARD}:page:{get_cache_generation(CACHE_PREFIX_SCOREBOARD)}:{page_size}:{cursor or ''}"
+
+
+def get_page(key: str):
+    started = time.perf_counter()
+    payload = cache.get(key)
+    metrics.observe(
+        "cache_lookup_seconds",
+        time.perf_counter() - started,
+        prefix=CACHE_PREFIX_SCOREBOARD,
+        result="miss" if payload is None else "hit",
+    )
+    return payload
+
+
+def set_page(key: str, payload: dict) -> None:
+    cache.set(key, payload, CACHE_TTL)
+
+
+def invalidate_pages() -> None:
+    """Drop every cached scoreboard page by moving to a new generation."""
+    invalidate_cache_prefix(CACHE_PREFIX_SCOREBOARD)
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from scoreboard.models import PlayerPeriodStats
+
+
+class Command(BaseCommand):
+    """
+    Drop daily and weekly leaderboard rollups that are past their retention window.
+
+    Each battle result is counted in its day, week and season, so old daily and weekly
+    rows can be deleted without losing data that the season leaderboard still serves.
+    Rows are deleted in chunks of `--batch-size`.
+
+    Usage:
+        python manage.py compact_period_stats
+        python manage.py compact_period_stats --daily-days 7 --weekly-weeks 4
+    """
+
+    help = "Delete daily and weekly leaderboard rollups older than their retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--daily-days",
+            type=int,
+            default=settings.LEADERBOARD_DAILY_RETENTION_DAYS,
+            help=f"Keep this many days of daily rollups (default: {settings.LEADERBOARD_DAILY_RETENTION_DAYS})",
+        )
+        parser.add_argument(
+            "--weekly-weeks",
+            type=int,
+            default=settings.LEADERBOARD_WEEKLY_RETENTION_WEEKS,
+            help=f"Keep this many weeks of weekly rollups (default: {settings.LEADERBOARD_WEEKLY_RETENTION_WEEKS})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows deleted per query (default: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        daily = PlayerPeriodStats.objects.compact(
+            PlayerPeriodStats.PERIOD_DAILY, today - timedelta(days=options["daily_days"]), options["batch_size"]
+        )
+        weekly = PlayerPeriodStats.objects.compact(
+            PlayerPeriodStats.PERIOD_WEEKLY, today - timedelta(weeks=options["weekly_weeks"]), options["batch_size"]
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Leaderboard rollups compacted: {daily} daily and {weekly} weekly rows deleted")
+        )
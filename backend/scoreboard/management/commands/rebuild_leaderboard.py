@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.game.leaderboard import leaderboard
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the Redis leaderboard sorted set from the scoreboard rank snapshot.
+
+    The new set is built under a temporary key and swapped in with `RENAME`, so rank
+    lookups keep working while the rebuild runs. `refresh_scoreboard` keeps the set up to
+    date between rebuilds; the rebuild repairs anything missed (e.g. Redis restarts).
+
+    Usage:
+        python manage.py rebuild_leaderboard
+        python manage.py rebuild_leaderboard --batch-size 10000
+    """
+
+    help = "Rebuild the leaderboard sorted set from the rank snapshot"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of players read and written per round trip (default: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            total = leaderboard.rebuild(batch_size=options["batch_size"])
+        except RuntimeError as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(self.style.SUCCESS(f"Leaderboard rebuilt: {total} players ranked"))
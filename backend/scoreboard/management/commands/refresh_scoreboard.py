@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from scoreboard.models import PlayerRank
+
+
+class Command(BaseCommand):
+    """
+    Refresh the precomputed scoreboard ranks in `scoreboard_player_ranks`.
+
+    Only players whose wins or losses changed since the last refresh (plus new and
+    deactivated players) are written, and ranks are recomputed with window functions over
+    the range of the scoreboard those changes affect. The first run ranks every player.
+
+    Usage:
+        python manage.py refresh_scoreboard
+        python manage.py refresh_scoreboard --batch-size 5000
+    """
+
+    help = "Refresh the scoreboard rank snapshot for players whose record changed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows written per UPDATE/INSERT (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        changed = PlayerRank.objects.refresh(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Scoreboard refreshed: {changed} players changed"))
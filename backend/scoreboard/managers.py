@@ -0,0 +1,219 @@
+from itertools import pairwise
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.functions import DenseRank, Rank
+from django.utils import timezone
+
+from scoreboard.cache import invalidate_pages
+
+
+def _better(wins: int, losses: int) -> models.Q:
+    """Rows ranked strictly above the (wins, losses) record."""
+    return models.Q(wins__gt=wins) | models.Q(wins=wins, losses__lt=losses)
+
+
+class PlayerRankManager(models.Manager):
+    def better_than(self, wins: int, losses: int):
+        return self.filter(_better(wins, losses))
+
+    def entry_for(self, player):
+        """
+        Return the snapshot row of `player`.
+
+        Players who joined after the last refresh get an unsaved row ranked against the
+        snapshot by the leaderboard, as the next refresh would rank them; its `position` is 0.
+        """
+        from utils.game.leaderboard import leaderboard
+
+        entry = self.select_related("player").filter(player=player).first()
+        if entry is None:
+            entry = self.model(
+                player=player,
+                wins=player.wins,
+                losses=player.losses,
+                win_rate=player.win_rate,
+                rank=leaderboard.player_rank(player),
+            )
+        return entry
+
+    def around(self, entry, size: int):
+        """
+        Return up to `size` rows ranked directly above and below `entry`, in scoreboard order.
+
+        Each side is a keyset probe on the `(wins DESC, losses, player_id)` order that
+        `position` materializes, read from the position index with a LIMIT. The cost
+        therefore does not depend on how far down the scoreboard the player is.
+        """
+        rows = self.select_related("player")
+        if entry.position:
+            before = rows.filter(position__lt=entry.position)
+            after = rows.filter(position__gt=entry.position)
+        else:
+            # Not in the snapshot yet: probe with the record tuple itself
+            ahead = _better(entry.wins, entry.losses) | models.Q(
+                wins=entry.wins, losses=entry.losses, player_id__lt=entry.player_id
+            )
+            before = rows.filter(ahead)
+            after = rows.exclude(ahead)
+
+        above = list(before.order_by("-position")[:size])
+        below = list(after.order_by("position")[:size])
+        return above[::-1], below
+
+    def refresh(self, batch_size: int = 1000) -> int:
+        """
+        Bring the rank snapshot up to date with the `players` table.
+
+        Only players whose record changed since the last refresh (plus new and deactivated
+        players) are written. Ranks are then recomputed with window functions over the
+        range of records those changes can affect: rows ranked above the best or below the
+        worst changed record keep their rank. Rank offsets for the range come from a count
+        of the rows above it. Everything runs in one transaction, so readers always see a
+        consistent snapshot. Cached scoreboard pages are dropped only when the range reaches
+        into the cached positions. The leaderboard set gets the written rows once the
+        transaction commits.
+
+        Returns:
+            Number of players whose record changed
+        """
+        from players.models import Player
+        from utils.game.leaderboard import leaderboard
+
+        with transaction.atomic():
+            stale = list(
+                self.filter(player__is_active=True)
+                .exclude(wins=models.F("player__wins"), losses=models.F("player__losses"))
+                .values_list("player_id", "wins", "losses", "player__wins", "player__losses")
+            )
+            added = list(
+                Player.objects.filter(is_active=True, rank_snapshot__isnull=True).values_list("id", "wins", "losses")
+            )
+            removed = list(self.filter(player__is_active=False).values_list("player_id", "wins", "losses"))
+            if not (stale or added or removed):
+                return 0
+
+            records = [(wins, losses) for _, wins, losses, *_ in stale]
+            records += [(new_wins, new_losses) for *_, new_wins, new_losses in stale]
+            records += [(wins, losses) for _, wins, losses in added + removed]
+            best = max(records, key=lambda record: (record[0], -record[1]))
+            worst = min(records, key=lambda record: (record[0], -record[1]))
+
+            self.bulk_update(
+                [self.model(player_id=player_id, wins=wins, losses=losses) for player_id, _, _, wins, losses in stale],
+                ["wins", "losses"],
+                batch_size=batch_size,
+            )
+            self.bulk_create(
+                [self.model(player_id=player_id, wins=wins, losses=losses) for player_id, wins, losses in added],
+                batch_size=batch_size,
+            )
+            self.filter(player_id__in=[player_id for player_id, *_ in removed]).delete()
+
+            # Adding or removing a row shifts the position of every row below it
+            first_changed_position = self._rerank(best, None if added or removed else worst, batch_size)
+            if first_changed_position <= settings.SCOREBOARD_CACHED_POSITIONS:
+                transaction.on_commit(invalidate_pages)
+
+            synced = {player_id: (wins, losses) for player_id, _, _, wins, losses in stale}
+            synced.update((player_id, (wins, losses)) for player_id, wins, losses in added)
+            removed_ids = [player_id for player_id, *_ in removed]
+            transaction.on_commit(lambda: leaderboard.sync(synced, removed_ids))
+
+        return len(stale) + len(added) + len(removed)
+
+    def _rerank(self, best, worst, batch_size) -> int:
+        """Re-rank the rows between the `best` and `worst` records and return the first position that may have changed."""
+        offset = self.filter(_better(*best)).count()
+        affected = self.exclude(_better(*best))
+        if worst is not None:
+            affected = affected.filter(_better(*worst) | models.Q(wins=worst[0], losses=worst[1]))
+
+        record_order = [models.F("wins").desc(), models.F("losses").asc()]
+        ranked = affected.annotate(
+            new_rank=models.Window(Rank(), order_by=record_order),
+            new_position=models.Window(DenseRank(), order_by=[*record_order, models.F("player_id").asc()]),
+        ).values_list("player_id", "rank", "position", "new_rank", "new_position")
+
+        self.bulk_update(
+            [
+                self.model(player_id=player_id, rank=offset + new_rank, position=offset + new_position)
+                for player_id, rank, position, new_rank, new_position in ranked
+                if (rank, position) != (offset + new_rank, offset + new_position)
+            ],
+            ["rank", "position"],
+            batch_size=batch_size,
+        )
+        return offset + 1
+
+
+class PlayerPeriodStatsManager(models.Manager):
+    def record_result(self, winner, loser, completed_at) -> None:
+        """
+        Count a completed battle in every period containing `completed_at`.
+
+        Missing rows are created with one conflict-ignoring INSERT; the counters are then
+        incremented in place, one UPDATE per player, so concurrent completions never lose
+        a result.
+        """
+        day = timezone.localdate(completed_at)
+        periods = models.Q()
+        rows = []
+        for period, _ in self.model.PERIOD_CHOICES:
+            period_start = self.model.period_start_for(period, day)
+            periods |= models.Q(period=period, period_start=period_start)
+            rows += [
+                self.model(player_id=player_id, period=period, period_start=period_start)
+                for player_id in (winner.id, loser.id)
+            ]
+
+        self.bulk_create(rows, ignore_conflicts=True)
+        self.filter(periods, player_id=winner.id).update(wins=models.F("wins") + 1)
+        self.filter(periods, player_id=loser.id).update(losses=models.F("losses") + 1)
+
+    def for_period(self, period: str, period_start):
+        return self.filter(period=period, period_start=period_start, player__is_active=True)
+
+    def rank_of(self, period: str, period_start, wins: int, losses: int) -> int:
+        return self.for_period(period, period_start).filter(_better(wins, losses)).count() + 1
+
+    def assign_ranks(self, rows, period: str, period_start) -> None:
+        """
+        Set `rank` on a contiguous page of period rows in scoreboard order.
+
+        One aggregate query counts the rows ahead of the first row, split into those with
+        a better record and its ties. Every following rank is derived from its position on the page.
+        """
+        if not rows:
+            return
+
+        first = rows[0]
+        ahead = self.for_period(period, period_start).aggregate(
+            better=models.Count("id", filter=_better(first.wins, first.losses)),
+            tied=models.Count(
+                "id", filter=models.Q(wins=first.wins, losses=first.losses, player_id__lt=first.player_id)
+            ),
+        )
+        first.rank = ahead["better"] + 1
+        position = first.rank + ahead["tied"]
+        for offset, (previous, row) in enumerate(pairwise(rows), start=1):
+            if (row.wins, row.losses) == (previous.wins, previous.losses):
+                row.rank = previous.rank
+            else:
+                row.rank = position + offset
+
+    def compact(self, period: str, before, batch_size: int = 5000) -> int:
+        """
+        Delete the rows of `period` that started before `before`, in chunks.
+
+        Every result is counted in its day, week and season, so dropping old daily and
+        weekly rows loses no data still served by a coarser leaderboard.
+
+        Returns:
+            Number of rows deleted
+        """
+        stale = self.filter(period=period, period_start__lt=before)
+        total = 0
+        while ids := list(stale.values_list("id", flat=True)[:batch_size]):
+            total += self.filter(id__in=ids).delete()[0]
+        return total
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("players", "0004_player_active_pokemon"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerRank",
+            fields=[
+                (
+                    "player",
+                    models.OneToOneField(
+                        help_text="The ranked player",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rank_snapshot",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("wins", models.PositiveIntegerField(help_text="Wins at the time of the last refresh")),
+                ("losses", models.PositiveIntegerField(help_text="Losses at the time of the last refresh")),
+                (
+                    "rank",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Scoreboard rank; players with the same record share it"
+                    ),
+                ),
+                (
+                    "position",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Unique 1-based position in scoreboard order (ties broken by player id)"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Player Rank",
+                "verbose_name_plural": "Player Ranks",
+                "db_table": "scoreboard_player_ranks",
+                "ordering": ["position"],
+                "indexes": [
+                    models.Index(fields=["position"], name="player_rank_position_idx"),
+                    models.Index(fields=["-wins", "losses"], name="player_rank_record_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from uuid_extensions import uuid7
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("scoreboard", "0001_player_rank"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerPeriodStats",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid7,
+                        editable=False,
+                        help_text="UUIDv7 primary key (time-sortable)",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("daily", "Daily"), ("weekly", "Weekly"), ("season", "Season")],
+                        help_text="Length of the period",
+                        max_length=10,
+                    ),
+                ),
+                ("period_start", models.DateField(help_text="First day of the period")),
+                ("wins", models.PositiveIntegerField(default=0, help_text="Battles won during the period")),
+                ("losses", models.PositiveIntegerField(default=0, help_text="Battles lost during the period")),
+                (
+                    "player",
+                    models.ForeignKey(
+                        help_text="The player these results belong to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="period_stats",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Player Period Stats",
+                "verbose_name_plural": "Player Period Stats",
+                "db_table": "scoreboard_player_period_stats",
+                "ordering": ["-wins", "losses", "player"],
+                "indexes": [
+                    models.Index(
+                        fields=["period", "period_start", "-wins", "losses", "player"], name="player_period_ranking_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=("period", "period_start", "player"), name="unique_player_period")
+                ],
+            },
+        ),
+    ]
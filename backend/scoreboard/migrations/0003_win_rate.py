@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:26
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("scoreboard", "0002_player_period_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerperiodstats",
+            name="win_rate",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(losses=0, then=models.Value(0.0), wins=0),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            django.db.models.functions.comparison.Cast("wins", models.FloatField()),
+                            "*",
+                            models.Value(100),
+                        ),
+                        "/",
+                        django.db.models.expressions.CombinedExpression(models.F("wins"), "+", models.F("losses")),
+                    ),
+                    output_field=models.FloatField(),
+                ),
+                help_text="Win percentage during the period",
+                output_field=models.FloatField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="playerrank",
+            name="win_rate",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(losses=0, then=models.Value(0.0), wins=0),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            django.db.models.functions.comparison.Cast("wins", models.FloatField()),
+                            "*",
+                            models.Value(100),
+                        ),
+                        "/",
+                        django.db.models.expressions.CombinedExpression(models.F("wins"), "+", models.F("losses")),
+                    ),
+                    output_field=models.FloatField(),
+                ),
+                help_text="Win percentage at the time of the last refresh",
+                output_field=models.FloatField(),
+            ),
+        ),
+    ]
@@ -1 +1,97 @@
-# Create your models here.
+from datetime import date, timedelta
+
+from django.db import models
+from uuid_extensions import uuid7
+
+from scoreboard.managers import PlayerPeriodStatsManager, PlayerRankManager
+from utils.fields import win_rate_field
+
+
+class PlayerRank(models.Model):
+    player = models.OneToOneField(
+        "players.Player",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rank_snapshot",
+        help_text="The ranked player",
+    )
+    wins = models.PositiveIntegerField(help_text="Wins at the time of the last refresh")
+    losses = models.PositiveIntegerField(help_text="Losses at the time of the last refresh")
+    win_rate = win_rate_field(help_text="Win percentage at the time of the last refresh")
+    rank = models.PositiveIntegerField(default=0, help_text="Scoreboard rank; players with the same record share it")
+    position = models.PositiveIntegerField(
+        default=0, help_text="Unique 1-based position in scoreboard order (ties broken by player id)"
+    )
+
+    objects = PlayerRankManager()
+
+    class Meta:
+        db_table = "scoreboard_player_ranks"
+        verbose_name = "Player Rank"
+        verbose_name_plural = "Player Ranks"
+        ordering = ["position"]
+        indexes = [
+            # Keyset pagination of the scoreboard
+            models.Index(fields=["position"], name="player_rank_position_idx"),
+            # Range lookups of the incremental refresh
+            models.Index(fields=["-wins", "losses"], name="player_rank_record_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.rank} {self.player_id}"
+
+
+class PlayerPeriodStats(models.Model):
+    PERIOD_DAILY = "daily"
+    PERIOD_WEEKLY = "weekly"
+    PERIOD_SEASON = "season"
+
+    PERIOD_CHOICES = [
+        (PERIOD_DAILY, "Daily"),
+        (PERIOD_WEEKLY, "Weekly"),
+        (PERIOD_SEASON, "Season"),
+    ]
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid7, editable=False, help_text="UUIDv7 primary key (time-sortable)"
+    )
+    player = models.ForeignKey(
+        "players.Player",
+        on_delete=models.CASCADE,
+        related_name="period_stats",
+        help_text="The player these results belong to",
+    )
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES, help_text="Length of the period")
+    period_start = models.DateField(help_text="First day of the period")
+    wins = models.PositiveIntegerField(default=0, help_text="Battles won during the period")
+    losses = models.PositiveIntegerField(default=0, help_text="Battles lost during the period")
+    win_rate = win_rate_field(help_text="Win percentage during the period")
+
+    objects = PlayerPeriodStatsManager()
+
+    class Meta:
+        db_table = "scoreboard_player_period_stats"
+        verbose_name = "Player Period Stats"
+        verbose_name_plural = "Player Period Stats"
+        ordering = ["-wins", "losses", "player"]
+        constraints = [
+            models.UniqueConstraint(fields=["period", "period_start", "player"], name="unique_player_period"),
+        ]
+        indexes = [
+            # Ranking within one period
+            models.Index(
+                fields=["period", "period_start", "-wins", "losses", "player"], name="player_period_ranking_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.player_id} - {self.period} {self.period_start}"
+
+    @classmethod
+    def period_start_for(cls, period: str, day: date) -> date:
+        """Return the first day of the period containing `day` (weeks start on Monday, seasons are quarters)."""
+        if period == cls.PERIOD_DAILY:
+            return day
+        if period == cls.PERIOD_WEEKLY:
+            return day - timedelta(days=day.weekday())
+        return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
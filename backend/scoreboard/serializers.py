@@ -1,16 +1,55 @@
 from rest_framework import serializers
 
+from players.models import Player
+from scoreboard.models import PlayerPeriodStats, PlayerRank
 
-class ScoreboardEntrySerializer(serializers.Serializer):
+
+class ScoreboardEntrySerializer(serializers.ModelSerializer):
+    player_id = serializers.UUIDField(read_only=True)
+    username = serializers.CharField(source="player.username", read_only=True)
+    win_rate = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PlayerRank
+        fields = ["rank", "player_id", "username", "wins", "losses", "win_rate"]
+        read_only_fields = fields
+
+    def get_win_rate(self, obj) -> int:
+        return round(obj.win_rate)
+
+
+class PeriodScoreboardEntrySerializer(ScoreboardEntrySerializer):
     rank = serializers.IntegerField(read_only=True)
+
+    class Meta(ScoreboardEntrySerializer.Meta):
+        model = PlayerPeriodStats
+
+
+class PeriodScoreboardQuerySerializer(serializers.Serializer):
+    date = serializers.DateField(required=False, help_text="Any day inside the period (defaults to today)")
+
+
+class WinRateEntrySerializer(serializers.ModelSerializer):
     player_id = serializers.UUIDField(source="id", read_only=True)
-    username = serializers.CharField(read_only=True)
-    wins = serializers.IntegerField(read_only=True)
-    losses = serializers.IntegerField(read_only=True)
     win_rate = serializers.SerializerMethodField()
 
-    def get_win_rate(self, obj):
-        total = obj.wins + obj.losses
-        if total == 0:
-            return 0
-        return round((obj.wins / total) * 100)
+    class Meta:
+        model = Player
+        fields = ["player_id", "username", "wins", "losses", "win_rate"]
+        read_only_fields = fields
+
+    def get_win_rate(self, obj: Player) -> int:
+        # Rounded like the main scoreboard, so a player shows the same win rate on both
+        return round(obj.win_rate)
+
+
+class WinRateQuerySerializer(serializers.Serializer):
+    min_games = serializers.IntegerField(
+        min_value=1,
+        required=False,
+        help_text="Only rank players with at least this many battles (defaults to SCOREBOARD_WIN_RATE_MIN_GAMES)",
+    )
+
+
+class AroundMeQuerySerializer(serializers.Serializer):
+    size = serializers.IntegerField(min_value=1, max_value=50, default=5)
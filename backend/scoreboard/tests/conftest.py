@@ -0,0 +1,21 @@
+import pytest
+
+from players.models import Player
+
+
+@pytest.fixture
+def ranked_players_only(db):
+    """Keep the players created by session-scoped fixtures out of the rankings."""
+    Player.objects.update(is_active=False)
+
+
+@pytest.fixture
+def create_ranked_player(create_player):
+    """Create a player with a battle record, reloaded for the fields the database computes."""
+
+    def _create_ranked_player(username, wins=0, losses=0, **kwargs):
+        player = create_player(username=username, wins=wins, losses=losses, **kwargs)
+        player.refresh_from_db()
+        return player
+
+    return _create_ranked_player
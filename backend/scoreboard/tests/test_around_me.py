@@ -0,0 +1,65 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from scoreboard.models import PlayerRank
+
+
+@pytest.mark.django_db
+class TestScoreboardAroundMeView:
+    @pytest.fixture(autouse=True)
+    def setup(self, ranked_players_only, create_ranked_player):
+        self.client = APIClient()
+        self.url = reverse("scoreboard:scoreboard-around-me")
+        self.players = [create_ranked_player(f"player_{i}", wins=20 - i) for i in range(10)]
+        PlayerRank.objects.refresh()
+
+    def test_around_me_returns_players_ranked_above_and_below(self):
+        self.client.force_authenticate(user=self.players[4])
+
+        response = self.client.get(self.url, {"size": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [entry["username"] for entry in response.data["results"]] == [
+            "player_2",
+            "player_3",
+            "player_4",
+            "player_5",
+            "player_6",
+        ]
+        assert [entry["rank"] for entry in response.data["results"]] == [3, 4, 5, 6, 7]
+        assert response.data["current_user_entry"]["username"] == "player_4"
+
+    def test_around_me_at_the_top_has_no_players_above(self):
+        self.client.force_authenticate(user=self.players[0])
+
+        response = self.client.get(self.url, {"size": 2})
+
+        assert [entry["rank"] for entry in response.data["results"]] == [1, 2, 3]
+
+    @pytest.mark.parametrize("index", [0, 5, 9])
+    def test_around_me_query_count_does_not_depend_on_rank(self, index, django_assert_num_queries):
+        self.client.force_authenticate(user=self.players[index])
+
+        with django_assert_num_queries(3):
+            response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_around_me_for_player_missing_from_snapshot_probes_by_record(self, create_ranked_player):
+        newcomer = create_ranked_player("newcomer", wins=15)
+        self.client.force_authenticate(user=newcomer)
+
+        response = self.client.get(self.url, {"size": 1})
+
+        assert [entry["username"] for entry in response.data["results"]] == ["player_5", "newcomer", "player_6"]
+        assert response.data["current_user_entry"]["rank"] == 6
+
+    def test_around_me_with_invalid_size_returns_400(self):
+        self.client.force_authenticate(user=self.players[0])
+
+        response = self.client.get(self.url, {"size": 500})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["field_name"] == "size"
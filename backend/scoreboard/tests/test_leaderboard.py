@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from players.models import Player
+from scoreboard.models import PlayerRank
+from utils.game.leaderboard import LEADERBOARD_KEY, Leaderboard, leaderboard, leaderboard_score
+
+
+class FakeSortedSetRedis:
+    """In-memory stand-in for the sorted-set commands the leaderboard uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.data.get(key, {}).pop(member, None)
+
+    def zcount(self, key, minimum, maximum):
+        exclusive = minimum.startswith("(")
+        bound = float(minimum.lstrip("("))
+        return sum(
+            1 for score in self.data.get(key, {}).values() if score > bound or (not exclusive and score == bound)
+        )
+
+    def rename(self, source, destination):
+        self.data[destination] = self.data.pop(source)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.mark.django_db
+class TestLeaderboard:
+    @pytest.fixture(autouse=True)
+    def setup(self, ranked_players_only, create_ranked_player):
+        self.champion = create_ranked_player("champion", wins=10, losses=1)
+        self.tied_a = create_ranked_player("tied_a", wins=5, losses=2)
+        self.tied_b = create_ranked_player("tied_b", wins=5, losses=2)
+        self.rookie = create_ranked_player("rookie")
+        self.unlucky = create_ranked_player("unlucky", losses=3)
+        PlayerRank.objects.refresh()
+
+    @pytest.fixture
+    def redis_client(self):
+        client = FakeSortedSetRedis()
+        with patch("utils.game.leaderboard.get_redis_client", return_value=client):
+            yield client
+
+    def test_rank_without_redis_counts_snapshot_rows_with_better_records(self):
+        assert leaderboard.rank(10, 1) == 1
+        assert leaderboard.rank(5, 2) == 2
+        assert leaderboard.rank(0, 0) == 4
+        assert leaderboard.rank(0, 3) == 5
+
+    def test_rank_from_redis_matches_the_snapshot(self, redis_client, django_assert_num_queries):
+        assert leaderboard.rebuild() == 5
+        snapshot = dict(PlayerRank.objects.values_list("player_id", "rank"))
+        players = list(Player.objects.filter(is_active=True))
+
+        with django_assert_num_queries(0):
+            ranks = {player.id: leaderboard.player_rank(player) for player in players}
+
+        assert ranks == snapshot
+
+    def test_refresh_writes_changed_snapshot_rows_into_the_set(
+        self, redis_client, create_ranked_player, django_capture_on_commit_callbacks
+    ):
+        leaderboard.rebuild()
+        Player.objects.filter(id=self.rookie.id).update(wins=11)
+        Player.objects.filter(id=self.unlucky.id).update(is_active=False)
+        newcomer = create_ranked_player("newcomer", wins=7)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            PlayerRank.objects.refresh()
+
+        members = redis_client.data[LEADERBOARD_KEY]
+        assert members[str(self.rookie.id)] == leaderboard_score(11, 0)
+        assert members[str(newcomer.id)] == leaderboard_score(7, 0)
+        assert str(self.unlucky.id) not in members
+        assert leaderboard.rank(10, 1) == 2
+
+    def test_live_records_do_not_move_the_set_before_a_refresh(self, redis_client):
+        leaderboard.rebuild()
+        Player.objects.filter(id=self.rookie.id).update(wins=11)
+
+        assert leaderboard.rank(10, 1) == 1
+
+    def test_sync_before_rebuild_leaves_set_unbuilt(self, redis_client):
+        Leaderboard(key="test:leaderboard").sync({self.rookie.id: (1, 0)})
+
+        assert "test:leaderboard" not in redis_client.data
+
+
+@pytest.mark.django_db
+class TestRebuildLeaderboardCommand:
+    def test_rebuild_leaderboard_without_redis_raises_error(self):
+        with pytest.raises(CommandError, match="requires a Redis cache backend"):
+            call_command("rebuild_leaderboard")
+
+
+@pytest.mark.django_db
+class TestScoreboardUsesLeaderboard:
+    def test_scoreboard_ranks_players_missing_from_snapshot_with_leaderboard(self, create_ranked_player):
+        player = create_ranked_player("player", wins=3)
+        client = APIClient()
+        client.force_authenticate(user=player)
+
+        with patch.object(leaderboard, "player_rank", return_value=7) as player_rank:
+            response = client.get(reverse("scoreboard:scoreboard-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["current_user_entry"]["rank"] == 7
+        assert response.data["current_user_entry"]["wins"] == 3
+        player_rank.assert_called_once()
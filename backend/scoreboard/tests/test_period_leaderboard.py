@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from players.models import Player
+from scoreboard.models import PlayerPeriodStats
+from utils.game.turn_processor import TurnProcessor
+
+
+@pytest.mark.django_db
+class TestPlayerPeriodStats:
+    @pytest.fixture(autouse=True)
+    def setup(self, create_player):
+        self.winner = create_player(username="winner")
+        self.loser = create_player(username="loser")
+
+    def test_period_start_for_each_period(self):
+        day = date(2026, 8, 13)  # A Thursday
+
+        assert PlayerPeriodStats.period_start_for(PlayerPeriodStats.PERIOD_DAILY, day) == day
+        assert PlayerPeriodStats.period_start_for(PlayerPeriodStats.PERIOD_WEEKLY, day) == date(2026, 8, 10)
+        assert PlayerPeriodStats.period_start_for(PlayerPeriodStats.PERIOD_SEASON, day) == date(2026, 7, 1)
+
+    def test_record_result_increments_every_period(self):
+        completed_at = timezone.now()
+
+        PlayerPeriodStats.objects.record_result(self.winner, self.loser, completed_at)
+        PlayerPeriodStats.objects.record_result(self.winner, self.loser, completed_at)
+
+        assert set(PlayerPeriodStats.objects.filter(player=self.winner).values_list("period", "wins", "losses")) == {
+            (PlayerPeriodStats.PERIOD_DAILY, 2, 0),
+            (PlayerPeriodStats.PERIOD_WEEKLY, 2, 0),
+            (PlayerPeriodStats.PERIOD_SEASON, 2, 0),
+        }
+        assert set(PlayerPeriodStats.objects.filter(player=self.loser).values_list("wins", "losses")) == {(0, 2)}
+
+    def test_completing_a_battle_records_the_result(self, create_battle):
+        battle = create_battle(player1=self.winner, player2=self.loser)
+
+        TurnProcessor(battle, self.winner, TurnProcessor.ACTION_ATTACK)._complete_battle(self.winner)
+
+        daily = PlayerPeriodStats.objects.for_period(PlayerPeriodStats.PERIOD_DAILY, timezone.localdate())
+        assert daily.get(player=self.winner).wins == 1
+        assert daily.get(player=self.loser).losses == 1
+
+    def test_compact_period_stats_drops_only_old_daily_and_weekly_rows(self):
+        PlayerPeriodStats.objects.record_result(self.winner, self.loser, timezone.now() - timedelta(days=200))
+        PlayerPeriodStats.objects.record_result(self.winner, self.loser, timezone.now())
+
+        call_command("compact_period_stats", daily_days=14, weekly_weeks=12)
+
+        old_periods = PlayerPeriodStats.objects.filter(period_start__lt=timezone.localdate() - timedelta(days=100))
+        assert set(old_periods.values_list("period", flat=True)) == {PlayerPeriodStats.PERIOD_SEASON}
+        assert PlayerPeriodStats.objects.filter(period=PlayerPeriodStats.PERIOD_DAILY).count() == 2
+
+
+@pytest.mark.django_db
+class TestPeriodScoreboardListView:
+    @pytest.fixture(autouse=True)
+    def setup(self, create_player):
+        self.client = APIClient()
+        self.url = reverse("scoreboard:scoreboard-period", kwargs={"period": "daily"})
+        self.players = [create_player(username=f"player_{i}") for i in range(4)]
+        self.spectator = create_player(username="spectator")
+        today = timezone.now()
+        # player_0: 2-0, player_1 and player_2: 1-1, player_3: 0-2
+        for winner, loser in [(0, 3), (0, 3), (1, 2), (2, 1)]:
+            PlayerPeriodStats.objects.record_result(self.players[winner], self.players[loser], today)
+
+    def test_daily_scoreboard_ranks_players_by_period_results(self):
+        self.client.force_authenticate(user=self.players[0])
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert [entry["rank"] for entry in results] == [1, 2, 2, 4]
+        assert results[0]["username"] == "player_0"
+        assert (results[0]["wins"], results[0]["losses"]) == (2, 0)
+        assert response.data["period_start"] == timezone.localdate()
+        assert response.data["current_user_entry"]["rank"] == 1
+
+    def test_ranks_stay_correct_across_pages(self):
+        self.client.force_authenticate(user=self.players[0])
+
+        first_page = self.client.get(self.url, {"page_size": 2}).data
+        second_page = self.client.get(first_page["next"]).data
+
+        assert [entry["rank"] for entry in first_page["results"] + second_page["results"]] == [1, 2, 2, 4]
+
+    def test_player_without_results_gets_entry_ranked_by_empty_record(self):
+        self.client.force_authenticate(user=self.spectator)
+
+        response = self.client.get(self.url)
+
+        assert response.data["current_user_entry"]["wins"] == 0
+        assert response.data["current_user_entry"]["rank"] == 4
+
+    def test_previous_period_is_selected_by_date(self):
+        self.client.force_authenticate(user=self.players[0])
+
+        response = self.client.get(self.url, {"date": (timezone.localdate() - timedelta(days=1)).isoformat()})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == []
+
+    def test_excludes_inactive_players(self):
+        Player.objects.filter(id=self.players[0].id).update(is_active=False)
+        self.client.force_authenticate(user=self.players[1])
+
+        response = self.client.get(self.url)
+
+        assert [entry["username"] for entry in response.data["results"]][0] in {"player_1", "player_2"}
+        assert response.data["results"][0]["rank"] == 1
+
+    def test_unknown_period_returns_404(self):
+        self.client.force_authenticate(user=self.players[0])
+
+        response = self.client.get("/api/scoreboard/monthly/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
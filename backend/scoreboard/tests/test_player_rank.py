@@ -0,0 +1,126 @@
+import random
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from players.models import Player
+from scoreboard.models import PlayerRank
+
+
+def _snapshot():
+    return {
+        str(player_id): (rank, position)
+        for player_id, rank, position in PlayerRank.objects.values_list("player_id", "rank", "position")
+    }
+
+
+@pytest.mark.django_db
+class TestPlayerRankRefresh:
+    @pytest.fixture(autouse=True)
+    def setup(self, ranked_players_only, create_ranked_player):
+        self.champion = create_ranked_player("champion", wins=10, losses=1)
+        self.tied_a = create_ranked_player("tied_a", wins=5, losses=2)
+        self.tied_b = create_ranked_player("tied_b", wins=5, losses=2)
+        self.rookie = create_ranked_player("rookie")
+
+    def test_refresh_ranks_ties_together_with_unique_positions(self):
+        assert PlayerRank.objects.refresh() == 4
+
+        snapshot = _snapshot()
+        first_tied, second_tied = sorted([str(self.tied_a.id), str(self.tied_b.id)])
+        assert snapshot[str(self.champion.id)] == (1, 1)
+        assert snapshot[first_tied] == (2, 2)
+        assert snapshot[second_tied] == (2, 3)
+        assert snapshot[str(self.rookie.id)] == (4, 4)
+
+    def test_refresh_without_changes_writes_nothing(self, django_assert_num_queries):
+        PlayerRank.objects.refresh()
+
+        # Three change-detection SELECTs inside the refresh savepoint
+        with django_assert_num_queries(5) as context:
+            assert PlayerRank.objects.refresh() == 0
+
+        assert sum(query["sql"].startswith("SELECT") for query in context.captured_queries) == 3
+
+    def test_refresh_only_rewrites_the_affected_range(self):
+        PlayerRank.objects.refresh()
+        Player.objects.filter(id=self.tied_b.id).update(wins=6)
+
+        assert PlayerRank.objects.refresh() == 1
+
+        snapshot = _snapshot()
+        assert snapshot[str(self.champion.id)] == (1, 1)
+        assert snapshot[str(self.tied_b.id)] == (2, 2)
+        assert snapshot[str(self.tied_a.id)] == (3, 3)
+        assert snapshot[str(self.rookie.id)] == (4, 4)
+
+    def test_refresh_adds_new_and_drops_deactivated_players(self, create_ranked_player):
+        PlayerRank.objects.refresh()
+        Player.objects.filter(id=self.champion.id).update(is_active=False)
+        newcomer = create_ranked_player("newcomer", wins=7)
+
+        assert PlayerRank.objects.refresh() == 2
+
+        snapshot = _snapshot()
+        assert str(self.champion.id) not in snapshot
+        assert snapshot[str(newcomer.id)] == (1, 1)
+        assert snapshot[str(self.rookie.id)] == (4, 4)
+
+    def test_incremental_refresh_matches_full_recompute(self, create_ranked_player):
+        rng = random.Random(32)
+        players = [
+            create_ranked_player(f"player_{i}", wins=rng.randint(0, 5), losses=rng.randint(0, 5)) for i in range(30)
+        ]
+        PlayerRank.objects.refresh()
+
+        for _ in range(5):
+            for player in rng.sample(players, 4):
+                Player.objects.filter(id=player.id).update(wins=rng.randint(0, 5), losses=rng.randint(0, 5))
+            PlayerRank.objects.refresh()
+            incremental = _snapshot()
+
+            PlayerRank.objects.all().delete()
+            PlayerRank.objects.refresh()
+
+            assert incremental == _snapshot()
+
+    def test_player_missing_from_snapshot_is_ranked_against_it(self, create_ranked_player):
+        PlayerRank.objects.refresh()
+        # Records changed since the refresh are not seen until the next one
+        Player.objects.filter(id=self.rookie.id).update(wins=20)
+        newcomer = create_ranked_player("newcomer", wins=5, losses=2)
+
+        entry = PlayerRank.objects.entry_for(newcomer)
+
+        assert (entry.rank, entry.position) == (2, 0)
+        PlayerRank.objects.refresh()
+        assert PlayerRank.objects.entry_for(newcomer).rank == 3
+
+    def test_refresh_scoreboard_command(self):
+        call_command("refresh_scoreboard")
+
+        assert PlayerRank.objects.count() == 4
+
+
+@pytest.mark.django_db
+class TestScoreboardKeysetPagination:
+    def test_pages_never_skip_or_repeat_tied_players(self, ranked_players_only, create_ranked_player):
+        players = [create_ranked_player(f"tied_{i}", wins=3, losses=1) for i in range(5)]
+        PlayerRank.objects.refresh()
+        client = APIClient()
+        client.force_authenticate(user=players[0])
+
+        response = client.get(reverse("scoreboard:scoreboard-list"), {"page_size": 2})
+        seen = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            seen += [entry["player_id"] for entry in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = client.get(response.data["next"])
+
+        assert seen == sorted(str(player.id) for player in players)
+        assert response.data["current_user_entry"]["rank"] == 1
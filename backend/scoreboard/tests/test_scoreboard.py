@@ -4,6 +4,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from players.models import Player
+from scoreboard.models import PlayerRank
 
 
 @pytest.mark.django_db
@@ -35,6 +36,7 @@ class TestScoreboardListView:
 
         # Authenticate as one of the players
         client.force_authenticate(user=player1)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -63,6 +65,7 @@ class TestScoreboardListView:
         player1.save()
 
         client.force_authenticate(user=player1)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -90,6 +93,7 @@ class TestScoreboardListView:
         low_player.save()
 
         client.force_authenticate(user=low_player)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -110,6 +114,7 @@ class TestScoreboardListView:
         top_player.save()
 
         client.force_authenticate(user=top_player)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -140,6 +145,7 @@ class TestScoreboardListView:
         player3.save()
 
         client.force_authenticate(user=player1)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -173,6 +179,7 @@ class TestScoreboardListView:
         inactive_player.save()
 
         client.force_authenticate(user=active_player)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -191,6 +198,7 @@ class TestScoreboardListView:
         player.save()
 
         client.force_authenticate(user=player)
+        PlayerRank.objects.refresh()
         url = reverse("scoreboard:scoreboard-list")
         response = client.get(url)
 
@@ -0,0 +1,89 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from players.models import Player
+from scoreboard.cache import invalidate_pages
+from scoreboard.models import PlayerRank
+
+
+@pytest.mark.django_db
+class TestScoreboardPageCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, ranked_players_only, create_ranked_player, settings, django_capture_on_commit_callbacks):
+        self.capture_on_commit_callbacks = django_capture_on_commit_callbacks
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        settings.SCOREBOARD_CACHED_POSITIONS = 3
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("scoreboard:scoreboard-list")
+        self.players = [create_ranked_player(f"player_{i}", wins=10 - i) for i in range(6)]
+        PlayerRank.objects.refresh()
+        self.client.force_authenticate(user=self.players[0])
+
+    def _usernames(self, response):
+        return [entry["username"] for entry in response.data["results"]]
+
+    def test_top_page_is_served_from_cache(self, django_assert_num_queries):
+        self.client.get(self.url, {"page_size": 3})
+
+        # The current user is on the cached page, so nothing is read from the database
+        with django_assert_num_queries(0):
+            response = self.client.get(self.url, {"page_size": 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._usernames(response) == ["player_0", "player_1", "player_2"]
+        assert response.data["current_user_entry"]["username"] == "player_0"
+
+    def test_change_inside_cached_range_invalidates_pages(self):
+        self.client.get(self.url, {"page_size": 3})
+        Player.objects.filter(id=self.players[5].id).update(wins=20)
+
+        with self.capture_on_commit_callbacks(execute=True):
+            PlayerRank.objects.refresh()
+        response = self.client.get(self.url, {"page_size": 3})
+
+        assert self._usernames(response) == ["player_5", "player_0", "player_1"]
+
+    def test_change_below_cached_range_keeps_pages(self, django_assert_num_queries):
+        self.client.get(self.url, {"page_size": 3})
+        Player.objects.filter(id=self.players[5].id).update(wins=6)
+
+        with self.capture_on_commit_callbacks(execute=True) as callbacks:
+            PlayerRank.objects.refresh()
+        assert invalidate_pages not in callbacks
+
+        with django_assert_num_queries(0):
+            response = self.client.get(self.url, {"page_size": 3})
+        assert self._usernames(response) == ["player_0", "player_1", "player_2"]
+
+    def test_pages_beyond_cached_range_are_not_cached(self, django_assert_num_queries):
+        second_page_url = self.client.get(self.url, {"page_size": 3}).data["next"]
+        self.client.get(second_page_url)
+
+        # The page query and the current user's entry
+        with django_assert_num_queries(2):
+            self.client.get(second_page_url)
+
+
+@pytest.mark.django_db
+class TestScoreboardMeView:
+    def test_me_returns_rank_with_stale_while_revalidate(self, create_ranked_player, settings):
+        settings.SCOREBOARD_RANK_MAX_AGE = 10
+        settings.SCOREBOARD_RANK_STALE_WHILE_REVALIDATE = 60
+        player = create_ranked_player("player", wins=3)
+        PlayerRank.objects.refresh()
+        client = APIClient()
+        client.force_authenticate(user=player)
+
+        response = client.get(reverse("scoreboard:scoreboard-me"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["player_id"] == str(player.id)
+        assert set(response["Cache-Control"].split(", ")) == {
+            "private",
+            "max-age=10",
+            "stale-while-revalidate=60",
+        }
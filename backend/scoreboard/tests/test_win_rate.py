@@ -0,0 +1,75 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from players.models import Player
+from scoreboard.models import PlayerRank
+from utils.game.turn_processor import TurnProcessor
+
+
+@pytest.mark.django_db
+class TestStoredWinRate:
+    def test_win_rate_is_computed_by_the_database(self, create_ranked_player):
+        assert create_ranked_player("rookie").win_rate == 0
+        veteran = create_ranked_player("veteran", wins=5, losses=3)
+        assert (veteran.win_rate, veteran.games) == (62.5, 8)
+
+    def test_completing_a_battle_updates_records_and_win_rate(self, create_ranked_player, create_battle):
+        winner = create_ranked_player("winner", wins=1, losses=1)
+        loser = create_ranked_player("loser", wins=1)
+        battle = create_battle(player1=winner, player2=loser)
+
+        TurnProcessor(battle, winner, TurnProcessor.ACTION_ATTACK)._complete_battle(winner)
+
+        assert Player.objects.filter(id=winner.id).values_list("wins", "losses", "win_rate").get() == (2, 1, 200 / 3)
+        assert Player.objects.filter(id=loser.id).values_list("wins", "losses", "win_rate").get() == (1, 1, 50.0)
+
+    def test_rank_snapshot_keeps_its_own_win_rate(self, create_ranked_player):
+        player = create_ranked_player("player", wins=3, losses=1)
+        PlayerRank.objects.refresh()
+
+        assert PlayerRank.objects.get(player=player).win_rate == 75.0
+
+
+@pytest.mark.django_db
+class TestWinRateScoreboardListView:
+    @pytest.fixture(autouse=True)
+    def setup(self, ranked_players_only, create_ranked_player, settings):
+        settings.SCOREBOARD_WIN_RATE_MIN_GAMES = 4
+        self.client = APIClient()
+        self.url = reverse("scoreboard:scoreboard-win-rate")
+        self.perfect_newcomer = create_ranked_player("perfect_newcomer", wins=2)
+        self.sharpshooter = create_ranked_player("sharpshooter", wins=9, losses=1)
+        self.grinder = create_ranked_player("grinder", wins=30, losses=10)
+        self.steady = create_ranked_player("steady", wins=3, losses=1)
+        self.client.force_authenticate(user=self.grinder)
+
+    def _usernames(self, response):
+        return [entry["username"] for entry in response.data["results"]]
+
+    def test_ranks_by_win_rate_then_wins(self):
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._usernames(response) == ["sharpshooter", "grinder", "steady"]
+        assert response.data["results"][0]["win_rate"] == 90
+
+    def test_min_games_filter(self):
+        response = self.client.get(self.url, {"min_games": 1})
+
+        assert self._usernames(response) == ["perfect_newcomer", "sharpshooter", "grinder", "steady"]
+        assert self._usernames(self.client.get(self.url, {"min_games": 20})) == ["grinder"]
+
+    def test_pages_follow_the_win_rate_order(self):
+        first_page = self.client.get(self.url, {"page_size": 2}).data
+        second_page = self.client.get(first_page["next"]).data
+
+        usernames = [entry["username"] for entry in first_page["results"] + second_page["results"]]
+        assert usernames == ["sharpshooter", "grinder", "steady"]
+
+    def test_invalid_min_games_returns_400(self):
+        response = self.client.get(self.url, {"min_games": 0})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["field_name"] == "min_games"
@@ -1,9 +1,19 @@
-from django.urls import path
+from django.urls import path, re_path
 
-from scoreboard.views import ScoreboardListView
+from scoreboard.views import (
+    PeriodScoreboardListView,
+    ScoreboardAroundMeView,
+    ScoreboardListView,
+    ScoreboardMeView,
+    WinRateScoreboardListView,
+)
 
 app_name = "scoreboard"
 
 urlpatterns = [
     path("", ScoreboardListView.as_view(), name="scoreboard-list"),
+    path("me/", ScoreboardMeView.as_view(), name="scoreboard-me"),
+    path("around-me/", ScoreboardAroundMeView.as_view(), name="scoreboard-around-me"),
+    path("win-rate/", WinRateScoreboardListView.as_view(), name="scoreboard-win-rate"),
+    re_path(r"^(?P<period>daily|weekly|season)/$", PeriodScoreboardListView.as_view(), name="scoreboard-period"),
 ]
@@ -1,16 +1,28 @@
-from django.db import models
-from rest_framework.generics import ListAPIView
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from rest_framework.generics import GenericAPIView, ListAPIView
 from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from players.models import Player
-from scoreboard.serializers import ScoreboardEntrySerializer
+from scoreboard import cache as scoreboard_cache
+from scoreboard.models import PlayerPeriodStats, PlayerRank
+from scoreboard.serializers import (
+    AroundMeQuerySerializer,
+    PeriodScoreboardEntrySerializer,
+    PeriodScoreboardQuerySerializer,
+    ScoreboardEntrySerializer,
+    WinRateEntrySerializer,
+    WinRateQuerySerializer,
+)
 
 
 class ScoreboardCursorPagination(CursorPagination):
     page_size = 20
-    ordering = "-wins", "losses"
+    # `position` is unique, so pages never skip or repeat players with the same record
+    ordering = "position"
     page_size_query_param = "page_size"
     max_page_size = 100
 
@@ -21,87 +33,153 @@ class ScoreboardListView(ListAPIView):
     pagination_class = ScoreboardCursorPagination
 
     def get_queryset(self):
-        return Player.objects.filter(is_active=True).order_by("-wins", "losses")
+        # Ranks are precomputed by the `refresh_scoreboard` command
+        return PlayerRank.objects.select_related("player").only(
+            "player__id", "player__username", "wins", "losses", "win_rate", "rank", "position"
+        )
 
     def list(self, request, *args, **kwargs):
+        # Top pages are shared by every player; only the current user's entry is per request
+        cache_key = scoreboard_cache.page_cache_key(
+            request.query_params.get(self.paginator.cursor_query_param), self.paginator.get_page_size(request)
+        )
+        payload = scoreboard_cache.get_page(cache_key)
+        if payload is None:
+            page = self.paginate_queryset(self.get_queryset())
+            payload = self.get_paginated_response(self.get_serializer(page, many=True).data).data
+            if not page or page[-1].position <= settings.SCOREBOARD_CACHED_POSITIONS:
+                scoreboard_cache.set_page(cache_key, payload)
+
+        # Add the current user's entry, taken from the page when they are on it
+        current_user = request.user
+        current_user_entry = next(
+            (entry for entry in payload["results"] if entry["player_id"] == str(current_user.id)),
+            None,
+        )
+        if current_user_entry is None:
+            current_user_entry = self.get_serializer(PlayerRank.objects.entry_for(current_user)).data
+
+        return Response(
+            {
+                **payload,
+                "current_user_entry": current_user_entry,
+                "current_user_in_top20": current_user_entry["rank"] <= 20,
+            }
+        )
+
+
+class ScoreboardMeView(GenericAPIView):
+    """
+    Rank-only view of the current player's scoreboard entry.
+
+    Ranks only move when the snapshot is refreshed, so clients and proxies may reuse a
+    response briefly and keep serving it while they revalidate in the background.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = ScoreboardEntrySerializer
+
+    def get(self, request, *args, **kwargs):
+        response = Response(self.get_serializer(PlayerRank.objects.entry_for(request.user)).data)
+        patch_cache_control(
+            response,
+            private=True,
+            max_age=settings.SCOREBOARD_RANK_MAX_AGE,
+            stale_while_revalidate=settings.SCOREBOARD_RANK_STALE_WHILE_REVALIDATE,
+        )
+        return response
+
+
+class PeriodScoreboardCursorPagination(CursorPagination):
+    page_size = 20
+    ordering = "-wins", "losses", "player_id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class PeriodScoreboardListView(ListAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = PeriodScoreboardEntrySerializer
+    pagination_class = PeriodScoreboardCursorPagination
+
+    def get_period_start(self):
+        query = PeriodScoreboardQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        day = query.validated_data.get("date") or timezone.localdate()
+        return PlayerPeriodStats.period_start_for(self.kwargs["period"], day)
+
+    def get_queryset(self):
+        # Rollup rows of a single period; `battles` is never scanned
+        return PlayerPeriodStats.objects.for_period(self.kwargs["period"], self.period_start).select_related("player")
+
+    def list(self, request, *args, **kwargs):
+        period = self.kwargs["period"]
+        self.period_start = self.get_period_start()
         queryset = self.get_queryset()
         page = self.paginate_queryset(queryset)
+        PlayerPeriodStats.objects.assign_ranks(page, period, self.period_start)
+
+        response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        current_user_entry = next((row for row in page if row.player_id == request.user.id), None)
+        if current_user_entry is None:
+            current_user_entry = queryset.filter(player=request.user).first() or PlayerPeriodStats(
+                player=request.user, period=period, period_start=self.period_start, win_rate=0.0
+            )
+            current_user_entry.rank = PlayerPeriodStats.objects.rank_of(
+                period, self.period_start, current_user_entry.wins, current_user_entry.losses
+            )
+
+        response.data["period"] = period
+        response.data["period_start"] = self.period_start
+        response.data["current_user_entry"] = self.get_serializer(current_user_entry).data
+        return response
+
+
+class WinRateCursorPagination(CursorPagination):
+    page_size = 20
+    ordering = "-win_rate", "-wins", "id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class WinRateScoreboardListView(ListAPIView):
+    """
+    Players with the best win rate, among those with at least `min_games` battles.
+
+    `win_rate` and `games` are stored columns. The partial `player_win_rate_ranked_idx` holds
+    only active players with at least WIN_RATE_INDEXED_MIN_GAMES battles, in page order, so
+    for the default `min_games` a page is read straight from it with no rows thrown away.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = WinRateEntrySerializer
+    pagination_class = WinRateCursorPagination
+
+    def get_queryset(self):
+        query = WinRateQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        min_games = query.validated_data.get("min_games", settings.SCOREBOARD_WIN_RATE_MIN_GAMES)
+
+        return Player.objects.filter(is_active=True, games__gte=min_games).only(
+            "id", "username", "wins", "losses", "win_rate"
+        )
+
+
+class ScoreboardAroundMeView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ScoreboardEntrySerializer
+
+    def get(self, request, *args, **kwargs):
+        query = AroundMeQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        entry = PlayerRank.objects.entry_for(request.user)
+        above, below = PlayerRank.objects.around(entry, query.validated_data["size"])
 
-        if page is not None:
-            # Calculate starting rank from cursor position
-            # For cursor pagination, we need to count players before the first item
-            first_item = page[0] if page else None
-            starting_rank = 1
-
-            if first_item:
-                # Count players with better stats (more wins or same wins but fewer losses)
-                better_players = (
-                    Player.objects.filter(is_active=True)
-                    .filter(
-                        models.Q(wins__gt=first_item.wins)
-                        | models.Q(wins=first_item.wins, losses__lt=first_item.losses)
-                    )
-                    .count()
-                )
-                starting_rank = better_players + 1
-
-            # Add rank to each entry
-            serializer = self.get_serializer(page, many=True)
-            entries = serializer.data
-            for i, entry in enumerate(entries):
-                entry["rank"] = starting_rank + i
-
-            response = self.get_paginated_response(entries)
-
-            # Add current user entry if not in top 20
-            current_user = request.user
-            current_user_entry = None
-            current_user_in_top20 = False
-
-            # Check if current user is in the current page
-            current_user_in_page = any(entry.id == current_user.id for entry in page)
-
-            if not current_user_in_page:
-                # Get current user's rank by counting players with better stats
-                better_players_count = (
-                    Player.objects.filter(is_active=True)
-                    .filter(
-                        models.Q(wins__gt=current_user.wins)
-                        | models.Q(wins=current_user.wins, losses__lt=current_user.losses)
-                    )
-                    .count()
-                )
-                current_user_rank = better_players_count + 1
-                current_user_in_top20 = current_user_rank <= 20
-
-                # Create entry for current user
-                current_user_entry = {
-                    "rank": current_user_rank,
-                    "player_id": str(current_user.id),
-                    "username": current_user.username,
-                    "wins": current_user.wins,
-                    "losses": current_user.losses,
-                    "win_rate": self._calculate_win_rate(current_user.wins, current_user.losses),
-                }
-            else:
-                # User is in the page, find their entry
-                for entry in entries:
-                    if entry["player_id"] == str(current_user.id):
-                        current_user_entry = entry
-                        current_user_in_top20 = True
-                        break
-
-            # Add current user info to response
-            response.data["current_user_entry"] = current_user_entry
-            response.data["current_user_in_top20"] = current_user_in_top20
-
-            return response
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-    def _calculate_win_rate(self, wins, losses):
-        total = wins + losses
-        if total == 0:
-            return 0
-        return round((wins / total) * 100)
+        return Response(
+            {
+                "results": self.get_serializer([*above, entry, *below], many=True).data,
+                "current_user_entry": self.get_serializer(entry).data,
+            }
+        )
@@ -0,0 +1,13 @@
+from django.core.cache import cache
+
+
+def get_redis_client():
+    """
+    Return the raw Redis client behind the default cache.
+
+    Returns None when the cache is not Redis-backed (e.g. DummyCache in tests), so
+    callers can fall back to the database.
+    """
+    if hasattr(cache, "_cache") and hasattr(cache._cache, "get_client"):
+        return cache._cache.get_client(write=True)
+    return None
@@ -1,7 +1,22 @@
 import os
 
 CACHE_TTL = int(os.environ.get("CACHE_TTL", 900))  # 15 minutes
+CACHE_STALE_TTL = int(os.environ.get("CACHE_STALE_TTL", 300))  # Served stale while refreshing, after CACHE_TTL
+CACHE_COMPRESSION_LEVEL = int(os.environ.get("CACHE_COMPRESSION_LEVEL", 6))  # zlib level of cached response bodies
+
+# Single-flight regeneration of cached views
+CACHE_LOCK_TIMEOUT = 10  # Seconds a regeneration lock is held at most
+CACHE_LOCK_WAIT = 2.0  # Seconds a request waits for another request's regeneration
+CACHE_LOCK_POLL_INTERVAL = 0.05
 
 CACHE_PREFIX_POKEMON = "pokemon"
 CACHE_PREFIX_POKEMON_TYPE = "pokemon_type"
 CACHE_PREFIX_TYPE_EFFECTIVENESS = "type_effectiveness"
+CACHE_PREFIX_SCOREBOARD = "scoreboard"
+
+CACHE_PREFIXES = (
+    CACHE_PREFIX_POKEMON,
+    CACHE_PREFIX_POKEMON_TYPE,
+    CACHE_PREFIX_TYPE_EFFECTIVENESS,
+    CACHE_PREFIX_SCOREBOARD,
+)
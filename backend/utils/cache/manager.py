@@ -1,51 +1,380 @@
+import hashlib
 import logging
+import math
+import threading
+import time
+import zlib
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from urllib.parse import urlencode
 
 from django.core.cache import cache
-from django.views.decorators.cache import cache_page
+from django.db import close_old_connections, connections, transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_response_headers
+from rest_framework.authentication import BaseAuthentication
 
-from utils.cache.constants import CACHE_TTL
+from utils.cache.client import get_redis_client  # noqa: F401 (re-exported)
+from utils.cache.constants import (
+    CACHE_COMPRESSION_LEVEL,
+    CACHE_LOCK_POLL_INTERVAL,
+    CACHE_LOCK_TIMEOUT,
+    CACHE_LOCK_WAIT,
+    CACHE_PREFIXES,
+    CACHE_STALE_TTL,
+    CACHE_TTL,
+)
+from utils.metrics import histogram_quantile, metrics, parse_series
 
 logger = logging.getLogger(__name__)
 
+# Prefixes collected by the outermost active `batch_cache_invalidation` block of each thread
+_batched_invalidations = threading.local()
+
+
+def generation_key(prefix_key: str) -> str:
+    return f"{prefix_key}:generation"
+
+
+def get_cache_generation(prefix_key: str) -> int:
+    """
+    Return the current generation of a cache namespace.
+
+    The counter is seeded from the clock, so a counter lost to eviction or a Redis restart
+    can never come back at a value whose entries are still cached.
+    """
+    return cache.get_or_set(generation_key(prefix_key), time.time_ns, timeout=None)
+
+
+def view_cache_key(prefix_key: str, generation: int, request) -> str:
+    """
+    Cache key of a GET response.
+
+    Built from the absolute URL (links in the payload embed the host) with its query
+    parameters sorted, and the media type the renderer negotiated rather than the raw
+    Accept header, so equivalent requests share one entry.
+    """
+    query = urlencode(sorted((name, value) for name, values in request.GET.lists() for value in values))
+    media_type = getattr(request, "accepted_media_type", None) or request.META.get("HTTP_ACCEPT", "")
+    url = f"{request.scheme}://{request.get_host()}{request.path}?{query}"
+    digest = hashlib.md5(f"{url}|{media_type}".encode(), usedforsecurity=False).hexdigest()
+    return f"{prefix_key}:{generation}:view:{digest}"
+
+
+def _cached_response(entry) -> HttpResponse:
+    """Rebuild a response from a cached payload entry."""
+    fresh_until, status_code, content_type, body = entry
+    response = HttpResponse(zlib.decompress(body), status=status_code, content_type=content_type)
+    patch_response_headers(response, max(round(fresh_until - time.time()), 0))
+    return response
+
+
+def _render_response(view_func, request, *args, **kwargs):
+    """Run the view and return its rendered response, finalized by the DRF view that owns the request."""
+    response = view_func(request, *args, **kwargs)
+    view = getattr(request, "parser_context", {}).get("view")
+    if view is not None:
+        response = view.finalize_response(request, response, *args, **kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+class _RefreshAuthentication(BaseAuthentication):
+    """Authenticate a background refresh as the user of the request that triggered it."""
+
+    def authenticate(self, request):
+        user = getattr(request._request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user, None
+
+
+def _refresh_view(callback):
+    """
+    Return the view a background refresh dispatches its request through.
+
+    DRF views are rebuilt from the URL callback with `_RefreshAuthentication` and no
+    throttles: the refresh is not a new client request, so it neither re-checks the
+    credentials of the original one nor spends its user's throttle quota.
+    """
+    cls = getattr(callback, "cls", None)
+    if cls is None:
+        return callback
+    initkwargs = {**callback.initkwargs, "authentication_classes": [_RefreshAuthentication], "throttle_classes": []}
+    actions = getattr(callback, "actions", None)
+    return cls.as_view(actions, **initkwargs) if actions else cls.as_view(**initkwargs)
+
+
+def _refresh_request(request, key: str) -> HttpRequest:
+    """
+    Return a copy of a GET request to re-run its view in another thread.
+
+    DRF requests and views are not thread-safe, so the copy is a plain `HttpRequest`
+    that shares no state with the original: the refresh dispatches it through a new
+    view instance. It is marked with the cache key to fill, and carries the user the
+    original request was authenticated as.
+    """
+    original = getattr(request, "_request", request)
+    fresh = HttpRequest()
+    fresh.method = "GET"
+    fresh.path, fresh.path_info = original.path, original.path_info
+    fresh.META = {name: value for name, value in original.META.items() if name != "wsgi.input"}
+    fresh.GET = original.GET.copy()
+    fresh.resolver_match = original.resolver_match
+    fresh.user = request.user
+    fresh.cache_refresh_key = key
+    return fresh
+
 
 def cache_page_with_prefix(prefix_key, timeout=None):
     """
     Decorator that caches a view with a prefix key for cache invalidation.
 
+    Only the rendered body is stored, zlib-compressed, with its status and content type;
+    responses are rebuilt from it on every hit. Responses are keyed under the namespace's
+    current generation, so `invalidate_cache_prefix` only has to bump the generation:
+    entries of older generations are never read again and expire on their own.
+
+    Every request is recorded in the `cache_lookup_seconds` histogram of the prefix with
+    its result (`hit`, `stale` or `miss`), and every rebuild in `cache_fill_seconds`.
+
+    Regeneration is single-flight. A response is fresh for `timeout` seconds and then
+    served stale for another CACHE_STALE_TTL seconds while one request, holding a short
+    per-key lock, rebuilds it in a background thread from a copy of the request, without
+    authenticating or throttling it again. On a miss (expiry or invalidation) only the
+    lock holder queries the database; concurrent requests get the previous generation's
+    response when it still exists, or wait up to CACHE_LOCK_WAIT seconds for the new one.
+
     Args:
         prefix_key: The cache prefix key (e.g., 'pokemon', 'pokemon_type')
         timeout: Cache timeout in seconds (defaults to CACHE_TTL from constants)
     """
     if timeout is None:
         timeout = CACHE_TTL
-    return cache_page(timeout, key_prefix=prefix_key)
+
+    def fill(key, view_func, request, *args, **kwargs):
+        started = time.perf_counter()
+        response = _render_response(view_func, request, *args, **kwargs)
+        metrics.observe("cache_fill_seconds", time.perf_counter() - started, prefix=prefix_key)
+        if response.status_code == 200 and not response.streaming:
+            patch_response_headers(response, timeout)
+            body = zlib.compress(response.content, CACHE_COMPRESSION_LEVEL)
+            entry = (time.time() + timeout, response.status_code, response["Content-Type"], body)
+            cache.set(key, entry, timeout + CACHE_STALE_TTL)
+        return response
+
+    def refresh_in_background(key, request):
+        # Dispatched like a new request: the view below fills `key` when it sees the mark
+        close_old_connections()
+        try:
+            match = request.resolver_match
+            _refresh_view(match.func)(request, *match.args, **match.kwargs)
+        except Exception:
+            logger.exception("Failed to refresh cached view: %s", key)
+        finally:
+            cache.delete(f"{key}:lock")
+            # The thread ends here, so its connections are closed whatever CONN_MAX_AGE is
+            connections.close_all()
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if request.method != "GET":
+                return view_func(request, *args, **kwargs)
+            if (refresh_key := getattr(request, "cache_refresh_key", None)) is not None:
+                return fill(refresh_key, view_func, request, *args, **kwargs)
+
+            started = time.perf_counter()
+
+            def record(result):
+                metrics.observe("cache_lookup_seconds", time.perf_counter() - started, prefix=prefix_key, result=result)
+
+            generation = get_cache_generation(prefix_key)
+            key = view_cache_key(prefix_key, generation, request)
+            lock_key = f"{key}:lock"
+
+            entry = cache.get(key)
+            if entry is not None:
+                fresh = entry[0] > time.time()
+                if not fresh and cache.add(lock_key, 1, CACHE_LOCK_TIMEOUT):
+                    threading.Thread(
+                        target=refresh_in_background, args=(key, _refresh_request(request, key)), daemon=True
+                    ).start()
+                response = _cached_response(entry)
+                record("hit" if fresh else "stale")
+                return response
+
+            if cache.add(lock_key, 1, CACHE_LOCK_TIMEOUT):
+                try:
+                    return fill(key, view_func, request, *args, **kwargs)
+                finally:
+                    cache.delete(lock_key)
+                    record("miss")
+
+            # Another request is regenerating this response
+            stale = cache.get(view_cache_key(prefix_key, generation - 1, request))
+            if stale is not None:
+                response = _cached_response(stale)
+                record("stale")
+                return response
+            deadline = time.monotonic() + CACHE_LOCK_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(CACHE_LOCK_POLL_INTERVAL)
+                if (entry := cache.get(key)) is not None:
+                    response = _cached_response(entry)
+                    record("miss")
+                    return response
+            try:
+                return view_func(request, *args, **kwargs)
+            finally:
+                record("miss")
+
+        return _wrapped_view
+
+    return decorator
+
+
+def cache_memory_usage(prefixes=CACHE_PREFIXES, batch_size: int = 500) -> dict[str, dict[str, int]]:
+    """
+    Return the number of Redis keys and the bytes they use (`MEMORY USAGE`) per cache prefix.
+
+    Scans the keyspace, so it is meant for reports, never for request paths.
+
+    Raises:
+        RuntimeError: If the cache is not Redis-backed
+    """
+    redis_client = get_redis_client()
+    if redis_client is None:
+        raise RuntimeError("Cache memory usage requires the Redis cache backend")
+
+    usage = {}
+    for prefix in prefixes:
+        keys = bytes_used = 0
+        batch = []
+        for key in redis_client.scan_iter(match=cache.make_key(f"{prefix}:*"), count=batch_size):
+            batch.append(key)
+            if len(batch) == batch_size:
+                keys, bytes_used = keys + len(batch), bytes_used + _memory_usage(redis_client, batch)
+                batch = []
+        keys, bytes_used = keys + len(batch), bytes_used + _memory_usage(redis_client, batch)
+        usage[prefix] = {"keys": keys, "bytes": bytes_used}
+    return usage
+
+
+def _memory_usage(redis_client, keys) -> int:
+    with redis_client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.memory_usage(key)
+        # Keys expiring between SCAN and MEMORY USAGE report None
+        return sum(size or 0 for size in pipe.execute())
+
+
+@contextmanager
+def batch_cache_invalidation():
+    """
+    Collect the prefixes invalidated inside the block and invalidate each of them once.
+
+    The collected prefixes are flushed with `transaction.on_commit` when the block exits:
+    right away in autocommit mode, after the surrounding transaction commits otherwise
+    (and never if it rolls back). Nested blocks are flushed by the outermost one. Also
+    usable as a decorator.
+    """
+    if getattr(_batched_invalidations, "prefixes", None) is not None:
+        yield
+        return
+
+    _batched_invalidations.prefixes = prefixes = set()
+    try:
+        yield
+    finally:
+        _batched_invalidations.prefixes = None
+        if prefixes:
+            transaction.on_commit(lambda: [invalidate_cache_prefix(prefix) for prefix in sorted(prefixes)])
 
 
 def invalidate_cache_prefix(prefix_key):
     """
     Invalidate all cache entries with the given prefix.
-    This function only works with Redis backend. It deletes all keys matching
+
+    A single INCR of the prefix generation, whatever the number of cached keys, followed
+    by a broadcast that drops the prefix from the in-process cache of every worker. Inside
+    `batch_cache_invalidation` the prefix is only collected. Both steps together are
+    recorded in the `cache_invalidation_seconds` histogram of the prefix.
 
     Args:
         prefix_key: The cache prefix key to invalidate
     """
-    if hasattr(cache, "_cache") and hasattr(cache._cache, "get_client"):
+    batched = getattr(_batched_invalidations, "prefixes", None)
+    if batched is not None:
+        batched.add(prefix_key)
+        return
+
+    started = time.perf_counter()
+    try:
+        cache.incr(generation_key(prefix_key))
+    except ValueError:
+        # No generation yet: nothing has been cached under this prefix
+        pass
+    except Exception:
+        # A cache outage must not fail the write that triggered the invalidation
+        logger.exception("Failed to invalidate cache prefix: %s", prefix_key)
+        return
+
+    # Tell every worker to drop its in-process copies of the prefix (TieredRedisCache)
+    if hasattr(cache, "invalidate_namespace"):
         try:
-            redis_client = cache._cache.get_client(write=True)
-
-            # ToDo: Check which pattern is use in the cache_page in our version
-            pattern1 = f"*:views.decorators.cache.cache_page.*:{prefix_key}:*"
-            pattern2 = f"views.decorators.cache.cache_page.*:{prefix_key}:*"
-            for pattern in (pattern1, pattern2):
-                # Find matching keys in batch
-                cursor = 0
-                while True:
-                    cursor, keys = redis_client.scan(cursor, match=pattern, count=100)
-                    if keys:
-                        redis_client.delete(*keys)
-                    if cursor == 0:
-                        break
-
-        except (AttributeError, Exception):
-            # If cache operations fail (e.g., DummyCache), just continue silently
-            logger.exception("Failed to invalidate cache prefix: %s", prefix_key)
+            cache.invalidate_namespace(prefix_key)
+        except Exception:
+            logger.exception("Failed to broadcast invalidation of cache prefix: %s", prefix_key)
+    metrics.observe("cache_invalidation_seconds", time.perf_counter() - started, prefix=prefix_key)
+
+
+def cache_stats(prefixes=CACHE_PREFIXES) -> dict[str, dict[str, float]]:
+    """
+    Summarize the recorded cache metrics of each prefix (totals of every worker process).
+
+    Returns the number of hits, stale hits and misses with the hit ratio (stale hits
+    included), the number of fills and invalidations, and the median and 95th percentile
+    duration in seconds of hits, misses, fills and invalidations (NaN when nothing was
+    recorded).
+    """
+    counts = {prefix: defaultdict(float) for prefix in prefixes}
+    buckets = {prefix: defaultdict(dict) for prefix in prefixes}
+    histograms = {
+        ("cache_lookup_seconds", "hit"): "hit",
+        ("cache_lookup_seconds", "stale"): "stale_hit",
+        ("cache_lookup_seconds", "miss"): "miss",
+        ("cache_fill_seconds", None): "fill",
+        ("cache_invalidation_seconds", None): "invalidation",
+    }
+    for series, value in metrics.snapshot().items():
+        name, labels = parse_series(series)
+        if labels.get("prefix") not in counts:
+            continue
+        metric, _, suffix = name.rpartition("_")
+        event = histograms.get((metric, labels.get("result")))
+        if event is None:
+            continue
+        if suffix == "count":
+            counts[labels["prefix"]][event] += value
+        elif suffix == "bucket":
+            buckets[labels["prefix"]][event][labels["le"]] = value
+
+    summary = {}
+    for prefix in prefixes:
+        hits, stale_hits, misses = (counts[prefix][event] for event in ("hit", "stale_hit", "miss"))
+        lookups = hits + stale_hits + misses
+        summary[prefix] = {
+            "hits": hits,
+            "stale_hits": stale_hits,
+            "misses": misses,
+            "hit_ratio": (hits + stale_hits) / lookups if lookups else math.nan,
+            "fills": counts[prefix]["fill"],
+            "invalidations": counts[prefix]["invalidation"],
+        }
+        for event in ("hit", "miss", "fill", "invalidation"):
+            for quantile in (50, 95):
+                summary[prefix][f"{event}_p{quantile}"] = histogram_quantile(buckets[prefix][event], quantile / 100)
+    return summary
@@ -0,0 +1,227 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.redis import RedisCache
+
+from utils.cache.constants import CACHE_PREFIXES
+
+logger = logging.getLogger(__name__)
+
+
+def key_namespace(key: str) -> str:
+    """Return the cache prefix a raw key belongs to (e.g. 'pokemon' for a cached Pokemon page)."""
+    return key.partition(":")[0]
+
+
+class LocalLRUCache:
+    """
+    Thread-safe in-process LRU of serialized cache values with a hard memory cap.
+
+    Sizes are the byte length of keys and serialized values, so the cap bounds what the
+    entries hold; least recently used entries are evicted until a new one fits. Values
+    larger than the whole cap are never stored.
+    """
+
+    def __init__(self, max_bytes: int, timeout: float):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (namespace, value, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, namespace: str, value: bytes) -> None:
+        entry_size = len(key) + len(value)
+        with self._lock:
+            self._pop(key)
+            if entry_size > self.max_bytes:
+                return
+            while self.size + entry_size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+            self._entries[key] = (namespace, value, time.monotonic() + self.timeout)
+            self.size += entry_size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def drop_namespace(self, namespace: str) -> None:
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[0] == namespace]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(key) + len(entry[1])
+
+
+class InvalidationListener:
+    """
+    Background thread dropping local namespaces announced on a Redis pub/sub channel.
+
+    Messages published while the subscription is down are lost, so the local cache is
+    cleared every time the listener (re)subscribes.
+    """
+
+    RECONNECT_DELAY = 1
+
+    def __init__(self, get_client, channel: str, local: LocalLRUCache):
+        self.get_client = get_client
+        self.channel = channel
+        self.local = local
+        self.thread = threading.Thread(target=self._run, name="cache-invalidation-listener", daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def handle(self, message: dict) -> None:
+        if message["type"] == "subscribe":
+            self.local.clear()
+        elif message["type"] == "message":
+            # Either a namespace or a single (versioned, hence colon-separated) cache key
+            target = message["data"].decode()
+            if ":" in target:
+                self.local.delete(target)
+            else:
+                self.local.drop_namespace(target)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                pubsub = self.get_client().pubsub()
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    self.handle(message)
+            except Exception:
+                logger.warning("Cache invalidation listener disconnected; retrying", exc_info=True)
+                self.local.clear()
+                time.sleep(self.RECONNECT_DELAY)
+
+
+# One local cache per process and Redis location: Django creates a cache backend per thread
+_local_caches = {}
+_local_caches_lock = threading.Lock()
+
+
+class TieredRedisCache(RedisCache):
+    """
+    Redis cache backend with an in-process LRU in front of selected namespaces.
+
+    Reads of keys under `LOCAL_CACHE["PREFIXES"]` (all `CACHE_PREFIX_*` namespaces by
+    default) are served from process memory when possible and filled from Redis on a
+    miss; every other key goes straight to Redis. Local entries live at most
+    `LOCAL_CACHE["TIMEOUT"]` seconds and the whole local cache holds at most
+    `LOCAL_CACHE["MAX_BYTES"]` bytes per worker process.
+
+    `invalidate_namespace` drops a namespace locally and publishes it on
+    `LOCAL_CACHE["CHANNEL"]`, so every other worker drops it as soon as its listener
+    thread receives the message. Overwriting a cached key is published the same way.
+    """
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        options = params.get("LOCAL_CACHE", {})
+        self.local_prefixes = frozenset(options.get("PREFIXES", CACHE_PREFIXES))
+        self.local_max_bytes = options.get("MAX_BYTES", 32 * 1024 * 1024)
+        self.local_timeout = options.get("TIMEOUT", 60)
+        self.invalidation_channel = options.get("CHANNEL", "cache:invalidate")
+
+    @property
+    def local(self) -> LocalLRUCache:
+        # Keyed by pid as well, so forked workers never share (or inherit) a local cache
+        registry_key = (os.getpid(), tuple(self._servers), self.invalidation_channel)
+        local = _local_caches.get(registry_key)
+        if local is None:
+            with _local_caches_lock:
+                local = _local_caches.get(registry_key)
+                if local is None:
+                    local = LocalLRUCache(self.local_max_bytes, self.local_timeout)
+                    InvalidationListener(
+                        lambda: self._cache.get_client(write=True), self.invalidation_channel, local
+                    ).start()
+                    _local_caches[registry_key] = local
+        return local
+
+    def _local_namespace(self, key: str) -> str | None:
+        namespace = key_namespace(key)
+        return namespace if namespace in self.local_prefixes else None
+
+    def get(self, key, default=None, version=None):
+        namespace = self._local_namespace(key)
+        if namespace is None:
+            return super().get(key, default, version)
+
+        key = self.make_and_validate_key(key, version=version)
+        value = self.local.get(key)
+        if value is None:
+            value = self._cache.get_client(key).get(key)
+            if value is None:
+                return default
+            self.local.set(key, namespace, value)
+        return self._cache._serializer.loads(value)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        super().set(key, value, timeout, version)
+        if self._local_namespace(key) is not None:
+            # Other workers may hold the previous value of a refreshed entry
+            key = self.make_and_validate_key(key, version=version)
+            self.local.delete(key)
+            self._cache.get_client(write=True).publish(self.invalidation_channel, key)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._drop_local(key, version)
+        return super().add(key, value, timeout, version)
+
+    def delete(self, key, version=None):
+        self._drop_local(key, version)
+        return super().delete(key, version)
+
+    def incr(self, key, delta=1, version=None):
+        self._drop_local(key, version)
+        return super().incr(key, delta, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        for key in data:
+            self._drop_local(key, version)
+        return super().set_many(data, timeout, version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._drop_local(key, version)
+        return super().delete_many(keys, version)
+
+    def clear(self):
+        self.local.clear()
+        return super().clear()
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop `namespace` from the local cache of every worker."""
+        self.local.drop_namespace(namespace)
+        self._cache.get_client(write=True).publish(self.invalidation_channel, namespace)
+
+    def _drop_local(self, key, version) -> None:
+        if self._local_namespace(key) is not None:
+            self.local.delete(self.make_and_validate_key(key, version=version))
@@ -0,0 +1,22 @@
+from django.db import models
+from django.db.models.functions import Cast
+
+
+def win_rate_field(**kwargs) -> models.GeneratedField:
+    """
+    Stored percentage of games won, computed by the database from `wins` and `losses`.
+
+    The column is rewritten in the same statement as the counters it derives from, so it
+    can never drift from them and can be indexed, filtered and sorted on like any other column.
+    Records without games have a win rate of 0.
+    """
+    return models.GeneratedField(
+        expression=models.Case(
+            models.When(wins=0, losses=0, then=models.Value(0.0)),
+            default=Cast("wins", models.FloatField()) * 100 / (models.F("wins") + models.F("losses")),
+            output_field=models.FloatField(),
+        ),
+        output_field=models.FloatField(),
+        db_persist=True,
+        **kwargs,
+    )
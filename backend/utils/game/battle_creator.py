@@ -8,6 +8,7 @@ from rest_framework import status
 
 from battles.models import Battle
 from players.models import Player
+from pokemon.cache import get_pokemon
 from pokemon.models import PlayerPokemon, Pokemon
 from utils.exceptions.exceptions import ToastError
 
@@ -113,8 +114,8 @@ class BattleCreator:
         opponent: Player,
         opponent_pokemon: PlayerPokemon,
     ) -> BattleSetup:
-        player_speed = player_pokemon.pokemon.base_speed
-        opponent_speed = opponent_pokemon.pokemon.base_speed
+        player_speed = get_pokemon(player_pokemon.pokemon_id).base_speed
+        opponent_speed = get_pokemon(opponent_pokemon.pokemon_id).base_speed
 
         if player_speed >= opponent_speed:
             return BattleSetup(
@@ -142,8 +143,8 @@ class BattleCreator:
             status=Battle.STATUS_ACTIVE,
             current_turn_player=setup.first_turn_player,
             turn_number=1,
-            player1_current_hp=setup.player1_pokemon.pokemon.base_hp,
-            player2_current_hp=setup.player2_pokemon.pokemon.base_hp,
+            player1_current_hp=get_pokemon(setup.player1_pokemon.pokemon_id).base_hp,
+            player2_current_hp=get_pokemon(setup.player2_pokemon.pokemon_id).base_hp,
             player1_potions=self.DEFAULT_POTIONS,
             player1_x_attack=self.DEFAULT_X_ATTACK,
             player1_x_defense=self.DEFAULT_X_DEFENSE,
@@ -152,7 +153,7 @@ class BattleCreator:
             player2_x_defense=self.DEFAULT_X_DEFENSE,
         )
 
-        battle.player1_data = {"player": battle.player1, "player_pokemon": battle.player1_pokemon}
-        battle.player2_data = {"player": battle.player2, "player_pokemon": battle.player2_pokemon}
+        battle.player1_data = {"player": battle.player1, "pokemon": get_pokemon(battle.player1_pokemon.pokemon_id)}
+        battle.player2_data = {"player": battle.player2, "pokemon": get_pokemon(battle.player2_pokemon.pokemon_id)}
 
         return battle
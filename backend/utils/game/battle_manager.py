@@ -6,6 +6,7 @@ from rest_framework import status
 
 from battles.models import Battle
 from players.models import Player
+from pokemon.cache import get_player_pokemon
 from utils.exceptions.exceptions import ToastError
 from utils.game.ai import BattleAI
 from utils.game.battle_creator import BattleCreator
@@ -172,11 +173,11 @@ class BattleManager:
 
         self.battle.player1_data = {
             "player": self.battle.player1,
-            "player_pokemon": self.battle.player1_pokemon,
+            "pokemon": get_player_pokemon(self.battle.player1_pokemon_id),
         }
         self.battle.player2_data = {
             "player": self.battle.player2,
-            "player_pokemon": self.battle.player2_pokemon,
+            "pokemon": get_player_pokemon(self.battle.player2_pokemon_id),
         }
 
         return self.battle
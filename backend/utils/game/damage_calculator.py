@@ -1,5 +1,6 @@
 import random
 
+from pokemon.cache import get_type_chart
 from pokemon.models import TypeEffectiveness
 
 
@@ -7,27 +8,18 @@ def get_type_effectiveness(attacker_pokemon, defender_pokemon):
     """
     Calculate type effectiveness multiplier between two Pokemon.
     For dual-type defenders, uses the product of both type matchups.
+    Accepts `Pokemon` rows and `PokemonRecord`s; matchups come from the cached type chart.
     """
-    attacker_type = attacker_pokemon.primary_type
+    chart = get_type_chart()
+    attacker_type = attacker_pokemon.primary_type.name
 
     defender_primary = defender_pokemon.primary_type
     defender_secondary = defender_pokemon.secondary_type
 
-    primary_multiplier = TypeEffectiveness.NORMAL
-    secondary_multiplier = TypeEffectiveness.NORMAL
-
-    try:
-        effectiveness = TypeEffectiveness.objects.get(attacker_type=attacker_type, defender_type=defender_primary)
-        primary_multiplier = effectiveness.multiplier
-    except TypeEffectiveness.DoesNotExist:
-        primary_multiplier = TypeEffectiveness.NORMAL
+    primary_multiplier = chart.get((attacker_type, defender_primary.name), TypeEffectiveness.NORMAL)
 
     if defender_secondary:
-        try:
-            effectiveness = TypeEffectiveness.objects.get(attacker_type=attacker_type, defender_type=defender_secondary)
-            secondary_multiplier = effectiveness.multiplier
-        except TypeEffectiveness.DoesNotExist:
-            secondary_multiplier = TypeEffectiveness.NORMAL
+        secondary_multiplier = chart.get((attacker_type, defender_secondary.name), TypeEffectiveness.NORMAL)
         return primary_multiplier * secondary_multiplier
 
     return primary_multiplier
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from pokemon.cache import get_player_pokemon
 from utils.exceptions.exceptions import ToastError
 
 
@@ -69,7 +70,7 @@ class PotionHandler(BaseItemHandler):
     def _apply(cls, battle, player_name) -> ItemUseResult:
         setattr(battle, f"{player_name}_potions", getattr(battle, f"{player_name}_potions") - 1)
         current_hp = getattr(battle, f"{player_name}_current_hp")
-        max_hp = getattr(battle, f"{player_name}_pokemon").pokemon.base_hp
+        max_hp = get_player_pokemon(getattr(battle, f"{player_name}_pokemon_id")).base_hp
         new_hp = min(max_hp, current_hp + cls.HEAL_AMOUNT)
         setattr(battle, f"{player_name}_current_hp", new_hp)
         hp_restored = new_hp - current_hp
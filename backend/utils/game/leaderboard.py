@@ -0,0 +1,127 @@
+import logging
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+
+from utils.cache.manager import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_KEY = "leaderboard:players"
+
+# Wins dominate the score and fewer losses break ties. Scores stay exact in Redis' double
+# precision as long as a player has fewer than WINS_WEIGHT losses.
+WINS_WEIGHT = 10_000_000
+
+
+def leaderboard_score(wins: int, losses: int) -> int:
+    return wins * WINS_WEIGHT - losses
+
+
+class Leaderboard:
+    """
+    Rank index over the scoreboard snapshot (`PlayerRank`), kept in a Redis sorted set.
+
+    The set holds the record every snapshot row was ranked with, so a rank read from it is
+    the `RANK()` the snapshot assigns: the number of players with a strictly higher score
+    plus one, players with the same record sharing it. It ranks players who joined after
+    the last refresh with a single O(log n) `ZCOUNT` instead of counting snapshot rows.
+
+    `PlayerRank.objects.refresh` writes the rows it changes once its transaction commits.
+    When Redis is unavailable or the set has not been built yet, ranks are counted from
+    the snapshot table instead.
+    """
+
+    def __init__(self, key: str = LEADERBOARD_KEY):
+        self.key = key
+
+    def rank(self, wins: int, losses: int) -> int:
+        """Return the rank a player with this record gets against the snapshot (1 is the best)."""
+        from scoreboard.models import PlayerRank
+
+        client = get_redis_client()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.exists(self.key)
+                pipe.zcount(self.key, f"({leaderboard_score(wins, losses)}", "+inf")
+                exists, better = pipe.execute()
+                if exists:
+                    return better + 1
+            except RedisError:
+                logger.exception("Leaderboard rank lookup failed, falling back to the database")
+
+        return PlayerRank.objects.better_than(wins, losses).count() + 1
+
+    def player_rank(self, player) -> int:
+        return self.rank(player.wins, player.losses)
+
+    def sync(self, records: dict, removed=()) -> None:
+        """
+        Write the snapshot records of changed players into the set.
+
+        Args:
+            records: (wins, losses) of each player whose snapshot row was written, by player id
+            removed: Ids of players dropped from the snapshot
+
+        Nothing is written before the set has been built, as a partial set would report
+        wrong ranks.
+        """
+        client = get_redis_client()
+        if client is None or not (records or removed):
+            return
+
+        try:
+            if not client.exists(self.key):
+                return
+            pipe = client.pipeline(transaction=False)
+            if records:
+                pipe.zadd(
+                    self.key,
+                    {str(player_id): leaderboard_score(wins, losses) for player_id, (wins, losses) in records.items()},
+                )
+            if removed:
+                pipe.zrem(self.key, *(str(player_id) for player_id in removed))
+            pipe.execute()
+        except RedisError:
+            # The periodic rebuild repairs any missed update
+            logger.exception("Failed to update the leaderboard for %s players", len(records) + len(removed))
+
+    def rebuild(self, batch_size: int = 5000) -> int:
+        """
+        Rebuild the set from the snapshot table and swap it in atomically.
+
+        Rows are streamed into a temporary key which then replaces the live one with
+        `RENAME`, so readers never observe a partially built leaderboard.
+
+        Returns:
+            Number of players in the rebuilt leaderboard
+        """
+        from scoreboard.models import PlayerRank
+
+        client = get_redis_client()
+        if client is None:
+            raise RuntimeError("The leaderboard requires a Redis cache backend")
+
+        temp_key = f"{self.key}:rebuild:{uuid4().hex}"
+        total = 0
+        batch = {}
+        rows = PlayerRank.objects.values_list("player_id", "wins", "losses")
+        for player_id, wins, losses in rows.iterator(chunk_size=batch_size):
+            batch[str(player_id)] = leaderboard_score(wins, losses)
+            if len(batch) >= batch_size:
+                client.zadd(temp_key, batch)
+                total += len(batch)
+                batch = {}
+        if batch:
+            client.zadd(temp_key, batch)
+            total += len(batch)
+
+        if total:
+            client.rename(temp_key, self.key)
+        else:
+            client.delete(self.key)
+        return total
+
+
+leaderboard = Leaderboard()
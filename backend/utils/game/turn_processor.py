@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 
+from django.db.models import F
+
 from battles.models import Battle, BattleTurn
+from players.models import Player
+from pokemon.cache import get_player_pokemon
+from scoreboard.models import PlayerPeriodStats
 from utils.exceptions.exceptions import ToastError
 from utils.game.damage_calculator import calculate_damage
 
@@ -61,8 +66,8 @@ class TurnProcessor:
         )
 
     def _calculate_damage(self) -> dict:
-        attacker_pokemon = self.battle.get_player_pokemon(self.player).pokemon
-        defender_pokemon = self.battle.get_player_pokemon(self.opponent).pokemon
+        attacker_pokemon = get_player_pokemon(self.battle.get_player_pokemon_id(self.player))
+        defender_pokemon = get_player_pokemon(self.battle.get_player_pokemon_id(self.opponent))
         attacker_attack_boost = self._get_attacker_attack_boost()
         defender_defense_boost = self._get_defender_defense_boost()
 
@@ -130,10 +135,11 @@ class TurnProcessor:
 
     def _complete_battle(self, winner):
         self.battle.complete(winner)
-        winner.wins += 1
-        winner.save(update_fields=["wins"])
-        self.opponent.losses += 1
-        self.opponent.save(update_fields=["losses"])
+        # Incremented in place so concurrent completions never lose a result; the database
+        # recomputes `win_rate` in the same statement
+        Player.objects.filter(id=winner.id).update(wins=F("wins") + 1)
+        Player.objects.filter(id=self.opponent.id).update(losses=F("losses") + 1)
+        PlayerPeriodStats.objects.record_result(winner, self.opponent, self.battle.completed_at)
 
     def _advance_turn(self):
         self.battle.turn_number += 1
@@ -144,6 +150,7 @@ class TurnProcessor:
                 "current_turn_player",
                 "player1_current_hp",
                 "player2_current_hp",
+                "updated_at",
             ]
         )
 
@@ -169,5 +176,6 @@ class TurnProcessor:
                 "player1_defense_boost",
                 "player2_attack_boost",
                 "player2_defense_boost",
+                "updated_at",
             ]
         )
@@ -0,0 +1,237 @@
+import atexit
+import logging
+import math
+import re
+import secrets
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from redis.exceptions import RedisError
+
+from utils.cache.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = "metrics:counters"
+METRICS_GAUGES_KEY = "metrics:gauges"
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_SERIES_PATTERN = re.compile(r"^(?P<name>\w+)(?:\{(?P<labels>.*)\})?$")
+_LABEL_PATTERN = re.compile(r'(\w+)="([^"]*)"')
+
+
+def series_name(name: str, **labels) -> str:
+    """Prometheus series name, e.g. `cache_fill_seconds_count{prefix="pokemon"}`."""
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{label}="{value}"' for label, value in sorted(labels.items())) + "}"
+
+
+def parse_series(series: str) -> tuple[str, dict[str, str]]:
+    """Inverse of `series_name`: return the metric name and labels of a series."""
+    match = _SERIES_PATTERN.match(series)
+    return match["name"], dict(_LABEL_PATTERN.findall(match["labels"] or ""))
+
+
+class MetricsRegistry:
+    """
+    Process-local counters and latency histograms, periodically added to Redis.
+
+    Recording a value only touches process memory. Every METRICS_FLUSH_INTERVAL seconds
+    (checked when recording) the increments accumulated since the last flush are added to
+    the `METRICS_KEY` hash in one pipeline, so the totals in Redis cover every worker
+    process. Without Redis (e.g. in tests) the process-local totals are all there is.
+
+    Histograms follow the Prometheus layout: cumulative `_bucket` series per upper bound
+    plus `_sum` and `_count`, the latter doubling as the event counter.
+
+    Gauges hold the latest value set by any process (`METRICS_GAUGES_KEY`). They are written
+    through on every change, so they suit states that change rarely, e.g. circuit breakers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = defaultdict(float)  # Everything this process recorded
+        self._pending = defaultdict(float)  # Increments not yet added to Redis
+        self._gauges = {}  # Latest gauge values set by this process
+        self._pending_gauges = {}  # Gauge values not yet written to Redis
+        self._flushed_at = time.monotonic()
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        self._add({series_name(name, **labels): value})
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        increments = {
+            series_name(f"{name}_bucket", le=bound, **labels): 1
+            for bound in (*LATENCY_BUCKETS, "+Inf")
+            if bound == "+Inf" or seconds <= bound
+        }
+        increments[series_name(f"{name}_sum", **labels)] = seconds
+        increments[series_name(f"{name}_count", **labels)] = 1
+        self._add(increments)
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        series = series_name(name, **labels)
+        with self._lock:
+            self._gauges[series] = value
+            self._pending_gauges[series] = value
+        self.flush()
+
+    def _add(self, increments: dict[str, float]) -> None:
+        with self._lock:
+            for series, value in increments.items():
+                self._totals[series] += value
+                self._pending[series] += value
+            due = time.monotonic() - self._flushed_at >= settings.METRICS_FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Add the pending increments of this process to the shared totals in Redis, and write its gauges."""
+        client = get_redis_client()
+        with self._lock:
+            self._flushed_at = time.monotonic()
+            if client is None or not (self._pending or self._pending_gauges):
+                return
+            pending, self._pending = self._pending, defaultdict(float)
+            pending_gauges, self._pending_gauges = self._pending_gauges, {}
+        try:
+            with client.pipeline(transaction=False) as pipe:
+                for series, value in pending.items():
+                    pipe.hincrbyfloat(METRICS_KEY, series, value)
+                if pending_gauges:
+                    pipe.hset(METRICS_GAUGES_KEY, mapping=pending_gauges)
+                pipe.execute()
+        except RedisError:
+            logger.warning("Failed to flush metrics, keeping them for the next flush", exc_info=True)
+            with self._lock:
+                for series, value in pending.items():
+                    self._pending[series] += value
+                for series, value in pending_gauges.items():
+                    self._pending_gauges.setdefault(series, value)
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Return the totals of every series.
+
+        Flushes this process first and reads the shared totals from Redis; falls back to
+        the totals of this process when the cache is not Redis-backed.
+        """
+        self.flush()
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return {series.decode(): float(value) for series, value in client.hgetall(METRICS_KEY).items()}
+            except RedisError:
+                logger.warning("Failed to read metrics from Redis, reporting this process only", exc_info=True)
+        with self._lock:
+            return dict(self._totals)
+
+    def gauges(self) -> dict[str, float]:
+        """Return the latest value of every gauge, from Redis or, without it, from this process."""
+        self.flush()
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return {series.decode(): float(value) for series, value in client.hgetall(METRICS_GAUGES_KEY).items()}
+            except RedisError:
+                logger.warning("Failed to read gauges from Redis, reporting this process only", exc_info=True)
+        with self._lock:
+            return dict(self._gauges)
+
+    def reset(self) -> None:
+        """Drop every recorded value, locally and in Redis."""
+        with self._lock:
+            self._totals.clear()
+            self._pending.clear()
+            self._gauges.clear()
+            self._pending_gauges.clear()
+        client = get_redis_client()
+        if client is not None:
+            client.delete(METRICS_KEY, METRICS_GAUGES_KEY)
+
+
+metrics = MetricsRegistry()
+atexit.register(metrics.flush)
+
+
+def histogram_quantile(buckets: dict[str, float], quantile: float) -> float:
+    """
+    Estimate a quantile from cumulative `{upper bound: count}` buckets, as Prometheus does.
+
+    Interpolates linearly inside the bucket holding the quantile; returns NaN for an
+    empty histogram and the largest finite bound when the quantile falls in +Inf.
+    """
+    bounds = sorted((math.inf if bound == "+Inf" else float(bound), count) for bound, count in buckets.items())
+    total = bounds[-1][1] if bounds else 0
+    if not total:
+        return math.nan
+    rank = quantile * total
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in bounds:
+        if count >= rank:
+            if math.isinf(bound):
+                return lower_bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / max(count - lower_count, 1e-9)
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+def _series_order(series: str):
+    """Sort key grouping the series of a histogram by labels, with buckets in ascending order."""
+    name, labels = parse_series(series)
+    bound = labels.pop("le", None)
+    return sorted(labels.items()), name, math.inf if bound == "+Inf" else float(bound or 0)
+
+
+def render_prometheus(snapshot: dict[str, float], gauges: dict[str, float] | None = None) -> str:
+    """
+    Render a snapshot of counters and histograms, plus gauges, in the Prometheus text exposition format.
+
+    A metric is a histogram when it has `_bucket` series; its `_sum` and `_count` series belong
+    to it. Any other name, `_count` suffix or not, is a counter.
+    """
+    gauges = gauges or {}
+    names = {parse_series(series)[0] for series in snapshot}
+    histograms = {name.removesuffix("_bucket") for name in names if name.endswith("_bucket")}
+    types = {}
+    for name in names:
+        for suffix in ("_bucket", "_sum", "_count"):
+            if name.endswith(suffix) and name.removesuffix(suffix) in histograms:
+                types[name.removesuffix(suffix)] = "histogram"
+                break
+        else:
+            types[name] = "counter"
+    for series in gauges:
+        types[parse_series(series)[0]] = "gauge"
+
+    lines = []
+    for metric, metric_type in sorted(types.items()):
+        lines.append(f"# TYPE {metric} {metric_type}")
+        members = {f"{metric}_bucket", f"{metric}_sum", f"{metric}_count"} if metric_type == "histogram" else {metric}
+        source = gauges if metric_type == "gauge" else snapshot
+        for series in sorted((series for series in source if parse_series(series)[0] in members), key=_series_order):
+            lines.append(f"{series} {source[series]:g}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """
+    Serve every metric in the Prometheus text format.
+
+    Scrapers send METRICS_TOKEN as `Authorization: Bearer <token>`; staff signed in to the
+    admin may read it without one. With no token configured, only staff have access.
+    """
+    has_token = bool(settings.METRICS_TOKEN) and secrets.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    )
+    if not (has_token or request.user.is_staff):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render_prometheus(metrics.snapshot(), metrics.gauges()), content_type="text/plain; version=0.0.4"
+    )
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
 
 from utils.third_party_services.PokemonAPI.types import PokemonData, PokemonTypeData, TypeEffectivenessData
 
@@ -9,6 +12,21 @@ class BasePokemonClient(ABC):
         """Fetch Pokemon data by Pokedex number."""
         pass
 
+    def get_pokemon_many(self, pokemon_ids: list[int], max_workers: int | None = None) -> list[PokemonData | None]:
+        """
+        Fetch several Pokemon concurrently, at most `max_workers` (POKEAPI_MAX_CONCURRENCY) at a time.
+
+        Returns the results of `get_pokemon` in the order of `pokemon_ids`; re-raises the
+        first error in that order once every fetch is done.
+        """
+        if not pokemon_ids:
+            return []
+        max_workers = min(max_workers or settings.POKEAPI_MAX_CONCURRENCY, len(pokemon_ids))
+        if max_workers == 1:
+            return [self.get_pokemon(pokemon_id) for pokemon_id in pokemon_ids]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pokeapi") as executor:
+            return list(executor.map(self.get_pokemon, pokemon_ids))
+
     @abstractmethod
     def get_pokemon_by_name(self, name: str) -> PokemonData | None:
         """Fetch Pokemon data by name."""
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+from utils.third_party_services.PokemonAPI.base import BasePokemonClient
+from utils.third_party_services.PokemonAPI.dataset.client import DATASET_FORMAT_VERSION, POKEMON_FIELDS
+
+
+def build_dataset(client: BasePokemonClient, pokemon_count: int, source: str) -> dict:
+    """
+    Fetch every type, each type's damage relations and Pokedex numbers 1 to `pokemon_count`.
+
+    Pokemon are fetched concurrently through `get_pokemon_many`; numbers the client does not
+    know are left out.
+    """
+    types = client.get_all_types()
+    type_relations = {}
+    for type_name in types:
+        relations = client.get_type_effectiveness(type_name)
+        if relations is not None:
+            type_relations[type_name] = relations
+
+    rows = []
+    for pokemon in client.get_pokemon_many(list(range(1, pokemon_count + 1))):
+        if pokemon is None:
+            continue
+        stats = pokemon["stats"]
+        rows.append(
+            [
+                pokemon["pokedex_number"],
+                pokemon["name"],
+                pokemon["sprite_url"],
+                pokemon["types"],
+                stats["hp"],
+                stats["attack"],
+                stats["defense"],
+                stats["speed"],
+            ]
+        )
+
+    return {
+        "format": DATASET_FORMAT_VERSION,
+        "source": source,
+        "built_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "types": types,
+        "type_relations": type_relations,
+        "pokemon_fields": POKEMON_FIELDS,
+        "pokemon": rows,
+    }
+
+
+def write_dataset(path, dataset: dict) -> None:
+    """
+    Write a dataset as JSON with one type relation and one Pokemon row per line, so rebuilds diff row by row.
+
+    The file is written next to `path` and renamed over it.
+    """
+    path = Path(path)
+    fields = []
+    for key, value in dataset.items():
+        if isinstance(value, dict):
+            entries = [f"    {json.dumps(name)}: {json.dumps(entry)}" for name, entry in value.items()]
+            value = "{\n" + ",\n".join(entries) + "\n  }" if entries else "{}"
+        elif key == "pokemon":
+            rows = [f"    {json.dumps(row, ensure_ascii=False)}" for row in value]
+            value = "[\n" + ",\n".join(rows) + "\n  ]" if rows else "[]"
+        else:
+            value = json.dumps(value, ensure_ascii=False)
+        fields.append(f"  {json.dumps(key)}: {value}")
+    content = "{\n" + ",\n".join(fields) + "\n}\n"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as dataset_file:
+            dataset_file.write(content)
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
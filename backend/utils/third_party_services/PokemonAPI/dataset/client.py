@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+from utils.third_party_services.PokemonAPI.base import BasePokemonClient
+from utils.third_party_services.PokemonAPI.types import (
+    PokemonData,
+    PokemonStatsData,
+    PokemonTypeData,
+    TypeEffectivenessData,
+)
+
+DATASET_FORMAT_VERSION = 1
+DEFAULT_DATASET_PATH = Path(__file__).resolve().parent / "pokeapi.json"
+
+# Column order of the rows in the dataset's "pokemon" list
+POKEMON_FIELDS = ["pokedex_number", "name", "sprite_url", "types", "hp", "attack", "defense", "speed"]
+
+
+def load_dataset(path=None) -> dict:
+    """
+    Read and validate a dataset file (the bundled one by default).
+
+    Raises:
+        ValueError: If the file is not a dataset of the supported format version
+    """
+    path = Path(path or DEFAULT_DATASET_PATH)
+    with open(path, encoding="utf-8") as dataset_file:
+        dataset = json.load(dataset_file)
+    if dataset.get("format") != DATASET_FORMAT_VERSION or dataset.get("pokemon_fields") != POKEMON_FIELDS:
+        raise ValueError(f"{path} is not a version {DATASET_FORMAT_VERSION} Pokemon dataset")
+    return dataset
+
+
+class LocalDatasetClient(BasePokemonClient):
+    """
+    `BasePokemonClient` answering from a dataset file instead of PokeAPI.
+
+    The file (see `build_pokemon_dataset`) holds the types, each type's damage relations and
+    one row per Pokemon, all loaded into memory on creation. Lookups never touch the network
+    and return exactly what `PokeAPIClient` returned when the file was built.
+
+    Raises:
+        ValueError: If the file is not a dataset of the supported format version
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or DEFAULT_DATASET_PATH)
+        dataset = load_dataset(self.path)
+        self.source = dataset["source"]
+        self.built_at = dataset["built_at"]
+        self.types = dataset["types"]
+        self.type_relations = dataset["type_relations"]
+        self.pokemon = {row[0]: self._parse_pokemon_row(row) for row in dataset["pokemon"]}
+        self.pokemon_by_name = {pokemon["name"]: pokemon for pokemon in self.pokemon.values()}
+
+    def get_pokemon(self, pokemon_id: int) -> PokemonData | None:
+        return self.pokemon.get(pokemon_id)
+
+    def get_pokemon_many(self, pokemon_ids: list[int], max_workers: int | None = None) -> list[PokemonData | None]:
+        # In-memory lookups: a thread pool would only add overhead
+        return [self.get_pokemon(pokemon_id) for pokemon_id in pokemon_ids]
+
+    def get_pokemon_by_name(self, name: str) -> PokemonData | None:
+        name = name.lower()
+        # PokeAPI resolves `/pokemon/<id>` on the same route
+        if name.isdigit():
+            return self.get_pokemon(int(name))
+        return self.pokemon_by_name.get(name)
+
+    def get_type(self, type_name: str) -> PokemonTypeData | None:
+        type_name = type_name.lower()
+        return PokemonTypeData(name=type_name) if type_name in self.type_relations else None
+
+    def get_all_types(self) -> list[str]:
+        return list(self.types)
+
+    def get_type_effectiveness(self, type_name: str) -> TypeEffectivenessData | None:
+        relations = self.type_relations.get(type_name.lower())
+        if relations is None:
+            return None
+        return TypeEffectivenessData(
+            double_damage_to=list(relations["double_damage_to"]),
+            half_damage_to=list(relations["half_damage_to"]),
+            no_damage_to=list(relations["no_damage_to"]),
+        )
+
+    def _parse_pokemon_row(self, row: list) -> PokemonData:
+        pokedex_number, name, sprite_url, types, hp, attack, defense, speed = row
+        return PokemonData(
+            pokedex_number=pokedex_number,
+            name=name,
+            sprite_url=sprite_url,
+            types=types,
+            stats=PokemonStatsData(hp=hp, attack=attack, defense=defense, speed=speed),
+        )
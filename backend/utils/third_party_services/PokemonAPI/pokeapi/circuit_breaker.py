@@ -0,0 +1,101 @@
+import logging
+import time
+
+import httpx
+from django.conf import settings
+from django.core.cache import cache
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+# Values of the `circuit_breaker_state` gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(httpx.RequestError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker whose state lives in the default cache, so every worker shares it.
+
+    Closed, it counts failures (transport errors, 429 and 5xx responses) in a window of
+    POKEAPI_CIRCUIT_FAILURE_WINDOW seconds; POKEAPI_CIRCUIT_FAILURE_THRESHOLD of them open it.
+    Open, fail-fast callers get `CircuitOpenError` without a request. After
+    POKEAPI_CIRCUIT_RESET_TIMEOUT seconds it is half-open: the first caller probes upstream
+    while the others keep failing fast, and the probe's outcome closes or re-opens it.
+    Callers that must not fail fast (seed jobs) still send requests and report outcomes.
+
+    The state is exported as the `circuit_breaker_state` gauge (see `STATE_VALUES`), and
+    rejected calls as the `circuit_breaker_rejections` counter.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._failures_key = f"circuit:{name}:failures"
+        self._opened_until_key = f"circuit:{name}:opened_until"
+        self._probe_key = f"circuit:{name}:probe"
+
+    @property
+    def state(self) -> str:
+        opened_until = cache.get(self._opened_until_key)
+        if opened_until is None:
+            return CLOSED
+        return OPEN if time.time() < opened_until else HALF_OPEN
+
+    def before_request(self, fail_fast: bool = True) -> bool:
+        """
+        Admit a request, returning whether it is the half-open probe.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or half-open with a probe in flight) and `fail_fast`
+        """
+        opened_until = cache.get(self._opened_until_key)
+        if opened_until is None:
+            return False
+        if time.time() >= opened_until and cache.add(self._probe_key, 1, settings.POKEAPI_CIRCUIT_RESET_TIMEOUT):
+            self._set_gauge(HALF_OPEN)
+            return True
+        if fail_fast:
+            metrics.increment("circuit_breaker_rejections", circuit=self.name)
+            raise CircuitOpenError(f"Circuit breaker '{self.name}' is open")
+        return False
+
+    def record_success(self, probe: bool = False) -> None:
+        if probe:
+            cache.delete_many([self._failures_key, self._opened_until_key, self._probe_key])
+            self._set_gauge(CLOSED)
+            logger.info("Circuit breaker '%s' closed", self.name)
+
+    def record_failure(self, probe: bool = False) -> None:
+        if probe:
+            self._open()
+            return
+        cache.add(self._failures_key, 0, settings.POKEAPI_CIRCUIT_FAILURE_WINDOW)
+        try:
+            failures = cache.incr(self._failures_key)
+        except ValueError:  # Expired between add and incr
+            failures = 1
+        if failures >= settings.POKEAPI_CIRCUIT_FAILURE_THRESHOLD and cache.get(self._opened_until_key) is None:
+            self._open()
+
+    def reset(self) -> None:
+        cache.delete_many([self._failures_key, self._opened_until_key, self._probe_key])
+        self._set_gauge(CLOSED)
+
+    def _open(self) -> None:
+        # Kept until a probe succeeds: an expired key would close the breaker without one
+        cache.set(self._opened_until_key, time.time() + settings.POKEAPI_CIRCUIT_RESET_TIMEOUT, None)
+        cache.delete_many([self._failures_key, self._probe_key])
+        self._set_gauge(OPEN)
+        logger.warning("Circuit breaker '%s' opened for %ss", self.name, settings.POKEAPI_CIRCUIT_RESET_TIMEOUT)
+
+    def _set_gauge(self, state: str) -> None:
+        metrics.set_gauge("circuit_breaker_state", STATE_VALUES[state], circuit=self.name)
+
+
+pokeapi_circuit_breaker = CircuitBreaker("pokeapi")
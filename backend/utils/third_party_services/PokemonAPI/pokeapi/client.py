@@ -1,8 +1,19 @@
+import atexit
+import importlib.util
+import json
 import logging
+import os
+import random
+import threading
+import time
 
 import httpx
+from django.conf import settings
 
+from utils.metrics import metrics
 from utils.third_party_services.PokemonAPI.base import BasePokemonClient
+from utils.third_party_services.PokemonAPI.pokeapi.circuit_breaker import pokeapi_circuit_breaker
+from utils.third_party_services.PokemonAPI.pokeapi.response_cache import ResponseCache, get_response_cache
 from utils.third_party_services.PokemonAPI.types import (
     PokemonData,
     PokemonStatsData,
@@ -12,25 +23,192 @@ from utils.third_party_services.PokemonAPI.types import (
 
 logger = logging.getLogger(__name__)
 
-POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
+# Responses worth retrying, and counted as upstream failures by the circuit breaker
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# One pooled client per process, created on first use
+_http_client = None
+_http_client_pid = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return this process' shared, pooled HTTP client for PokeAPI.
+
+    Connections are kept alive and reused across requests and threads, within the
+    POKEAPI_MAX_CONNECTIONS / POKEAPI_MAX_KEEPALIVE_CONNECTIONS limits. HTTP/2 is
+    negotiated when POKEAPI_HTTP2 is set and the `h2` package is installed. A forked
+    child builds its own client rather than sharing the parent's sockets.
+    """
+    global _http_client, _http_client_pid
+    if _http_client is not None and _http_client_pid == os.getpid():
+        return _http_client
+
+    with _http_client_lock:
+        if _http_client is None or _http_client_pid != os.getpid():
+            http2 = settings.POKEAPI_HTTP2
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("POKEAPI_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+                http2 = False
+            _http_client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.POKEAPI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.POKEAPI_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.POKEAPI_KEEPALIVE_EXPIRY,
+                ),
+            )
+            _http_client_pid = os.getpid()
+    return _http_client
+
+
+@atexit.register
+def close_http_client() -> None:
+    """Close the shared client and its pooled connections (also run at interpreter exit)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None and _http_client_pid == os.getpid():
+            _http_client.close()
+        _http_client = None
 
 
 class PokeAPIClient(BasePokemonClient):
-    def __init__(self, timeout: float = 30.0):
-        self.base_url = POKEAPI_BASE_URL
-        self.timeout = timeout
+    """
+    PokeAPI client for request paths by default: one attempt within POKEAPI_TIMEOUT seconds,
+    failing fast with `CircuitOpenError` while the shared circuit breaker is open.
+
+    `for_jobs()` builds the client for seed jobs, which retry transient failures with
+    jittered backoff within a per-call `deadline` and send requests even while the breaker
+    is open. Both report their outcomes to the breaker.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        base_url: str | None = None,
+        response_cache: ResponseCache | None = None,
+        retries: int = 0,
+        deadline: float | None = None,
+        fail_fast: bool = True,
+    ):
+        self.base_url = base_url or settings.POKEAPI_BASE_URL
+        self.timeout = timeout or settings.POKEAPI_TIMEOUT
+        self.response_cache = response_cache or get_response_cache()
+        self.retries = retries
+        self.deadline = deadline
+        self.fail_fast = fail_fast
+
+    @classmethod
+    def for_jobs(cls, **kwargs) -> "PokeAPIClient":
+        """Client for seed jobs and other background work, which may wait out a slow or flaky upstream."""
+        options = {
+            "timeout": settings.POKEAPI_JOB_TIMEOUT,
+            "retries": settings.POKEAPI_JOB_RETRIES,
+            "deadline": settings.POKEAPI_JOB_DEADLINE,
+            "fail_fast": False,
+        }
+        return cls(**{**options, **kwargs})
 
     def _get_client(self) -> httpx.Client:
-        return httpx.Client(timeout=self.timeout)
+        return get_http_client()
+
+    def _send(self, url: str, headers: dict) -> httpx.Response:
+        """
+        GET `url` through the circuit breaker, retrying transport errors and RETRYABLE_STATUS_CODES.
+
+        Attempts are spaced by full-jitter exponential backoff (or the response's Retry-After)
+        and each is bounded by `timeout`; no attempt starts or runs past the `deadline`. Returns
+        the last response once retries run out, so callers see its status.
+
+        Raises:
+            CircuitOpenError: If the breaker is open and this client fails fast
+            httpx.TransportError: If the last attempt failed
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            probe = pokeapi_circuit_breaker.before_request(fail_fast=self.fail_fast)
+            timeout = self.timeout
+            if self.deadline is not None:
+                timeout = min(timeout, self.deadline - (time.monotonic() - started))
+            error = response = None
+            try:
+                if timeout <= 0:
+                    raise httpx.TimeoutException(f"Deadline of {self.deadline}s exceeded for {url}")
+                response = self._get_client().get(url, headers=headers, timeout=timeout)
+            except httpx.TransportError as e:
+                error = e
+            if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+                pokeapi_circuit_breaker.record_success(probe)
+                return response
+            pokeapi_circuit_breaker.record_failure(probe)
+
+            delay = self._backoff(attempt, response)
+            out_of_time = self.deadline is not None and time.monotonic() - started + delay >= self.deadline
+            if attempt >= self.retries or out_of_time:
+                if error is not None:
+                    raise error
+                return response
+            logger.warning(f"Retrying {url} in {delay:.2f}s after {error or response.status_code}")
+            time.sleep(delay)
+            attempt += 1
+
+    def _backoff(self, attempt: int, response: httpx.Response | None) -> float:
+        ceiling = min(settings.POKEAPI_RETRY_BACKOFF_MAX, settings.POKEAPI_RETRY_BACKOFF * 2**attempt)
+        delay = random.uniform(0, ceiling)
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), settings.POKEAPI_RETRY_BACKOFF_MAX))
+        return delay
+
+    def _get_json(self, url: str) -> dict:
+        """
+        GET `url` and return its JSON body, through the response cache when one is configured.
+
+        Fresh cached bodies are returned without a request. Expired ones are revalidated with
+        their ETag / Last-Modified and kept for another POKEAPI_CACHE_TTL on 304 Not Modified.
+
+        Raises:
+            httpx.HTTPStatusError: If PokeAPI answered with an error status
+            httpx.RequestError: If the request failed
+        """
+        cached = self.response_cache.get(url) if self.response_cache is not None else None
+        if cached is not None and cached.is_fresh:
+            metrics.increment("pokeapi_cache_lookups", result="hit")
+            return json.loads(cached.body)
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = self._send(url, headers)
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            self.response_cache.refresh(url, settings.POKEAPI_CACHE_TTL)
+            metrics.increment("pokeapi_cache_lookups", result="revalidated")
+            return json.loads(cached.body)
+
+        response.raise_for_status()
+        data = response.json()
+        if self.response_cache is not None:
+            self.response_cache.set(
+                url,
+                response.content,
+                settings.POKEAPI_CACHE_TTL,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            metrics.increment("pokeapi_cache_lookups", result="miss")
+        return data
 
     def get_pokemon(self, pokemon_id: int) -> PokemonData | None:
         url = f"{self.base_url}/pokemon/{pokemon_id}"
         try:
-            with self._get_client() as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_pokemon_response(data)
+            data = self._get_json(url)
+            return self._parse_pokemon_response(data)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 logger.warning(f"Pokemon with ID {pokemon_id} not found")
@@ -44,11 +222,8 @@ class PokeAPIClient(BasePokemonClient):
     def get_pokemon_by_name(self, name: str) -> PokemonData | None:
         url = f"{self.base_url}/pokemon/{name.lower()}"
         try:
-            with self._get_client() as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                return self._parse_pokemon_response(data)
+            data = self._get_json(url)
+            return self._parse_pokemon_response(data)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 logger.warning(f"Pokemon '{name}' not found")
@@ -62,11 +237,8 @@ class PokeAPIClient(BasePokemonClient):
     def get_type(self, type_name: str) -> PokemonTypeData | None:
         url = f"{self.base_url}/type/{type_name.lower()}"
         try:
-            with self._get_client() as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                return PokemonTypeData(name=data["name"])
+            data = self._get_json(url)
+            return PokemonTypeData(name=data["name"])
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 logger.warning(f"Type '{type_name}' not found")
@@ -80,13 +252,10 @@ class PokeAPIClient(BasePokemonClient):
     def get_all_types(self) -> list[str]:
         url = f"{self.base_url}/type"
         try:
-            with self._get_client() as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                # Filter out special types that aren't used for Pokemon (shadow, unknown)
-                excluded_types = {"shadow", "unknown"}
-                return [t["name"] for t in data["results"] if t["name"] not in excluded_types]
+            data = self._get_json(url)
+            # Filter out special types that aren't used for Pokemon (shadow, unknown)
+            excluded_types = {"shadow", "unknown"}
+            return [t["name"] for t in data["results"] if t["name"] not in excluded_types]
         except httpx.RequestError as e:
             logger.error(f"Request error fetching types: {e}")
             raise
@@ -94,16 +263,13 @@ class PokeAPIClient(BasePokemonClient):
     def get_type_effectiveness(self, type_name: str) -> TypeEffectivenessData | None:
         url = f"{self.base_url}/type/{type_name.lower()}"
         try:
-            with self._get_client() as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                damage_relations = data["damage_relations"]
-                return TypeEffectivenessData(
-                    double_damage_to=[t["name"] for t in damage_relations["double_damage_to"]],
-                    half_damage_to=[t["name"] for t in damage_relations["half_damage_to"]],
-                    no_damage_to=[t["name"] for t in damage_relations["no_damage_to"]],
-                )
+            data = self._get_json(url)
+            damage_relations = data["damage_relations"]
+            return TypeEffectivenessData(
+                double_damage_to=[t["name"] for t in damage_relations["double_damage_to"]],
+                half_damage_to=[t["name"] for t in damage_relations["half_damage_to"]],
+                no_damage_to=[t["name"] for t in damage_relations["no_damage_to"]],
+            )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 logger.warning(f"Type '{type_name}' not found")
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TYPE_NAMES = ("normal", "fire", "water", "grass", "electric")
+
+
+def pokemon_payload(pokedex_number: int) -> dict:
+    """A PokeAPI `/pokemon/<id>` response, trimmed to the fields `PokeAPIClient` reads."""
+    return {
+        "id": pokedex_number,
+        "name": f"pokemon-{pokedex_number}",
+        "sprites": {"front_default": f"https://example.com/sprites/{pokedex_number}.png"},
+        "types": [{"slot": 1, "type": {"name": TYPE_NAMES[pokedex_number % len(TYPE_NAMES)]}}],
+        "stats": [
+            {"base_stat": 40 + pokedex_number % 60, "stat": {"name": name}}
+            for name in ("hp", "attack", "defense", "speed")
+        ],
+    }
+
+
+def type_payload(type_name: str) -> dict:
+    """A PokeAPI `/type/<name>` response, trimmed to the fields `PokeAPIClient` reads."""
+    return {
+        "name": type_name,
+        "damage_relations": {
+            "double_damage_to": [{"name": "water"}] if type_name == "electric" else [],
+            "half_damage_to": [{"name": "grass"}] if type_name == "water" else [],
+            "no_damage_to": [],
+        },
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # Room for a batch of concurrent connections; the default of 5 drops SYNs
+
+
+class LocalPokeAPIServer:
+    """
+    Stand-in for PokeAPI on localhost, for benchmarks and tests.
+
+    Serves `/pokemon/<id or name>`, `/type` and `/type/<name>` over HTTP/1.1 with keep-alive,
+    with an ETag per response and 304 Not Modified for a matching `If-None-Match`.
+    `connect_latency` is slept once per new connection, standing in for the DNS lookup,
+    TCP and TLS handshakes of the real API; `latency` is slept per request, standing in
+    for its round trip. Setting `fail_next` answers that many following requests with 503,
+    standing in for an upstream outage. Counts accepted connections, served requests and
+    304 responses.
+
+    Usage:
+        with LocalPokeAPIServer(connect_latency=0.05) as server:
+            PokeAPIClient(base_url=server.base_url).get_pokemon(25)
+    """
+
+    def __init__(self, latency: float = 0.0, connect_latency: float = 0.0):
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.connections = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.fail_next = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-pokeapi", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self, attribute: str) -> None:
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+
+    def _take_failure(self) -> bool:
+        with self._lock:
+            if self.fail_next <= 0:
+                return False
+            self.fail_next -= 1
+            return True
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                server._count("connections")
+                time.sleep(server.connect_latency)
+
+            def do_GET(self):
+                server._count("requests")
+                time.sleep(server.latency)
+                if server._take_failure():
+                    self._send(503, {"detail": "Service unavailable."})
+                    return
+                parts = self.path.strip("/").split("/")[2:]  # Drop the `api/v2` prefix
+                if parts == ["type"]:
+                    self._send(200, {"results": [{"name": name} for name in (*TYPE_NAMES, "unknown")]})
+                elif len(parts) == 2 and parts[0] == "type" and parts[1] in TYPE_NAMES:
+                    self._send(200, type_payload(parts[1]))
+                elif len(parts) == 2 and parts[0] == "pokemon" and self._pokedex_number(parts[1]):
+                    self._send(200, pokemon_payload(self._pokedex_number(parts[1])))
+                else:
+                    self._send(404, {"detail": "Not found."})
+
+            def _pokedex_number(self, id_or_name: str) -> int | None:
+                number = id_or_name.removeprefix("pokemon-")
+                return int(number) if number.isdigit() and int(number) > 0 else None
+
+            def _send(self, status_code: int, payload: dict) -> None:
+                body = json.dumps(payload).encode()
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                if status_code == 200 and self.headers.get("If-None-Match") == etag:
+                    server._count("not_modified")
+                    status_code, body = 304, b""
+                self.send_response(status_code)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
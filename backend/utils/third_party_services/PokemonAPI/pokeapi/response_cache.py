@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bodies (
+    digest TEXT PRIMARY KEY,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL REFERENCES bodies (digest),
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_digest ON responses (digest);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class ResponseCache:
+    """
+    Persistent cache of PokeAPI response bodies in a SQLite file, shared by every process using it.
+
+    Bodies are stored zlib-compressed once per SHA-256 digest, so URLs serving the same
+    document (e.g. a Pokemon by number and by name) share one copy. Each URL keeps its
+    ETag and Last-Modified validators and an expiry; `PokeAPIClient` serves fresh entries
+    without a request and revalidates expired ones. The database runs in WAL mode, so
+    readers never wait on a writer. Every thread opens its own connection.
+
+    Storage errors are logged and reported as misses: a broken cache only costs requests.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def get(self, url: str) -> CachedResponse | None:
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT bodies.body, etag, last_modified, expires_at"
+                    " FROM responses JOIN bodies ON bodies.digest = responses.digest WHERE url = ?",
+                    (url,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            logger.warning("Failed to read PokeAPI response cache: %s", self.path, exc_info=True)
+            return None
+        if row is None:
+            return None
+        body, etag, last_modified, expires_at = row
+        return CachedResponse(zlib.decompress(body), etag, last_modified, expires_at)
+
+    def set(self, url: str, body: bytes, ttl: int, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Store the body of `url`, dropping the body it replaces unless another URL shares it."""
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                previous = connection.execute("SELECT digest FROM responses WHERE url = ?", (url,)).fetchone()
+                connection.execute(
+                    "INSERT OR IGNORE INTO bodies (digest, body) VALUES (?, ?)", (digest, zlib.compress(body))
+                )
+                connection.execute(
+                    "INSERT INTO responses (url, digest, etag, last_modified, fetched_at, expires_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (url) DO UPDATE SET digest = excluded.digest,"
+                    " etag = excluded.etag, last_modified = excluded.last_modified,"
+                    " fetched_at = excluded.fetched_at, expires_at = excluded.expires_at",
+                    (url, digest, etag, last_modified, now, now + ttl),
+                )
+                if previous is not None and previous[0] != digest:
+                    connection.execute(
+                        "DELETE FROM bodies WHERE digest = ? AND NOT EXISTS"
+                        " (SELECT 1 FROM responses WHERE responses.digest = bodies.digest)",
+                        previous,
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            logger.warning("Failed to write PokeAPI response cache: %s", self.path, exc_info=True)
+
+    def refresh(self, url: str, ttl: int) -> None:
+        """Extend the expiry of `url` after PokeAPI confirmed it is unchanged (304 Not Modified)."""
+        now = time.time()
+        try:
+            self._connection().execute(
+                "UPDATE responses SET fetched_at = ?, expires_at = ? WHERE url = ?", (now, now + ttl, url)
+            )
+        except sqlite3.Error:
+            logger.warning("Failed to write PokeAPI response cache: %s", self.path, exc_info=True)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of cached URLs (and how many are fresh), distinct bodies and their stored size."""
+        connection = self._connection()
+        responses, fresh = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(expires_at > ?), 0) FROM responses", (time.time(),)
+        ).fetchone()
+        bodies, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM bodies").fetchone()
+        return {"responses": responses, "fresh": fresh, "bodies": bodies, "size": size}
+
+    def clear(self) -> None:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute("DELETE FROM responses")
+        connection.execute("DELETE FROM bodies")
+        connection.execute("COMMIT")
+        connection.execute("VACUUM")
+
+
+_response_caches = {}
+_response_caches_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the response cache at POKEAPI_CACHE_PATH, or None when it is not configured."""
+    path = settings.POKEAPI_CACHE_PATH
+    if not path:
+        return None
+    with _response_caches_lock:
+        if path not in _response_caches:
+            _response_caches[path] = ResponseCache(path)
+        return _response_caches[path]